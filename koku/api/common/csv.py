@@ -15,7 +15,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """API views for CSV output."""
+from itertools import chain
+
+from django.http import StreamingHttpResponse
 from rest_framework_csv.renderers import CSVRenderer
+from rest_framework_csv.renderers import CSVStreamingRenderer
 
 
 class PaginatedCSVRenderer(CSVRenderer):
@@ -32,3 +36,26 @@ class PaginatedCSVRenderer(CSVRenderer):
         if not isinstance(data, list):
             data = data.get(self.results_field, [])
         return super().render(data, *args, **kwargs)
+
+
+def get_streaming_csv_response(rows):
+    """Return a response that writes CSV rows as they are read.
+
+    The header is taken from the first row, so every row is expected
+    to have the same keys.
+
+    Args:
+        rows (Iterable(Dict)): The report rows
+
+    Returns:
+        (StreamingHttpResponse): The CSV response
+
+    """
+    rows = iter(rows)
+    first_row = next(rows, None)
+    content = []
+    if first_row is not None:
+        renderer = CSVStreamingRenderer()
+        renderer.header = sorted(renderer.flatten_item(first_row).keys())
+        content = renderer.render(row for row in chain([first_row], rows))
+    return StreamingHttpResponse(content, content_type="text/csv")
@@ -196,6 +196,26 @@ class ReportRankedPagination(ReportPagination):
         return queryset
 
 
+class ReportDatabasePagination(ReportPagination):
+    """A paginator for report data that was already paginated in the database."""
+
+    def __init__(self, count):
+        """Set the count of all pages."""
+        self.count = count
+
+    def get_count(self, queryset):
+        """Determine a report data's count."""
+        return self.count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Override queryset pagination."""
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+
+        return queryset
+
+
 class OrgUnitPagination(ReportPagination):
     """A paginator of org units."""
 
@@ -0,0 +1,38 @@
+#
+# Copyright 2020 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Test the API CSV module."""
+from django.test import TestCase
+
+from .csv import get_streaming_csv_response
+
+
+class StreamingCSVResponseTest(TestCase):
+    """Tests for streamed CSV responses."""
+
+    def test_get_streaming_csv_response(self):
+        """Test that rows are written with a header from the first row."""
+        rows = ({"date": f"2020-10-0{i}", "cost": i} for i in range(1, 4))
+        response = get_streaming_csv_response(rows)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        content = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        self.assertEqual(content, ["cost,date", "1,2020-10-01", "2,2020-10-02", "3,2020-10-03"])
+
+    def test_get_streaming_csv_response_no_rows(self):
+        """Test that an empty report streams an empty body."""
+        response = get_streaming_csv_response(iter([]))
+        self.assertEqual(b"".join(response.streaming_content), b"")
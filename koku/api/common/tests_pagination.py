@@ -23,6 +23,7 @@ from django.test import TestCase
 from rest_framework.response import Response
 
 from .pagination import PATH_INFO
+from .pagination import ReportDatabasePagination
 from .pagination import ReportPagination
 from .pagination import ReportRankedPagination
 from .pagination import StandardResultsSetPagination
@@ -151,6 +152,31 @@ class ReportPaginationTest(TestCase):
         self.assertIn("last", links)
 
 
+class ReportDatabasePaginationTest(TestCase):
+    """Tests for report API pagination applied in the database."""
+
+    def setUp(self):
+        """Set up each test case."""
+        self.paginator = ReportDatabasePagination(random.randint(1, 10))
+        self.paginator.request = Mock
+        self.paginator.request.META = {}
+        self.paginator.request.query_params = {"limit": 2, "offset": 1}
+
+        self.data = {"total": {}, "data": [{"usage": 1, "cost": 2}, {"usage": 2, "cost": 4}]}
+
+    def test_get_count(self):
+        """Test that the count of all pages is returned."""
+        expected = self.paginator.count
+        self.assertEqual(self.paginator.get_count(self.data), expected)
+
+    def test_paginate_queryset(self):
+        """Test that the already paginated queryset is unaltered."""
+        data = self.paginator.paginate_queryset(self.data, self.paginator.request)
+        self.assertEqual(data.get("data", []), self.data.get("data", []))
+        self.assertEqual(self.paginator.limit, 2)
+        self.assertEqual(self.paginator.offset, 1)
+
+
 class ReportRankedPaginationTest(TestCase):
     """Tests for ranked report API pagination."""
 
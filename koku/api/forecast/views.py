@@ -72,7 +72,7 @@ class ForecastView(APIView):
             return Response(data=exc.detail, status=status.HTTP_400_BAD_REQUEST)
 
         handler = self.query_handler(params)
-        output = handler.predict()
+        output = handler.cached_predict()
         LOG.debug(f"DATA: {output}")
 
         paginator = ForecastListPaginator(output, request)
@@ -33,10 +33,12 @@ from api.models import Tenant
 from api.models import User
 from api.provider.models import Provider
 from api.report.queries import ReportQueryHandler
+from koku.cache import get_tag_keys
 from reporting.models import OCPAllCostLineItemDailySummary
 from reporting.provider.aws.models import AWSOrganizationalUnit
 
 LOG = logging.getLogger(__name__)
+TAG_PREFIXES = ("tag:", "and:tag:", "or:tag:")
 
 
 class QueryParameters:
@@ -84,10 +86,10 @@ class QueryParameters:
         self.query_handler = caller.query_handler
         self.tag_handler = caller.tag_handler
 
-        self.tag_keys = []
+        self.tag_keys = frozenset()
         if self.report_type != "tags":
             for tag_model in self.tag_handler:
-                self.tag_keys.extend(self._get_tag_keys(tag_model))
+                self.tag_keys = self.tag_keys.union(self._get_tag_keys(tag_model))
 
         self._validate()  # sets self.parameters
 
@@ -117,26 +119,29 @@ class QueryParameters:
         return pformat(self.__repr__())
 
     def _get_tag_keys(self, model):
-        """Get a list of tag keys to validate filters."""
-        with tenant_context(self.tenant):
-            tags = model.objects.values("key")
-            tag_list = [":".join(["tag", tag.get("key")]) for tag in tags]
-            tag_list.extend([":".join(["and:tag", tag.get("key")]) for tag in tags])
-            tag_list.extend([":".join(["or:tag", tag.get("key")]) for tag in tags])
-        return tag_list
+        """Get the set of unprefixed tag keys to validate filters."""
+        return get_tag_keys(self.tenant.schema_name, model)
+
+    def _is_tag_key(self, param):
+        """Determine if a query parameter is a prefixed tag key of the tenant."""
+        if not isinstance(param, str):
+            return False
+        for prefix in TAG_PREFIXES:
+            if param.startswith(prefix):
+                return param.partition(prefix)[2] in self.tag_keys
+        return False
 
     def _process_tag_query_params(self, query_params):
         """Reduce the set of tag keys based on those being queried."""
-        tag_key_set = set(self.tag_keys)
         param_tag_keys = set()
         for key, value in query_params.items():
             if isinstance(value, (dict, list)):
                 for inner_key in value:
-                    if inner_key in tag_key_set:
+                    if self._is_tag_key(inner_key):
                         param_tag_keys.add(inner_key)
-            elif value in tag_key_set:
+            elif self._is_tag_key(value):
                 param_tag_keys.add(value)
-            if key in tag_key_set:
+            if self._is_tag_key(key):
                 param_tag_keys.add(key)
         return param_tag_keys
 
@@ -96,6 +96,8 @@ class AWSReportQueryHandler(ReportQueryHandler):
         self.group_by_options = self._mapper.provider_map.get("group_by_options")
         self._limit = parameters.get_filter("limit")
         self.is_csv_output = parameters.accept_type and "text/csv" in parameters.accept_type
+        # paths of the sub org units rolled up by execute_sub_org_query
+        self._sub_org_paths = None
 
         # super() needs to be called after _mapper and _limit is set
         super().__init__(parameters)
@@ -127,8 +129,31 @@ class AWSReportQueryHandler(ReportQueryHandler):
         for q_param, db_field in fields.items():
             if q_param in prefix_removed_parameters_list:
                 annotations[q_param] = F(db_field)
+        if self._sub_org_paths:
+            annotations["sub_org_path"] = F("organizational_unit__ancestors__ancestor_path")
         return annotations
 
+    def _get_filter(self, delta=False):
+        """Create the query filter, limited to the rows of the sub org units being rolled up.
+
+        Args:
+            delta (Boolean): Construct timeframe for delta
+        Returns:
+            (Q): query filter
+
+        """
+        filters = super()._get_filter(delta)
+        if self._sub_org_paths:
+            filters &= Q(organizational_unit__ancestors__ancestor_path__in=self._sub_org_paths)
+        return filters
+
+    def _get_group_by(self):
+        """Create list for group_by parameters, grouping by sub org unit first when rolling them up."""
+        group_by = super()._get_group_by()
+        if self._sub_org_paths:
+            group_by = ["sub_org_path"] + group_by
+        return group_by
+
     def format_sub_org_results(self, query_data_results, query_data, sub_orgs_dict):  # noqa: C901
         """
         Add the sub_orgs into the overall results if grouping by org unit.
@@ -202,12 +227,13 @@ class AWSReportQueryHandler(ReportQueryHandler):
         """Execute each query needed to return the results.
 
         If grouping by org_unit_id, a query will be executed to
-        obtain the account results, and each sub_org results.
+        obtain the account results, and another for the results of every sub_org.
         Else it will return the original query.
         """
         original_filters = copy.deepcopy(self.parameters.parameters.get("filter"))
         sub_orgs_dict = {}
         query_data_results = {}
+        deltas = []
         org_unit_applied = False
         csv_results = []
         group_by_param = self.parameters.parameters.get("group_by")
@@ -272,42 +298,63 @@ class AWSReportQueryHandler(ReportQueryHandler):
         # (without org_units this is the only query - with org_units this is the query to find the accounts)
         query_data, query_sum = self.execute_individual_query(org_unit_applied)
 
-        # Next we want to loop through each sub_org and execute the query for it
+        # Next we want to query the sub_orgs, all rolled up in a single query
         if org_unit_applied:
-            for sub_org_name, value in sub_orgs_dict.items():
-                sub_org_id, sub_org_path = value
-                if self.parameters.get_filter("org_unit_id"):
-                    self.parameters.parameters["filter"].pop("org_unit_id")
-                if self.parameters.get_filter("org_unit_single_level"):
-                    self.parameters.parameters["filter"].pop("org_unit_single_level")
-                if self.parameters.parameters["group_by"].get("account"):
-                    self.parameters.parameters["group_by"].pop("account")
-                # only add the org_unit to the filter if the user has access
-                # through RBAC so that we avoid returning a 403
-                org_access = None
-                if self.access:
-                    org_access = self.access.get("aws.organizational_unit", {}).get("read", [])
+            if self._delta:
+                deltas.append(self.query_delta)
+            if self.parameters.get_filter("org_unit_id"):
+                self.parameters.parameters["filter"].pop("org_unit_id")
+            if self.parameters.get_filter("org_unit_single_level"):
+                self.parameters.parameters["filter"].pop("org_unit_single_level")
+            if self.parameters.parameters["group_by"].get("account"):
+                self.parameters.parameters["group_by"].pop("account")
+            # only filter on the org_unit if the user has access through RBAC,
+            # the other sub_orgs are given the results of the unfiltered query
+            org_access = None
+            if self.access:
+                org_access = self.access.get("aws.organizational_unit", {}).get("read", [])
+            sub_org_names = {}
+            unfiltered_sub_orgs = []
+            for sub_org_name, (sub_org_id, sub_org_path) in sub_orgs_dict.items():
                 if org_access is None or (sub_org_id in org_access or "*" in org_access):
                     # We need need to use the sub org path here because if we use the org unit id
                     # it will grab partial data from other orgs if the org unit is moved during
                     # the report period.
-                    self.parameters.set_filter(org_unit_id=[sub_org_path])
+                    sub_org_names[sub_org_path] = sub_org_name
+                else:
+                    unfiltered_sub_orgs.append(sub_org_name)
+
+            sub_query_results = {}
+            if sub_org_names:
+                sub_org_data, sub_query_sum = self.execute_sub_org_query(list(sub_org_names))
+                query_sum = self.total_sum(sub_query_sum, query_sum)
+                if self._delta:
+                    deltas.append(self.query_delta)
+                for sub_org_path, sub_query_data in sub_org_data.items():
+                    sub_query_results[sub_org_names[sub_org_path]] = sub_query_data
+            if unfiltered_sub_orgs:
                 self.query_filter = self._get_filter()
                 sub_query_data, sub_query_sum = self.execute_individual_query(org_unit_applied)
-                query_sum = self.total_sum(sub_query_sum, query_sum)
-
-                # If we're processing for CSV output, then just append the results to a
-                # CSV output list and ensure that id, alias, and type are filled out correctly
-                if not self.is_csv_output:
-                    query_data_results[sub_org_name] = sub_query_data
-                else:
-                    # Add the initial account query results, if not set
-                    if len(csv_results) == 0:
-                        csv_results = [dict(type="account", **d) for d in query_data]
-                    # And extend by the org unit query results
-                    # keys "account_alias" and "account_id" are used here to match the query's
-                    # structure so that the CSV MAPPER can rename the proper keys as one of the
-                    # final steps in CSV processing
+                for sub_org_name in unfiltered_sub_orgs:
+                    query_sum = self.total_sum(sub_query_sum, query_sum)
+                    if self._delta:
+                        deltas.append(self.query_delta)
+                    sub_query_results[sub_org_name] = copy.deepcopy(sub_query_data)
+            if len(deltas) > 1:
+                self.query_delta = self._sum_deltas(deltas, query_sum)
+
+            # If we're processing for CSV output, then just append the results to a
+            # CSV output list and ensure that id, alias, and type are filled out correctly
+            if not self.is_csv_output:
+                query_data_results = sub_query_results
+            else:
+                csv_results = [dict(type="account", **d) for d in query_data]
+                # And extend by the org unit query results
+                # keys "account_alias" and "account_id" are used here to match the query's
+                # structure so that the CSV MAPPER can rename the proper keys as one of the
+                # final steps in CSV processing
+                for sub_org_name, sub_query_data in sub_query_results.items():
+                    sub_org_id = sub_orgs_dict[sub_org_name][0]
                     csv_results.extend(
                         dict(type="organizational_unit", account_alias=sub_org_name, account=sub_org_id, **d)
                         for d in sub_query_data
@@ -342,6 +389,55 @@ class AWSReportQueryHandler(ReportQueryHandler):
         self.parameters.parameters["filter"] = original_filters
         return self._format_query_response()
 
+    def execute_sub_org_query(self, sub_org_paths):
+        """Execute a single query for the results of every sub org unit.
+
+        Each summary row is joined to the closure of its org unit tree node, which
+        attributes it to the sub org unit found on its path.
+
+        Args:
+            sub_org_paths (list): The paths of the sub org units
+
+        Returns:
+            (tuple): The query data of each sub org unit keyed by its path, and the query sum
+
+        """
+        self._sub_org_paths = sub_org_paths
+        try:
+            self.query_filter = self._get_filter()
+            query_data, query_sum = self.execute_individual_query(org_unit_applied=True)
+        finally:
+            self._sub_org_paths = None
+
+        sub_org_data = {sub_org_path: [] for sub_org_path in sub_org_paths}
+        if self.is_csv_output:
+            for row in query_data:
+                sub_org_data[row.pop("sub_org_path")].append(row)
+        else:
+            for day in query_data:
+                for sub_org in day.get("sub_org_paths", []):
+                    for value in sub_org.get("values", []):
+                        value.pop("sub_org_path", None)
+                    sub_org_path = sub_org.pop("sub_org_path")
+                    sub_org_data[sub_org_path].append({"date": day["date"], **sub_org})
+        return sub_org_data, query_sum
+
+    def _sum_deltas(self, deltas, query_sum):
+        """Combine the total deltas of the queries whose sums were added into query_sum.
+
+        Args:
+            deltas (list): The total delta of each query
+            query_sum (dict): The sum of the queries
+
+        Returns:
+            (dict): The total delta with keys "value" and "percent"
+
+        """
+        delta_value = sum(delta["value"] for delta in deltas)
+        current_total_sum = self._get_delta_total(query_sum)
+        delta_percent = self._percent_delta(current_total_sum, current_total_sum - delta_value)
+        return {"value": delta_value, "percent": delta_percent}
+
     def _format_query_response(self):
         """Format the query response with data.
 
@@ -591,7 +687,7 @@ select coalesce(raa.account_alias, t.usage_account_id)::text as "account",
             LOG.debug(f"Using query table: {query_table}")
             tag_results = None
             query = query_table.objects.filter(self.query_filter)
-            query_data = query.annotate(**self.annotations)
+            query_data = self._apply_page_filter(query).annotate(**self.annotations)
             query_group_by = ["date"] + self._get_group_by()
             query_order_by = ["-date"]
             query_order_by.extend([self.order])
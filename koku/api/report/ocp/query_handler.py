@@ -18,11 +18,11 @@
 import copy
 import datetime
 import logging
-from collections import defaultdict
 from decimal import Decimal
 from decimal import DivisionByZero
 from decimal import InvalidOperation
 
+from django.db import connection
 from django.db.models import F
 from django.db.models import Window
 from django.db.models.functions import RowNumber
@@ -35,11 +35,18 @@ from api.report.queries import ReportQueryHandler
 
 LOG = logging.getLogger(__name__)
 
+# GROUPING(usage_start, cluster_id) of each grouping set in the totals and capacity rollup
+CLUSTER_DAY_GROUPING = 0
+DAY_GROUPING = 1
+CLUSTER_GROUPING = 2
+TOTAL_GROUPING = 3
+
 
 class OCPReportQueryHandler(ReportQueryHandler):
     """Handles report queries and responses for OCP."""
 
     provider = Provider.PROVIDER_OCP
+    supports_csv_streaming = True
 
     def __init__(self, parameters):
         """Establish OCP report query handler.
@@ -119,7 +126,7 @@ class OCPReportQueryHandler(ReportQueryHandler):
 
         with tenant_context(self.tenant):
             query = self.query_table.objects.filter(self.query_filter)
-            query_data = query.annotate(**self.annotations)
+            query_data = self._apply_page_filter(query).annotate(**self.annotations)
             group_by_value = self._get_group_by()
 
             query_group_by = ["date"] + group_by_value
@@ -134,15 +141,14 @@ class OCPReportQueryHandler(ReportQueryHandler):
                 query_order_by.insert(1, "rank")
                 query_data = self._ranked_list(query_data)
 
-            # Populate the 'total' section of the API response
-            if query.exists():
-                aggregates = self._mapper.report_type_map.get("aggregates")
-                metric_sum = query.aggregate(**aggregates)
-                query_sum = {key: metric_sum.get(key) for key in aggregates}
-
-            query_data, total_capacity = self.get_cluster_capacity(query_data)
-            if total_capacity:
-                query_sum.update(total_capacity)
+            # Populate the 'total' section of the API response along with the cluster capacity
+            totals, capacity = self._get_totals_and_capacity(query)
+            if totals is not None:
+                query_sum = totals
+            if capacity:
+                for row in query_data:
+                    self._set_row_capacity(row, capacity)
+                query_sum[capacity["key"]] = capacity["total"]
 
             if self._delta:
                 query_data = self.add_deltas(query_data, query_sum)
@@ -196,54 +202,103 @@ class OCPReportQueryHandler(ReportQueryHandler):
 
         return Window(expression=RowNumber(), partition_by=F("date"), order_by=rank_orders)
 
-    def get_cluster_capacity(self, query_data):  # noqa: C901
-        """Calculate cluster capacity for all nodes over the date range."""
-        annotations = self._mapper.report_type_map.get("capacity_aggregate")
-        if not annotations:
-            return query_data, {}
+    def _get_totals_and_capacity(self, query):
+        """Query the report totals and the cluster capacity rollups in one statement.
 
-        cap_key = list(annotations.keys())[0]
-        total_capacity = Decimal(0)
-        daily_total_capacity = defaultdict(Decimal)
-        capacity_by_cluster = defaultdict(Decimal)
-        daily_capacity_by_cluster = defaultdict(lambda: defaultdict(Decimal))
+        Capacity is a per cluster and day value, so the filtered rows are first
+        aggregated by day and cluster. GROUPING SETS then sums both the totals and
+        the capacity by day and cluster, by day, by cluster, and overall.
 
-        q_table = self._mapper.query_table
-        query = q_table.objects.filter(self.query_filter)
-        query_group_by = ["usage_start", "cluster_id"]
+        Args:
+            query (QuerySet): The filtered report query
 
-        with tenant_context(self.tenant):
-            cap_data = query.values(*query_group_by).annotate(**annotations)
-            for entry in cap_data:
-                cluster_id = entry.get("cluster_id", "")
-                usage_start = entry.get("usage_start", "")
-                if isinstance(usage_start, datetime.date):
-                    usage_start = usage_start.isoformat()
-                cap_value = entry.get(cap_key, 0)
-                if cap_value is None:
-                    cap_value = 0
-                capacity_by_cluster[cluster_id] += cap_value
-                daily_capacity_by_cluster[usage_start][cluster_id] = cap_value
-                daily_total_capacity[usage_start] += cap_value
-                total_capacity += cap_value
+        Returns:
+            (dict, dict): The totals, None if there is no data, and the capacity
+                rollups, empty if the report type has no capacity
+
+        """
+        aggregates = self._mapper.report_type_map.get("aggregates")
+        capacity_aggregate = self._mapper.report_type_map.get("capacity_aggregate") or {}
+        cluster_days = (
+            query.order_by().values("usage_start", "cluster_id").annotate(**aggregates, **capacity_aggregate)
+        )
+        inner_sql, params = cluster_days.query.sql_with_params()
+
+        grouping_sets = "()"
+        if capacity_aggregate:
+            grouping_sets = "(usage_start, cluster_id), (usage_start), (cluster_id), ()"
+        columns = list(aggregates) + list(capacity_aggregate)
+        sums = ", ".join(f'sum(cluster_days."{column}")' for column in columns)
+        sql = f"""
+            SELECT GROUPING(usage_start, cluster_id), usage_start, cluster_id, count(*), {sums}
+            FROM ({inner_sql}) AS cluster_days
+            GROUP BY GROUPING SETS ({grouping_sets})
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rollups = cursor.fetchall()
+
+        totals = None
+        capacity = {}
+        if capacity_aggregate:
+            cap_key = list(capacity_aggregate.keys())[0]
+            capacity = {
+                "key": cap_key,
+                "total": Decimal(0),
+                "daily_total": {},
+                "by_cluster": {},
+                "daily_by_cluster": {},
+            }
+        for grouping, usage_start, cluster_id, row_count, *values in rollups:
+            row = dict(zip(columns, values))
+            if grouping == TOTAL_GROUPING and row_count:
+                totals = {key: row.get(key) for key in aggregates}
+            if not capacity:
+                continue
+            cap_value = row.get(capacity["key"]) or Decimal(0)
+            if isinstance(usage_start, datetime.date):
+                usage_start = usage_start.isoformat()
+            if grouping == CLUSTER_DAY_GROUPING:
+                capacity["daily_by_cluster"].setdefault(usage_start, {})[cluster_id] = cap_value
+            elif grouping == DAY_GROUPING:
+                capacity["daily_total"][usage_start] = cap_value
+            elif grouping == CLUSTER_GROUPING:
+                capacity["by_cluster"][cluster_id] = cap_value
+            else:
+                capacity["total"] = cap_value
 
+        return totals, capacity
+
+    def _set_row_capacity(self, row, capacity):
+        """Attach the cluster capacity for the row's cluster and date."""
+        cap_key = capacity["key"]
+        cluster_id = row.get("cluster")
         if self.resolution == "daily":
-            for row in query_data:
-                cluster_id = row.get("cluster")
-                date = row.get("date")
-                if cluster_id:
-                    row[cap_key] = daily_capacity_by_cluster.get(date, {}).get(cluster_id, Decimal(0))
-                else:
-                    row[cap_key] = daily_total_capacity.get(date, Decimal(0))
+            date = row.get("date")
+            if cluster_id:
+                row[cap_key] = capacity["daily_by_cluster"].get(date, {}).get(cluster_id, Decimal(0))
+            else:
+                row[cap_key] = capacity["daily_total"].get(date, Decimal(0))
         elif self.resolution == "monthly":
-            for row in query_data:
-                cluster_id = row.get("cluster")
-                if cluster_id:
-                    row[cap_key] = capacity_by_cluster.get(cluster_id, Decimal(0))
-                else:
-                    row[cap_key] = total_capacity
-
-        return query_data, {cap_key: total_capacity}
+            if cluster_id:
+                row[cap_key] = capacity["by_cluster"].get(cluster_id, Decimal(0))
+            else:
+                row[cap_key] = capacity["total"]
+        return row
+
+    def _get_streaming_query(self):
+        """Return the values query of the CSV rows to stream."""
+        query = self.query_table.objects.filter(self.query_filter)
+        _, self._streaming_capacity = self._get_totals_and_capacity(query)
+        query_group_by = ["date"] + self._get_group_by()
+        query_data = query.annotate(**self.annotations)
+        return query_data.values(*query_group_by).annotate(**self.report_annotations)
+
+    def _format_streaming_row(self, row):
+        """Attach the cluster capacity to a streamed CSV row."""
+        if self._streaming_capacity:
+            self._set_row_capacity(row, self._streaming_capacity)
+        return row
 
     def add_deltas(self, query_data, query_sum):
         """Calculate and add cost deltas to a result set.
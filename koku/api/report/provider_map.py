@@ -15,6 +15,49 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Provider Mapper for Reports."""
+from itertools import combinations
+
+
+def build_view_routes(views):
+    """Precompute the view to query for every combination of query keys.
+
+    A view supports the union of the keys it is listed under, so any key set
+    covered by a view can be answered by it. Exact entries in the views
+    structure always win; otherwise the view with the fewest supported keys
+    (the narrowest summary) that covers the requested keys is chosen.
+
+    Args:
+        views (dict): {report_type: {"default" or key tuple: view model}}
+
+    Returns:
+        (dict): {report_type: {frozenset of keys: view model}}
+
+    """
+    routes = {}
+    for report_type, report_views in views.items():
+        dimensions = {}
+        exact = {}
+        for keys, view in report_views.items():
+            key_set = frozenset() if keys == "default" else frozenset(keys)
+            exact[key_set] = view
+            dimensions[view] = dimensions.get(view, frozenset()) | key_set
+
+        # Stable sort keeps the declaration order between views of equal width
+        candidates = sorted(dimensions.items(), key=lambda item: len(item[1]))
+        universe = sorted(frozenset().union(*dimensions.values()))
+        report_routes = {}
+        for size in range(len(universe) + 1):
+            for keys in combinations(universe, size):
+                key_set = frozenset(keys)
+                if key_set in exact:
+                    report_routes[key_set] = exact[key_set]
+                    continue
+                for view, supported in candidates:
+                    if key_set <= supported:
+                        report_routes[key_set] = view
+                        break
+        routes[report_type] = report_routes
+    return routes
 
 
 class ProviderMap:
@@ -72,11 +115,20 @@ class ProviderMap:
         self._provider_map = self.provider_data(provider)
         self._report_type_map = self.report_type_data(report_type, provider)
 
+        # The views are identical for every instance of a provider map,
+        # so their routes are only built the first time the class is used.
+        if "_view_routes" not in type(self).__dict__:
+            type(self)._view_routes = build_view_routes(getattr(self, "views", {}))
+
         # main mapping data structure
         # this data should be considered static and read-only.
         if not getattr(self, "_mapping"):
             self._mapping = [{}]
 
+    def view_for(self, report_type, keys):
+        """Return the narrowest view covering the query keys, or None if there is none."""
+        return self._view_routes.get(report_type, {}).get(frozenset(keys))
+
     @property
     def count(self):
         """Return the count property."""
@@ -27,16 +27,29 @@ from decimal import InvalidOperation
 from itertools import groupby
 from urllib.parse import quote_plus
 
+from django.conf import settings
+from django.db.models import F
 from django.db.models import Q
 from django.db.models.expressions import OrderBy
 from django.db.models.expressions import RawSQL
+from prometheus_client import Counter
+from tenant_schemas.utils import tenant_context
 
+from api.common.pagination import ReportPagination
 from api.models import Provider
 from api.query_filter import QueryFilter
 from api.query_filter import QueryFilterCollection
 from api.query_handler import QueryHandler
 
 LOG = logging.getLogger(__name__)
+QUERY_TABLE_COUNTER = Counter(
+    "hccm_report_query_table", "Report queries by selected table", ["provider", "report_type", "table"]
+)
+QUERY_TABLE_FALLBACK_COUNTER = Counter(
+    "hccm_report_query_table_fallback",
+    "Report queries falling back to the daily summary table",
+    ["provider", "report_type"],
+)
 
 
 def strip_tag_prefix(tag):
@@ -63,6 +76,8 @@ def check_view_filter_and_group_by_criteria(filter_set, group_by_set):
 class ReportQueryHandler(QueryHandler):
     """Handles report queries and responses."""
 
+    supports_csv_streaming = False
+
     def __init__(self, parameters):
         """Establish report query handler.
 
@@ -71,6 +86,7 @@ class ReportQueryHandler(QueryHandler):
 
         """
         LOG.debug(f"Query Params: {parameters}")
+        self._counted_query_tables = set()
         super().__init__(parameters)
 
         self._tag_keys = parameters.tag_keys
@@ -81,6 +97,10 @@ class ReportQueryHandler(QueryHandler):
 
         self.query_filter = self._get_filter()
 
+        self.page_filter = None
+        if self._is_paginated_in_database():
+            self._set_page_window()
+
     @property
     def query_table_access_keys(self):
         """Return the access keys specific for selecting the query table."""
@@ -103,7 +123,6 @@ class ReportQueryHandler(QueryHandler):
         """Return the database table or view to query against."""
         query_table = self._mapper.query_table
         report_type = self.parameters.report_type
-        report_group = "default"
 
         if self.provider in (
             Provider.OCP_AWS,
@@ -112,13 +131,10 @@ class ReportQueryHandler(QueryHandler):
         ) and not check_view_filter_and_group_by_criteria(
             self.query_table_filter_keys, self.query_table_group_by_keys
         ):
+            self._count_query_table(report_type, query_table, fallback=True)
             return query_table
 
-        key_tuple = tuple(
-            sorted(self.query_table_filter_keys.union(self.query_table_group_by_keys, self.query_table_access_keys))
-        )
-        if key_tuple:
-            report_group = key_tuple
+        keys = self.query_table_filter_keys.union(self.query_table_group_by_keys, self.query_table_access_keys)
 
         # Special Casess for Network and Database Cards in the UI
         service_filter = set(self.parameters.get("filter", {}).get("service", []))
@@ -129,13 +145,157 @@ class ReportQueryHandler(QueryHandler):
         elif report_type == "costs" and service_filter and not service_filter.difference(self.database_services):
             report_type = "database"
 
-        try:
-            query_table = self._mapper.views[report_type][report_group]
-        except KeyError:
-            msg = f"{report_group} for {report_type} has no entry in views. Using the default."
-            LOG.warning(msg)
+        view = self._mapper.view_for(report_type, keys)
+        if view is None:
+            report_group = tuple(sorted(keys)) or "default"
+            LOG.warning(f"{report_group} for {report_type} has no covering view. Using the default.")
+        else:
+            query_table = view
+        self._count_query_table(report_type, query_table, fallback=view is None)
         return query_table
 
+    def _count_query_table(self, report_type, query_table, fallback=False):
+        """Record the table selected for the query in the Prometheus metrics, once per handler."""
+        if (report_type, query_table) in self._counted_query_tables:
+            return
+        self._counted_query_tables.add((report_type, query_table))
+        QUERY_TABLE_COUNTER.labels(
+            provider=self.provider, report_type=report_type, table=query_table._meta.db_table
+        ).inc()
+        if fallback:
+            QUERY_TABLE_FALLBACK_COUNTER.labels(provider=self.provider, report_type=report_type).inc()
+
+    def _is_paginated_in_database(self):
+        """Determine whether the requested page can be applied in the database.
+
+        Report responses are paginated over their date buckets, which are known
+        from the time interval alone. Ranked, org unit, and CSV pagination page
+        over rows instead, so they keep paginating the materialized result.
+
+        Returns:
+            (Boolean): True if the page window should be pushed into the query
+
+        """
+        if not settings.ENABLE_DATABASE_PAGINATION:
+            return False
+        if self.parameters.accept_type and "text/csv" in self.parameters.accept_type:
+            return False
+        if "offset" in self.parameters.get("filter", {}):
+            return False
+        group_by = self.parameters.get("group_by", {})
+        if "org_unit_id" in group_by or "or:org_unit_id" in group_by:
+            return False
+        return "limit" in self.parameters.parameters or "offset" in self.parameters.parameters
+
+    def _set_page_window(self):
+        """Restrict the time interval and the row query to the requested page of dates."""
+        limit = min(self.parameters.get("limit", ReportPagination.default_limit), ReportPagination.max_limit)
+        offset = self.parameters.get("offset", 0)
+
+        self.page_count = len(self.time_interval)
+        self.time_interval = self.time_interval[offset : offset + limit]  # noqa: E203
+        if not self.time_interval:
+            self.page_filter = Q(pk__in=[])
+            return
+
+        page_start = self.time_interval[0]
+        page_end = self.time_interval[-1]
+        if self.resolution == "monthly":
+            page_end = self.dh.month_end(page_end)
+        self.page_filter = Q(usage_start__gte=page_start.date(), usage_start__lte=page_end.date())
+
+    def _apply_page_filter(self, query):
+        """Apply the database page window to a row query, if one is set.
+
+        Args:
+            query (QuerySet): The report row query
+
+        Returns:
+            (QuerySet): The query limited to the dates of the requested page
+
+        """
+        if self.page_filter is None:
+            return query
+        return query.filter(self.page_filter)
+
+    def _get_current_dates(self):
+        """Return the date strings for every day with data in the current period."""
+        current_dates = (
+            self.query_table.objects.filter(self.query_filter)
+            .values_list("usage_start", flat=True)
+            .distinct()
+            .order_by("usage_start")
+        )
+        return [self.date_to_string(date) for date in current_dates]
+
+    @property
+    def is_csv_streaming(self):
+        """Determine whether the CSV report can be streamed from the database.
+
+        Ranked, delta, and unit converted reports need the full result set in
+        memory, so only plain exports are streamed.
+        """
+        return (
+            settings.ENABLE_CSV_STREAMING
+            and self.supports_csv_streaming
+            and bool(self.parameters.accept_type and "text/csv" in self.parameters.accept_type)
+            and not self._limit
+            and not self._delta
+            and "units" not in self.parameters.parameters
+        )
+
+    def _get_streaming_query(self):
+        """Return the values query of the CSV rows to stream."""
+        raise NotImplementedError("Streaming queries must be defined by sub-classes.")
+
+    def _format_streaming_row(self, row):
+        """Format a single streamed CSV row."""
+        return row
+
+    def _get_database_order_by(self, order_fields):
+        """Translate report order fields into database ordering expressions.
+
+        Args:
+            order_fields (list): The report order fields, e.g. ["-date", "-cost_total"]
+
+        Returns:
+            (list): OrderBy expressions with NULL values ordered last
+
+        """
+        tag_str = "tag:"
+        order_by = []
+        for field in order_fields:
+            descending = field.startswith("-")
+            field = field.lstrip("-")
+            if tag_str in field:
+                tag = field[field.index(tag_str) + len(tag_str) :]  # noqa: E203
+                expression = RawSQL(f"{self._mapper.tag_column} -> %s", (tag,))
+            else:
+                expression = F(field)
+            order_by.append(OrderBy(expression, descending=descending, nulls_last=True))
+        return order_by
+
+    def execute_streaming_query(self):
+        """Yield the CSV report rows in chunks from a server-side cursor.
+
+        Pagination is only applied when limit or offset are requested.
+
+        Returns:
+            (Generator(Dict)): The report rows
+
+        """
+        with tenant_context(self.tenant):
+            query_data = self._get_streaming_query()
+            query_data = query_data.order_by(*self._get_database_order_by(["-date", self.order]))
+            offset = self.parameters.get("offset", 0)
+            limit = self.parameters.get("limit")
+            if limit:
+                query_data = query_data[offset : offset + limit]  # noqa: E203
+            elif offset:
+                query_data = query_data[offset:]
+            for row in query_data.iterator(chunk_size=settings.CSV_STREAMING_CHUNK_SIZE):
+                yield self._format_streaming_row(row)
+
     def initialize_totals(self):
         """Initialize the total response column values."""
         query_sum = {}
@@ -770,14 +930,19 @@ class ReportQueryHandler(QueryHandler):
                 return_data.append(value)
         return return_data
 
-    def _create_previous_totals(self, previous_query, query_group_by):
+    def _create_previous_totals(self, previous_query, query_group_by, previous_dates=None):
         """Get totals from the time period previous to the current report.
 
+        The grouped values and the total of the previous period come from the same query,
+        as the delta fields are sums.
+
         Args:
             previous_query (Query): A Django ORM query
             query_group_by (dict): The group by dict for the current report
+            previous_dates (set): Date strings of the previous period counted in the total, all if None
         Returns:
-            (dict) A dictionary keyed off the grouped values for the report
+            (tuple) A dictionary keyed off the grouped values for the report,
+                and the (Decimal) total of the previous period
 
         """
         date_delta = self._get_date_delta()
@@ -788,42 +953,51 @@ class ReportQueryHandler(QueryHandler):
         delta_annotation = {self._delta: delta_field}
         previous_sums = previous_sums.values(*query_group_by).annotate(**delta_annotation)
         previous_dict = OrderedDict()
+        previous_total = Decimal(0)
         for row in previous_sums:
+            if row[self._delta] is not None and (previous_dates is None or row["date"] in previous_dates):
+                previous_total += Decimal(row[self._delta])
             date = self.string_to_date(row["date"])
             date = date + date_delta
             row["date"] = self.date_to_string(date)
             key = tuple(row[key] for key in query_group_by)
             previous_dict[key] = row[self._delta]
 
-        return previous_dict
+        return previous_dict, previous_total
 
-    def _get_previous_totals_filter(self, filter_dates):
-        """Filter previous time range to exlude days from the current range.
+    def _get_previous_dates(self, dates):
+        """Return the dates of the previous time range matching the days of the current range.
 
-        Specifically this covers days in the current range that have not yet
+        Specifically this excludes days in the current range that have not yet
         happened, but that data exists for in the previous range.
 
         Args:
-            filter_dates (list) A list of date strings of dates to filter
+            dates (list) A list of date strings of the current range
 
         Returns:
-            (django.db.models.query_utils.Q) The OR date filter
+            (set) The date strings of the previous range
 
         """
         date_delta = self._get_date_delta()
-        prev_total_filters = None
+        return {self.date_to_string(self.string_to_date(date) - date_delta) for date in dates}
 
-        for i in range(len(filter_dates)):
-            date = self.string_to_date(filter_dates[i])
-            date = date - date_delta
-            filter_dates[i] = self.date_to_string(date)
+    def _get_delta_total(self, query_sum):
+        """Return the value of the delta field in the total aggregate.
 
-        for date in filter_dates:
-            if prev_total_filters:
-                prev_total_filters = prev_total_filters | Q(usage_start=date)
-            else:
-                prev_total_filters = Q(usage_start=date)
-        return prev_total_filters
+        Args:
+            query_sum (dict) The sum returned by calculate_totals
+
+        Returns:
+            (Decimal) The current total of the delta field
+
+        """
+        if self._delta in query_sum:
+            if isinstance(query_sum.get(self._delta), dict):
+                return Decimal(query_sum.get(self._delta, {}).get("value") or 0)
+            return Decimal(query_sum.get(self._delta) or 0)
+        if isinstance(query_sum.get("cost"), dict):
+            return Decimal(query_sum.get("cost", {}).get("total").get("value") or 0)
+        return Decimal(query_sum.get("cost") or 0)
 
     def add_deltas(self, query_data, query_sum):
         """Calculate and add cost deltas to a result set.
@@ -839,7 +1013,16 @@ class ReportQueryHandler(QueryHandler):
         delta_group_by = ["date"] + self._get_group_by()
         delta_filter = self._get_filter(delta=True)
         previous_query = self.query_table.objects.filter(delta_filter)
-        previous_dict = self._create_previous_totals(previous_query, delta_group_by)
+        previous_dates = None
+        if self.resolution == "daily":
+            if self.page_filter is not None:
+                # query_data only holds the current page, the total covers every day
+                dates = self._get_current_dates()
+            else:
+                dates = [entry.get("date") for entry in query_data]
+            if dates:
+                previous_dates = self._get_previous_dates(dates)
+        previous_dict, prev_total_sum = self._create_previous_totals(previous_query, delta_group_by, previous_dates)
         for row in query_data:
             key = tuple(row[key] for key in delta_group_by)
             previous_total = previous_dict.get(key) or 0
@@ -847,25 +1030,7 @@ class ReportQueryHandler(QueryHandler):
             row["delta_value"] = current_total - previous_total
             row["delta_percent"] = self._percent_delta(current_total, previous_total)
         # Calculate the delta on the total aggregate
-        if self._delta in query_sum:
-            if isinstance(query_sum.get(self._delta), dict):
-                current_total_sum = Decimal(query_sum.get(self._delta, {}).get("value") or 0)
-            else:
-                current_total_sum = Decimal(query_sum.get(self._delta) or 0)
-        else:
-            if isinstance(query_sum.get("cost"), dict):
-                current_total_sum = Decimal(query_sum.get("cost", {}).get("total").get("value") or 0)
-            else:
-                current_total_sum = Decimal(query_sum.get("cost") or 0)
-        delta_field = self._mapper._report_type_map.get("delta_key").get(self._delta)
-        prev_total_sum = previous_query.aggregate(value=delta_field)
-        if self.resolution == "daily":
-            dates = [entry.get("date") for entry in query_data]
-            prev_total_filters = self._get_previous_totals_filter(dates)
-            if prev_total_filters:
-                prev_total_sum = previous_query.filter(prev_total_filters).aggregate(value=delta_field)
-
-        prev_total_sum = Decimal(prev_total_sum.get("value") or 0)
+        current_total_sum = self._get_delta_total(query_sum)
 
         total_delta = current_total_sum - prev_total_sum
         total_delta_percent = self._percent_delta(current_total_sum, prev_total_sum)
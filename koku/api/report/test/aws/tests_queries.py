@@ -37,10 +37,13 @@ from rest_framework.exceptions import ValidationError
 from tenant_schemas.utils import tenant_context
 
 from api.iam.test.iam_test_case import IamTestCase
+from api.models import Provider
 from api.report.aws.query_handler import AWSReportQueryHandler
 from api.report.aws.view import AWSCostView
 from api.report.aws.view import AWSInstanceTypeView
 from api.report.aws.view import AWSStorageView
+from api.report.queries import QUERY_TABLE_COUNTER
+from api.report.queries import QUERY_TABLE_FALLBACK_COUNTER
 from api.report.queries import strip_tag_prefix
 from api.report.test.aws.test_views import _calculate_accounts_and_subous
 from api.tags.aws.queries import AWSTagQueryHandler
@@ -903,6 +906,31 @@ class AWSReportQueryTest(IamTestCase):
         self.assertAlmostEqual(delta.get("value"), expected_delta_value, 6)
         self.assertEqual(delta.get("percent"), expected_delta_percent)
 
+    def test_execute_query_w_daily_delta(self):
+        """Test that the daily delta total only compares the days of the current period."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily&group_by[account]=*&delta=cost"  # noqa: E501
+        path = reverse("reports-aws-costs")
+        query_params = self.mocked_query_params(url, AWSCostView, path)
+        handler = AWSReportQueryHandler(query_params)
+        query_output = handler.execute_query()
+        current_total = query_output.get("total").get("cost").get("total").get("value")
+
+        dates = [day.get("date") for day in query_output.get("data") if day.get("accounts")]
+        previous_dates = handler._get_previous_dates(dates)
+        with tenant_context(self.tenant):
+            prev = AWSCostEntryLineItemDailySummary.objects.filter(
+                handler._get_filter(delta=True), usage_start__in=previous_dates
+            ).aggregate(
+                value=Sum(
+                    Coalesce(F("unblended_cost"), Value(0, output_field=DecimalField()))
+                    + Coalesce(F("markup_cost"), Value(0, output_field=DecimalField()))
+                )
+            )
+        prev_total = Decimal(prev.get("value") or 0)
+
+        delta = query_output.get("delta")
+        self.assertAlmostEqual(delta.get("value"), current_total - prev_total, 6)
+
     def test_execute_query_orderby_delta(self):
         """Test execute_query with ordering by delta ascending."""
         url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=monthly&order_by[delta]=asc&group_by[account]=*&delta=cost"  # noqa: E501
@@ -1318,6 +1346,44 @@ class AWSReportQueryTest(IamTestCase):
             with self.subTest(org=org):
                 check_accounts_subous_totals(org)
 
+    def test_execute_query_org_unit_group_by_single_sub_org_query(self):
+        """Test that the sub orgs are rolled up in one query with the cost of their whole tree."""
+        with tenant_context(self.tenant):
+            url = "?group_by[org_unit_id]=R_001"
+            query_params = self.mocked_query_params(url, AWSCostView, "costs")
+            handler = AWSReportQueryHandler(query_params)
+            with patch.object(
+                AWSReportQueryHandler,
+                "execute_individual_query",
+                autospec=True,
+                side_effect=AWSReportQueryHandler.execute_individual_query,
+            ) as mock_query:
+                data = handler.execute_query()
+            # one query for the accounts, one for every sub org
+            self.assertEqual(mock_query.call_count, 2)
+
+            ten_days_ago = self.dh.n_days_ago(self.dh.today, 9)
+            sub_org_costs = defaultdict(Decimal)
+            for day in data.get("data"):
+                for org_entity in day.get("org_entities", []):
+                    if org_entity.get("type") == "organizational_unit":
+                        for value in org_entity.get("values"):
+                            sub_org_costs[org_entity.get("id")] += value.get("cost").get("total").get("value")
+            self.assertNotEqual(sub_org_costs, {})
+            for sub_org_id, cost in sub_org_costs.items():
+                path = self.ou_to_account_subou_map.get(sub_org_id).get("org_unit_path")
+                expected = AWSCostEntryLineItemDailySummary.objects.filter(
+                    usage_start__gte=ten_days_ago,
+                    usage_end__lte=self.dh.today,
+                    organizational_unit__org_unit_path__startswith=path,
+                ).aggregate(
+                    cost_total=Sum(
+                        Coalesce(F("unblended_cost"), Value(0, output_field=DecimalField()))
+                        + Coalesce(F("markup_cost"), Value(0, output_field=DecimalField()))
+                    )
+                )
+                self.assertAlmostEqual(cost, expected.get("cost_total") or 0, places=6)
+
     def test_execute_query_with_multiple_or_org_unit_group_by(self):
         """Test that when data has multiple grouped by org_unit_id, the totals add up correctly."""
         ou_to_compare = ["OU_001", "OU_002"]
@@ -1786,6 +1852,14 @@ class AWSQueryHandlerTest(IamTestCase):
             ("?group_by[service]=*&group_by[account]=*", AWSStorageView, AWSStorageSummaryByService),
             ("?group_by[product_family]=*", AWSStorageView, AWSStorageSummaryByService),
             ("?group_by[product_family]=*&group_by[account]=*", AWSStorageView, AWSStorageSummaryByService),
+            ("?group_by[service]=*&filter[product_family]=Storage", AWSCostView, AWSCostSummaryByService),
+            (
+                "?group_by[service]=*&group_by[account]=*&filter[product_family]=Storage",
+                AWSCostView,
+                AWSCostSummaryByService,
+            ),
+            ("?group_by[region]=*&group_by[service]=*", AWSCostView, AWSCostEntryLineItemDailySummary),
+            ("?group_by[instance_type]=*&group_by[region]=*", AWSInstanceTypeView, AWSCostEntryLineItemDailySummary),
             (
                 (
                     "?filter[service]=AmazonRDS,AmazonDynamoDB,AmazonElastiCache,"
@@ -1820,3 +1894,24 @@ class AWSQueryHandlerTest(IamTestCase):
                 query_params = self.mocked_query_params(url, view)
                 handler = AWSReportQueryHandler(query_params)
                 self.assertEqual(handler.query_table, table)
+
+    def test_query_table_metrics(self):
+        """Test that the selected table and any fallback are counted once per handler."""
+        test_cases = [
+            ("?group_by[service]=*&filter[product_family]=Storage", AWSCostSummaryByService, 0),
+            ("?group_by[region]=*&group_by[service]=*", AWSCostEntryLineItemDailySummary, 1),
+        ]
+        for url, table, fallbacks in test_cases:
+            with self.subTest(url=url):
+                labels = {"provider": Provider.PROVIDER_AWS, "report_type": "costs"}
+                table_counter = QUERY_TABLE_COUNTER.labels(table=table._meta.db_table, **labels)
+                fallback_counter = QUERY_TABLE_FALLBACK_COUNTER.labels(**labels)
+                table_count = table_counter._value.get()
+                fallback_count = fallback_counter._value.get()
+
+                query_params = self.mocked_query_params(url, AWSCostView)
+                handler = AWSReportQueryHandler(query_params)
+                handler.query_table
+                handler.query_table
+                self.assertEqual(table_counter._value.get(), table_count + 1)
+                self.assertEqual(fallback_counter._value.get(), fallback_count + fallbacks)
@@ -19,9 +19,11 @@ import logging
 from collections import defaultdict
 from decimal import Decimal
 from unittest.mock import patch
+from unittest.mock import PropertyMock
 
 from django.db.models import Max
 from django.db.models.expressions import OrderBy
+from django.test.utils import override_settings
 from tenant_schemas.utils import tenant_context
 
 from api.iam.test.iam_test_case import IamTestCase
@@ -120,19 +122,92 @@ class OCPReportQueryHandlerTest(IamTestCase):
         self.assertIsNotNone(result_cost_total)
         self.assertEqual(result_cost_total, expected_cost_total)
 
+    @override_settings(ENABLE_DATABASE_PAGINATION=True)
+    def test_execute_query_paginated_in_database(self):
+        """Test that a database page matches the same page of the full result."""
+        url = "?filter[time_scope_units]=day&filter[time_scope_value]=-10&group_by[project]=*"
+        query_params = self.mocked_query_params(url, OCPCpuView)
+        handler = OCPReportQueryHandler(query_params)
+        self.assertIsNone(handler.page_filter)
+        self.assertIsNone(handler.page_count)
+        full_output = handler.execute_query()
+
+        query_params = self.mocked_query_params(url + "&limit=3&offset=2", OCPCpuView)
+        handler = OCPReportQueryHandler(query_params)
+        self.assertIsNotNone(handler.page_filter)
+        self.assertEqual(handler.page_count, len(full_output.get("data")))
+        self.assertEqual(len(handler.time_interval), 3)
+        page_output = handler.execute_query()
+
+        self.assertEqual(page_output.get("data"), full_output.get("data")[2:5])
+        self.assertEqual(page_output.get("total"), full_output.get("total"))
+
+    @override_settings(ENABLE_DATABASE_PAGINATION=True)
+    def test_execute_query_paginated_in_database_past_last_page(self):
+        """Test that an offset past the last date returns no data."""
+        url = "?filter[time_scope_units]=day&filter[time_scope_value]=-10&limit=5&offset=20"
+        query_params = self.mocked_query_params(url, OCPCpuView)
+        handler = OCPReportQueryHandler(query_params)
+        self.assertEqual(handler.page_count, 10)
+        query_output = handler.execute_query()
+        self.assertEqual(query_output.get("data"), [])
+
+    @override_settings(ENABLE_DATABASE_PAGINATION=True)
+    def test_ranked_pagination_not_paginated_in_database(self):
+        """Test that ranked pagination keeps paginating the materialized result."""
+        url = "?filter[limit]=2&filter[offset]=1&group_by[project]=*&limit=3"
+        query_params = self.mocked_query_params(url, OCPCpuView)
+        handler = OCPReportQueryHandler(query_params)
+        self.assertIsNone(handler.page_filter)
+        self.assertIsNone(handler.page_count)
+
+    @override_settings(ENABLE_CSV_STREAMING=True)
+    @patch("api.query_params.QueryParameters.accept_type", new_callable=PropertyMock)
+    def test_execute_streaming_query(self, mock_accept):
+        """Test that streamed CSV rows match the materialized CSV rows."""
+        mock_accept.return_value = "text/csv"
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily&group_by[project]=*"
+        query_params = self.mocked_query_params(url, OCPCpuView)
+        handler = OCPReportQueryHandler(query_params)
+        self.assertTrue(handler.is_csv_streaming)
+        expected = handler.execute_query().get("data")
+
+        handler = OCPReportQueryHandler(query_params)
+        streamed = list(handler.execute_streaming_query())
+        self.assertEqual(len(streamed), len(expected))
+        for row in expected:
+            self.assertIn(row, streamed)
+
+    @override_settings(ENABLE_CSV_STREAMING=True)
+    @patch("api.query_params.QueryParameters.accept_type", new_callable=PropertyMock)
+    def test_is_csv_streaming_ranked(self, mock_accept):
+        """Test that ranked CSV reports are not streamed."""
+        mock_accept.return_value = "text/csv"
+        url = "?filter[limit]=2&group_by[project]=*"
+        query_params = self.mocked_query_params(url, OCPCpuView)
+        handler = OCPReportQueryHandler(query_params)
+        self.assertFalse(handler.is_csv_streaming)
+
     def test_get_cluster_capacity_monthly_resolution(self):
         """Test that cluster capacity returns a full month's capacity."""
         url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=monthly"
         query_params = self.mocked_query_params(url, OCPCpuView)
         handler = OCPReportQueryHandler(query_params)
-        query_data = [{"row": 1}]
-        query_data, total_capacity = handler.get_cluster_capacity(query_data)
-        self.assertTrue("capacity" in total_capacity)
-        self.assertTrue(isinstance(total_capacity["capacity"], Decimal))
-        self.assertTrue("capacity" in query_data[0])
-        self.assertIsNotNone(query_data[0].get("capacity"))
-        self.assertIsNotNone(total_capacity.get("capacity"))
-        self.assertEqual(query_data[0].get("capacity"), total_capacity.get("capacity"))
+        with tenant_context(self.tenant):
+            query = handler.query_table.objects.filter(handler.query_filter)
+            _, capacity = handler._get_totals_and_capacity(query)
+        row = handler._set_row_capacity({"row": 1}, capacity)
+        self.assertTrue(isinstance(capacity["total"], Decimal))
+        self.assertIsNotNone(row.get("capacity"))
+        self.assertEqual(row.get("capacity"), capacity["total"])
+
+        query_data = handler.execute_query()
+        total_capacity = query_data.get("total", {}).get("capacity", {}).get("value")
+        self.assertIsNotNone(total_capacity)
+        self.assertEqual(total_capacity, capacity["total"])
+        for entry in query_data.get("data", []):
+            for value in entry.get("values", []):
+                self.assertEqual(value.get("capacity", {}).get("value"), total_capacity)
 
     def test_get_cluster_capacity_monthly_resolution_group_by_cluster(self):
         """Test that cluster capacity returns capacity by cluster."""
@@ -239,6 +314,43 @@ class OCPReportQueryHandlerTest(IamTestCase):
 
         self.assertEqual(query_data.get("total", {}).get("capacity", {}).get("value"), total_capacity)
 
+    def test_get_totals_and_capacity(self):
+        """Test that the totals and capacity rollups match separate aggregate queries."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily"
+        for view in (OCPCpuView, OCPMemoryView, OCPVolumeView):
+            with self.subTest(view=view):
+                query_params = self.mocked_query_params(url, view)
+                handler = OCPReportQueryHandler(query_params)
+                aggregates = handler._mapper.report_type_map.get("aggregates")
+                annotations = handler._mapper.report_type_map.get("capacity_aggregate")
+                cap_key = list(annotations.keys())[0]
+                with tenant_context(self.tenant):
+                    query = handler.query_table.objects.filter(handler.query_filter)
+                    expected_totals = query.aggregate(**aggregates)
+                    cap_data = query.values("usage_start", "cluster_id").annotate(**annotations)
+                    expected_capacity = sum(entry.get(cap_key) or 0 for entry in cap_data)
+                    totals, capacity = handler._get_totals_and_capacity(query)
+
+                self.assertEqual(totals, expected_totals)
+                self.assertEqual(capacity["key"], cap_key)
+                self.assertEqual(capacity["total"], expected_capacity)
+                self.assertEqual(sum(capacity["daily_total"].values()), expected_capacity)
+                self.assertEqual(sum(capacity["by_cluster"].values()), expected_capacity)
+
+    def test_get_totals_and_capacity_no_capacity(self):
+        """Test that report types without capacity only return the totals."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily"
+        query_params = self.mocked_query_params(url, OCPCostView)
+        handler = OCPReportQueryHandler(query_params)
+        aggregates = handler._mapper.report_type_map.get("aggregates")
+        with tenant_context(self.tenant):
+            query = handler.query_table.objects.filter(handler.query_filter)
+            totals, capacity = handler._get_totals_and_capacity(query)
+            self.assertEqual(totals, query.aggregate(**aggregates))
+            totals, capacity = handler._get_totals_and_capacity(query.filter(pk=None))
+        self.assertIsNone(totals)
+        self.assertEqual(capacity, {})
+
     @patch("api.report.ocp.query_handler.ReportQueryHandler.add_deltas")
     @patch("api.report.ocp.query_handler.OCPReportQueryHandler.add_current_month_deltas")
     def test_add_deltas_current_month(self, mock_current_deltas, mock_deltas):
@@ -405,7 +405,7 @@ class ReportQueryHandlerTest(IamTestCase):
     # FIXME: need test for _create_previous_totals
     # FIXME: need test for _get_filter
     # FIXME: need test for _get_group_by
-    # FIXME: need test for _get_previous_totals_filter
+    # FIXME: need test for _get_previous_dates
     # FIXME: need test for _get_search_filter
     # FIXME: need test for _get_tag_group_by
     # FIXME: need test for _group_data_by_list
@@ -28,7 +28,9 @@ from rest_framework.serializers import ValidationError
 from rest_framework.views import APIView
 
 from api.common import CACHE_RH_IDENTITY_HEADER
+from api.common.csv import get_streaming_csv_response
 from api.common.pagination import OrgUnitPagination
+from api.common.pagination import ReportDatabasePagination
 from api.common.pagination import ReportPagination
 from api.common.pagination import ReportRankedPagination
 from api.query_params import QueryParameters
@@ -37,9 +39,11 @@ from api.utils import UnitConverter
 LOG = logging.getLogger(__name__)
 
 
-def get_paginator(filter_query_params, count, group_by_params=False):
+def get_paginator(filter_query_params, count, group_by_params=False, page_count=None):
     """Determine which paginator to use based on query params."""
-    if group_by_params and (
+    if page_count is not None:
+        paginator = ReportDatabasePagination(page_count)
+    elif group_by_params and (
         "group_by[org_unit_id]" in group_by_params or "group_by[or:org_unit_id]" in group_by_params
     ):
         paginator = OrgUnitPagination(filter_query_params)
@@ -162,6 +166,9 @@ class ReportView(APIView):
         except ValidationError as exc:
             return Response(data=exc.detail, status=status.HTTP_400_BAD_REQUEST)
         handler = self.query_handler(params)
+        if getattr(handler, "is_csv_streaming", False):
+            return get_streaming_csv_response(handler.execute_streaming_query())
+
         output = handler.execute_query()
         max_rank = handler.max_rank
 
@@ -177,7 +184,9 @@ class ReportView(APIView):
                     error = {"details": _("Unit conversion failed.")}
                     raise ValidationError(error)
 
-        paginator = get_paginator(params.parameters.get("filter", {}), max_rank, request.query_params)
+        paginator = get_paginator(
+            params.parameters.get("filter", {}), max_rank, request.query_params, page_count=handler.page_count
+        )
         paginated_result = paginator.paginate_queryset(output, request)
         LOG.debug(f"DATA: {output}")
         return paginator.get_paginated_response(paginated_result)
@@ -638,16 +638,17 @@ class QueryParametersTests(TestCase):
             user=Mock(access=Mock(get=lambda key, default: default), customer=Mock(schema_name="acct10001")),
             GET=Mock(urlencode=Mock(return_value=fake_uri)),
         )
-        fake_objects = Mock(values=lambda _: [{"key": key, "value": self.FAKE.word()} for key in tag_keys])
         fake_view = Mock(
             spec=ReportView,
             provider=self.FAKE.word(),
             query_handler=Mock(provider=random.choice(PROVIDERS)),
             report=self.FAKE.word(),
             serializer=Mock,
-            tag_handler=[Mock(objects=fake_objects)],
+            tag_handler=[Mock()],
         )
-        params = QueryParameters(fake_request, fake_view)
+        with patch("api.query_params.get_tag_keys", return_value=frozenset(tag_keys)) as mock_get_tag_keys:
+            params = QueryParameters(fake_request, fake_view)
+        mock_get_tag_keys.assert_called_once_with("acct10001", fake_view.tag_handler[0])
         self.assertEqual(params.tag_keys, expected)
 
     def test_get_providers(self):
@@ -15,19 +15,19 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Base forecasting module."""
+import hashlib
 import logging
 import operator
 from collections import defaultdict
-from datetime import datetime
 from datetime import timedelta
-from decimal import Decimal
 from functools import reduce
 
 import numpy as np
-import statsmodels.api as sm
+from django.core.cache import caches
+from django.db.models import Count
+from django.db.models import Max
 from django.db.models import Q
-from statsmodels.sandbox.regression.predstd import wls_prediction_std
-from statsmodels.tools.sm_exceptions import ValueWarning
+from scipy import stats
 from tenant_schemas.utils import tenant_context
 
 from api.models import Provider
@@ -53,10 +53,14 @@ class Forecast:
     # the minimum number of data points needed to use the current month's data.
     # if we have fewer than this many data points, fall back to using the previous month's data.
     #
-    # this number is chosen in part because statsmodels.stats.stattools.omni_normtest() needs at least eight data
-    # points to test for normal distribution.
+    # this number is chosen in part because a normality test of the residuals needs at least eight data points.
     MINIMUM = 8
 
+    # the cost series forecasted, in the column order of the fitted arrays
+    COST_FIELDS = ("total_cost", "infrastructure_cost", "supplementary_cost")
+
+    CACHE_PREFIX = "forecast"
+
     # the precision of the floats returned in the forecast response.
     PRECISION = 8
 
@@ -125,9 +129,40 @@ class Forecast:
         """Return the provider map value for total inftrastructure cost."""
         return self.provider_map.report_type_map.get("aggregates", {}).get("infra_total")
 
+    @property
+    def cache_key(self):
+        """Return the cache key of the forecast.
+
+        The key covers the tenant, the filters (which include the query range and RBAC access),
+        the summary table and the last time data of the tenant's providers was updated.
+        """
+        tenant = self.params.tenant
+        providers = Provider.objects.filter(customer__schema_name=tenant.schema_name).aggregate(
+            count=Count("uuid"), updated=Max("data_updated_timestamp")
+        )
+        key_parts = (
+            type(self).__name__,
+            self.cost_summary_table._meta.db_table,
+            self.dh.today.date(),
+            self.filters.compose(),
+            providers.get("count"),
+            providers.get("updated"),
+        )
+        digest = hashlib.md5(repr(key_parts).encode("utf-8")).hexdigest()
+        return f"{tenant.schema_name}:{self.CACHE_PREFIX}:{digest}"
+
+    def cached_predict(self):
+        """Return the prediction, computed again only once the tenant's data is updated."""
+        cache = caches["default"]
+        key = self.cache_key
+        result = cache.get(key)
+        if result is None:
+            result = self.predict()
+            cache.set(key, result)
+        return result
+
     def predict(self):
         """Define ORM query to run forecast and return prediction."""
-        cost_predictions = {}
         with tenant_context(self.params.tenant):
             data = (
                 self.cost_summary_table.objects.filter(self.filters.compose())
@@ -139,101 +174,122 @@ class Forecast:
                     infrastructure_cost=self.infrastructure_cost_term,
                 )
             )
+            dates, costs = self._get_cost_series(data.values("usage_start", *self.COST_FIELDS))
 
-            for fieldname in ["total_cost", "infrastructure_cost", "supplementary_cost"]:
-                uniq_data = self._uniquify_qset(data.values("usage_start", fieldname), field=fieldname)
-                cost_predictions[fieldname] = self._predict(uniq_data)
+        cost_predictions = self._predict(dates, costs)
+        cost_predictions = self._key_results_by_date(cost_predictions)
+        return self.format_result(cost_predictions)
 
-            cost_predictions = self._key_results_by_date(cost_predictions)
-            return self.format_result(cost_predictions)
+    def _get_cost_series(self, rows):
+        """Sum the costs of each day into one array holding every cost series.
 
-    def _predict(self, data):
+        Args:
+            rows (list) dicts of usage_start and each of COST_FIELDS
+
+        Returns:
+            (tuple)
+                (list) the distinct dates, in order
+                (numpy.ndarray) daily costs, one row per date and one column per cost field
+        """
+        rows = list(rows)
+        dates = sorted({row.get("usage_start") for row in rows})
+        costs = np.zeros((len(dates), len(self.COST_FIELDS)))
+        if rows:
+            positions = {day: i for i, day in enumerate(dates)}
+            index = [positions[row.get("usage_start")] for row in rows]
+            values = np.array([[row.get(field) or 0 for field in self.COST_FIELDS] for row in rows], dtype=float)
+            np.add.at(costs, index, values)
+        return dates, costs
+
+    def _predict(self, dates, costs):
         """Handle pre and post prediction work.
 
-        This function handles arranging incoming data to conform with statsmodels requirements.
-        Then after receiving the forecast output, this function handles formatting to conform to
-        API reponse requirements.
+        Every cost series is fitted at once after removing its outliers. Then this function handles
+        formatting the output to conform to API reponse requirements.
 
         Args:
-            data (list) a list of (datetime, float) tuples
+            dates (list) the distinct dates of the data
+            costs (numpy.ndarray) daily costs, one row per date and one column per cost field
 
         Returns:
-            (LinearForecastResult) linear forecast results object
+            (dict) for each cost field, a (result dict, rsquared, pvalues) tuple or an empty list
         """
-        LOG.debug("Forecast input data: %s", data)
-
-        if len(data) < self.MINIMUM:
-            LOG.warning(
-                "Number of data elements (%s) is fewer than the minimum (%s). Unable to generate forecast.",
-                len(data),
-                self.MINIMUM,
-            )
-            return []
+        LOG.debug("Forecast input data: %s", costs)
+
+        inliers = self._inlier_mask(costs)
+        counts = inliers.sum(axis=0)
+        for field, count in zip(self.COST_FIELDS, counts):
+            if count < self.MINIMUM:
+                LOG.warning(
+                    "Number of data elements (%s) is fewer than the minimum (%s). Unable to generate forecast.",
+                    count,
+                    self.MINIMUM,
+                )
+        fitted = counts >= self.MINIMUM
 
-        dates, costs = zip(*data)
+        cost_predictions = {field: [] for field in self.COST_FIELDS}
+        if not fitted.any():
+            return cost_predictions
 
-        X = self._enumerate_dates(dates)
-        Y = [float(c) for c in costs]
+        X = np.array(self._enumerate_dates(dates), dtype=float)
+        Y = costs[:, fitted]
+        mask = inliers[:, fitted]
 
-        # calculate x-values for the prediction range
-        pred_x = [i for i in range(X[-1] + 1, X[-1] + 1 + self.forecast_days_required)]
+        # predict the days following the last data point of each series
+        last_x = np.where(mask, X[:, None], -np.inf).max(axis=0)
+        pred_x = last_x + 1 + np.arange(self.forecast_days_required)[:, None]
 
         # run the forecast
-        results = self._run_forecast(X, Y, to_predict=pred_x)
-
-        result_dict = {}
-        for i, value in enumerate(results.prediction):
-            if i < len(results.confidence_lower):
-                lower = results.confidence_lower[i]
-            else:
-                lower = results.confidence_lower[-1] + results.slope * (i - len(results.confidence_lower))
-
-            if i < len(results.confidence_upper):
-                upper = results.confidence_upper[i]
-            else:
-                upper = results.confidence_upper[-1] + results.slope * (i - len(results.confidence_upper))
-
-            result_dict[self.dh.today.date() + timedelta(days=i)] = {
-                "total_cost": value,
-                "confidence_min": lower,
-                "confidence_max": upper,
-            }
-
-        return (result_dict, results.rsquared, results.pvalues)
+        results = fit_linear_forecasts(X, Y, mask, pred_x)
+
+        fields = [field for field, is_fitted in zip(self.COST_FIELDS, fitted) if is_fitted]
+        for field, result in zip(fields, results):
+            result_dict = {}
+            for i, (value, lower, upper) in enumerate(
+                zip(result.prediction, result.confidence_lower, result.confidence_upper)
+            ):
+                result_dict[self.dh.today.date() + timedelta(days=i)] = {
+                    "total_cost": float(value),
+                    "confidence_min": float(lower),
+                    "confidence_max": float(upper),
+                }
+            cost_predictions[field] = (result_dict, result.rsquared, result.pvalues)
+
+        return cost_predictions
 
     def _enumerate_dates(self, date_list):
         """Given a list of dates, return a list of integers.
 
-        This method works in conjunction with _remove_outliers(). This method works to preserve any gaps
-        in the data created by _remove_outliers() so that the integers used for the X-axis are aligned
-        appropriately.
+        The integers are the number of days since the first date, so that gaps in the data
+        keep the integers used for the X-axis aligned appropriately.
 
         Example:
 
-            If _remove_outliers() returns {"2000-01-01": 1.0, "2000-01-03": 1.5}
+            If date_list is ["2000-01-01", "2000-01-03"]
             then _enumerate_dates() returns [0, 2]
         """
-        days = self.dh.list_days(
-            datetime.combine(date_list[0], self.dh.midnight), datetime.combine(date_list[-1], self.dh.midnight)
-        )
-        out = [i for i, day in enumerate(days) if day.date() in date_list]
-        return out
+        days = np.array(date_list, dtype="datetime64[D]")
+        return (days - days[0]).astype(int).tolist()
 
-    def _remove_outliers(self, data):
-        """Remove outliers from our dateset before predicting.
+    def _inlier_mask(self, costs):
+        """Return which daily costs of each series are not outliers.
 
-        We use a box plot method without plotting the box.
-        """
-        values = list(data.values())
-        if values:
-            third_quartile, first_quartile = np.percentile(values, [Decimal(75), Decimal(25)])
-            interquartile_range = third_quartile - first_quartile
+        We use a box plot method without plotting the box, on every column at once.
 
-            upper_boundary = third_quartile + (Decimal(1.5) * interquartile_range)
-            lower_boundary = first_quartile - (Decimal(1.5) * interquartile_range)
+        Args:
+            costs (numpy.ndarray) daily costs, one row per date and one column per series
+
+        Returns:
+            (numpy.ndarray) boolean array the shape of costs
+        """
+        if not len(costs):
+            return np.ones(costs.shape, dtype=bool)
+        third_quartile, first_quartile = np.percentile(costs, [75, 25], axis=0)
+        interquartile_range = third_quartile - first_quartile
 
-            return {key: value for key, value in data.items() if (value >= lower_boundary and value <= upper_boundary)}
-        return data
+        upper_boundary = third_quartile + (1.5 * interquartile_range)
+        lower_boundary = first_quartile - (1.5 * interquartile_range)
+        return (costs >= lower_boundary) & (costs <= upper_boundary)
 
     def _key_results_by_date(self, results, check_term="total_cost"):
         """Take results formatted by cost type, and return results keyed by date."""
@@ -320,50 +376,6 @@ class Forecast:
             response.append(dikt)
         return response
 
-    def _run_forecast(self, x, y, to_predict=None):
-        """Apply the forecast model.
-
-        Args:
-            x (list) a list of exogenous variables
-            y (list) a list of endogenous variables
-            to_predict (list) a list of exogenous variables used in the forecast results
-
-        Note:
-            both x and y MUST be the same number of elements
-
-        Returns:
-            (tuple)
-                (numpy.ndarray) prediction values
-                (numpy.ndarray) confidence interval lower bound
-                (numpy.ndarray) confidence interval upper bound
-                (float) R-squared value
-                (list) P-values
-        """
-        x = sm.add_constant(x)
-        to_predict = sm.add_constant(to_predict)
-        model = sm.OLS(y, x)
-        results = model.fit()
-        return LinearForecastResult(results, exog=to_predict)
-
-    def _uniquify_qset(self, qset, field="total_cost"):
-        """Take a QuerySet list, sum costs within the same day, and arrange it into a list of tuples.
-
-        Args:
-            qset (QuerySet)
-            field (str) - field name in the QuerySet to be summed
-
-        Returns:
-            [(date, cost), ...]
-        """
-        # FIXME: this QuerySet->dict->list conversion probably isn't ideal.
-        # FIXME: there's probably a way to aggregate multiple sources by date using just the ORM.
-        result = defaultdict(Decimal)
-        for item in qset:
-            result[item.get("usage_start")] += Decimal(item.get(field, 0.0))
-        result = self._remove_outliers(result)
-        out = [(k, v) for k, v in result.items()]
-        return out
-
     def set_access_filters(self, access, filt, filters):
         """Set access filters to ensure RBAC restrictions adhere to user's access and filters.
 
@@ -385,52 +397,96 @@ class Forecast:
             filters.add(q_filter)
 
 
+def fit_linear_forecasts(x, y, mask, to_predict, alpha=0.05):
+    """Fit a least squares line to every series at once and predict it.
+
+    This is the closed-form ordinary least squares solution of y = intercept + slope * x for each
+    column of y, using the observations selected by mask, with the two-tailed p-values of both
+    params and a (1 - alpha) prediction interval.
+
+    Args:
+        x (numpy.ndarray) (n,) exogenous variable of the observations
+        y (numpy.ndarray) (n, k) observations of k series
+        mask (numpy.ndarray) (n, k) booleans selecting the observations fitted for each series
+        to_predict (numpy.ndarray) (m, k) exogenous variables to predict for each series
+        alpha (float) significance level of the prediction interval
+
+    Returns:
+        (list) a LinearForecastResult per series
+    """
+    weights = mask.astype(float)
+    nobs = weights.sum(axis=0)
+    x = x[:, None]
+    x_mean = (weights * x).sum(axis=0) / nobs
+    y_mean = (weights * y).sum(axis=0) / nobs
+    x_dev = (x - x_mean) * weights
+    y_dev = (y - y_mean) * weights
+    sxx = (x_dev ** 2).sum(axis=0)
+    sxy = (x_dev * y_dev).sum(axis=0)
+    syy = (y_dev ** 2).sum(axis=0)
+    dof = nobs - 2
+
+    # flat or perfectly linear data gives nan statistics, as with any OLS implementation
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        sse = (((y - intercept - slope * x) * weights) ** 2).sum(axis=0)
+        scale = sse / dof
+        rsquared = 1 - sse / syy
+
+        params = np.array([intercept, slope])
+        std_err = np.sqrt(scale * np.array([1 / nobs + x_mean ** 2 / sxx, 1 / sxx]))
+        pvalues = 2 * stats.t.sf(np.abs(params / std_err), dof)
+
+        prediction = intercept + slope * to_predict
+        prediction_std = np.sqrt(scale * (1 + 1 / nobs + (to_predict - x_mean) ** 2 / sxx))
+        interval = stats.t.ppf(1 - alpha / 2, dof) * prediction_std
+
+    return [
+        LinearForecastResult(
+            prediction[:, i],
+            prediction[:, i] - interval[:, i],
+            prediction[:, i] + interval[:, i],
+            rsquared[i],
+            pvalues[:, i],
+            params[:, i],
+        )
+        for i in range(y.shape[1])
+    ]
+
+
 class LinearForecastResult:
     """Container class for linear forecast results.
 
     Note: this class should be considered read-only
     """
 
-    def __init__(self, regression_result, exog=None):
+    def __init__(self, prediction, confidence_lower, confidence_upper, rsquared, pvalues, params):
         """Class constructor.
 
         Args:
-            regression_result (RegressionResult) the results of a statsmodels regression
-            exog (array-like) exogenous variables for points to predict
+            prediction (array-like) predicted values
+            confidence_lower (array-like) prediction interval lower bound
+            confidence_upper (array-like) prediction interval upper bound
+            rsquared (float) R-squared value
+            pvalues (array-like) P-values of the Y-intercept and slope
+            params (array-like) the Y-intercept and slope
         """
-        self._exog = exog
-        self._regression_result = regression_result
-        self._std_err, self._conf_lower, self._conf_upper = wls_prediction_std(regression_result, exog=exog)
-
-        try:
-            LOG.debug(regression_result.summary())
-        except (ValueWarning, UserWarning) as exc:
-            LOG.warning(exc)
-
+        self._prediction = prediction
+        self._conf_lower = confidence_lower
+        self._conf_upper = confidence_upper
+        self._rsquared = rsquared
+        self._pvalues = pvalues
+        self._params = params
+
+        LOG.debug("Forecast prediction: %s", self.prediction)
         LOG.debug("Forecast interval lower-bound: %s", self.confidence_lower)
         LOG.debug("Forecast interval upper-bound: %s", self.confidence_upper)
 
     @property
     def prediction(self):
-        """Forecast prediction.
-
-        Args:
-            to_predict (array-like) - values to predict; uses model training values if not set.
-
-        Returns:
-            (array-like) - an nparray of prediction values or empty list
-        """
-        # predict() returns the same number of elements as the number of input observations
-        prediction = []
-        try:
-            if self._exog is not None:
-                prediction = self._regression_result.predict(sm.add_constant(self._exog))
-            else:
-                prediction = self._regression_result.predict()
-        except ValueError as exc:
-            LOG.error(exc)
-        LOG.debug("Forecast prediction: %s", prediction)
-        return prediction
+        """Forecast prediction."""
+        return self._prediction
 
     @property
     def confidence_lower(self):
@@ -445,7 +501,7 @@ class LinearForecastResult:
     @property
     def rsquared(self):
         """Forecast R-squared value."""
-        return self._regression_result.rsquared
+        return float(self._rsquared)
 
     @property
     def pvalues(self):
@@ -457,34 +513,33 @@ class LinearForecastResult:
             (str) or [(str), (str)]
         """
         f_format = f"%.{Forecast.PRECISION}f"  # avoid converting floats to e-notation
-        if len(self._regression_result.pvalues.tolist()) == 1:
-            return f_format % self._regression_result.pvalues.tolist()[0]
+        pvalues = np.asarray(self._pvalues).tolist()
+        if len(pvalues) == 1:
+            return f_format % pvalues[0]
         else:
-            return [f_format % item for item in self._regression_result.pvalues.tolist()]
+            return [f_format % item for item in pvalues]
 
     @property
     def slope(self):
         """Slope estimate of linear regression.
 
         For a basic linear regression, params is always a list of two values - the slope and the Y-intercept.
-        This assumption is not true for more advanced cases using other types of least-squares regressions.
 
         Returns:
             (float) the estimated slope param
         """
-        return self._regression_result.params[1]
+        return self._params[1]
 
     @property
     def intercept(self):
         """Y-intercept estimate of linear regression.
 
         For a basic linear regression, params is always a list of two values - the slope and the Y-intercept.
-        This assumption is not true for more advanced cases using other types of least-squares regressions.
 
         Returns:
             (float) the estimated Y-intercept param
         """
-        return self._regression_result.params[0]
+        return self._params[0]
 
 
 class AWSForecast(Forecast):
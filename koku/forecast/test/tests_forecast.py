@@ -24,7 +24,7 @@ from decimal import Decimal
 from unittest.mock import Mock
 from unittest.mock import patch
 
-from statsmodels.tools.sm_exceptions import ValueWarning
+import numpy as np
 
 from api.forecast.views import AWSCostForecastView
 from api.forecast.views import AzureCostForecastView
@@ -45,6 +45,7 @@ from forecast import OCPAllForecast
 from forecast import OCPAWSForecast
 from forecast import OCPAzureForecast
 from forecast import OCPForecast
+from forecast.forecast import fit_linear_forecasts
 from forecast.forecast import LinearForecastResult
 from reporting.provider.gcp.models import GCPCostSummary
 from reporting.provider.gcp.models import GCPCostSummaryByAccount
@@ -170,21 +171,67 @@ class AWSForecastTest(IamTestCase):
                     self.assertEqual(forecast.query_range, test["expected"])
 
     def test_remove_outliers(self):
-        """Test that we remove outliers before predicting."""
+        """Test that outliers of each series are masked before predicting."""
         params = self.mocked_query_params("?", AWSCostForecastView)
         dh = DateHelper()
         days_in_month = dh.this_month_end.day
-        data = {}
-        for i in range(days_in_month):
-            data[dh.this_month_start + timedelta(days=i)] = Decimal(20)
+        costs = np.full((days_in_month, 2), 20.0)
 
-        outlier = Decimal(100)
-        data[dh.this_month_start] = outlier
+        outlier = 100.0
+        costs[0, 0] = outlier
         forecast = AWSForecast(params)
-        result = forecast._remove_outliers(data)
+        result = forecast._inlier_mask(costs)
 
-        self.assertNotIn(dh.this_month_start, result.keys())
-        self.assertNotIn(outlier, result.values())
+        self.assertEqual(result.shape, costs.shape)
+        self.assertFalse(result[0, 0])
+        self.assertTrue(result[1:, 0].all())
+        self.assertTrue(result[:, 1].all())
+
+    def test_cached_predict(self):
+        """Test that the prediction is cached until the tenant's data is updated."""
+        params = self.mocked_query_params("?", AWSCostForecastView)
+        instance = AWSForecast(params)
+        updated = datetime(2000, 1, 1, random.randint(0, 23), random.randint(0, 59))
+        provider_stats = [
+            {"count": 1, "updated": updated},
+            {"count": 1, "updated": updated},
+            {"count": 1, "updated": updated + timedelta(hours=1)},
+        ]
+        with patch("forecast.forecast.Provider.objects") as mock_providers:
+            mock_providers.filter.return_value.aggregate.side_effect = provider_stats
+            with patch.object(AWSForecast, "predict", side_effect=[["first"], ["second"]]) as mock_predict:
+                self.assertEqual(instance.cached_predict(), ["first"])
+                self.assertEqual(instance.cached_predict(), ["first"])
+                self.assertEqual(instance.cached_predict(), ["second"])
+        self.assertEqual(mock_predict.call_count, 2)
+
+    def test_predict_single_query(self):
+        """Test that predict() reads every cost series at once."""
+        dh = DateHelper()
+        rows = [
+            {
+                "usage_start": (dh.this_month_start + timedelta(days=n)).date(),
+                "total_cost": Decimal(5),
+                "infrastructure_cost": Decimal(3),
+                "supplementary_cost": Decimal(2),
+            }
+            for n in range(10)
+        ]
+        mocked_table = Mock()
+        mocked_qset = mocked_table.objects.filter.return_value.order_by.return_value.values.return_value.annotate
+        mocked_qset.return_value.values.return_value = rows + rows[:1]
+
+        params = self.mocked_query_params("?", AWSCostForecastView)
+        instance = AWSForecast(params)
+        instance.cost_summary_table = mocked_table
+        dates, costs = instance._get_cost_series(rows + rows[:1])
+        instance.predict()
+
+        mocked_qset.return_value.values.assert_called_once_with("usage_start", *AWSForecast.COST_FIELDS)
+        self.assertEqual(dates, [row["usage_start"] for row in rows])
+        self.assertEqual(costs.dtype, np.float64)
+        self.assertEqual(costs[0].tolist(), [10, 6, 4])
+        self.assertEqual(costs[1].tolist(), [5, 3, 2])
 
     def test_predict_flat(self):
         """Test that predict() returns expected values for flat costs."""
@@ -798,25 +845,38 @@ class OCPAzureForecastTest(IamTestCase):
 class LinearForecastResultTest(IamTestCase):
     """Tests the LinearForecastResult class."""
 
-    @patch("forecast.forecast.wls_prediction_std", return_value=(1, 2, 3))
-    def test_constructor_logging(self, _):
-        """Test that the constructor logs messages."""
-        fake_results = Mock(summary=Mock(side_effect=ValueWarning("test")))
-
-        with self.assertLogs(logger="forecast.forecast", level=logging.WARNING):
-            LinearForecastResult(fake_results)
-
-    @patch("forecast.forecast.wls_prediction_std", return_value=(1, 2, 3))
-    def test_pvalues_slope_intercept(self, _):
+    def test_pvalues_slope_intercept(self):
         """Test the slope, intercept, and pvalues properties."""
-        fake_results = Mock(
-            summary=Mock(return_value="this is a test summary"),
-            pvalues=Mock(tolist=Mock(return_value=[99999, 88888])),
-            params=[66666, 77777],
-        )
-
-        lfr = LinearForecastResult(fake_results)
+        lfr = LinearForecastResult([1], [0], [2], 0.5, np.array([99999, 88888]), np.array([66666, 77777]))
 
         self.assertEqual(lfr.pvalues, ["99999.00000000", "88888.00000000"])
         self.assertEqual(lfr.slope, 77777)
         self.assertEqual(lfr.intercept, 66666)
+        self.assertEqual(lfr.rsquared, 0.5)
+
+    def test_fit_linear_forecasts(self):
+        """Test that every series is fitted by least squares on its own observations."""
+        rng = np.random.default_rng(42)
+        x = np.arange(20, dtype=float)
+        y = np.stack([3 + 2 * x + rng.normal(size=20), 5 - x + rng.normal(size=20)], axis=1)
+        mask = np.ones(y.shape, dtype=bool)
+        mask[3, 1] = False
+        to_predict = np.stack([x[-1] + 1 + np.arange(3)] * 2, axis=1)
+
+        results = fit_linear_forecasts(x, y, mask, to_predict)
+
+        self.assertEqual(len(results), 2)
+        for column, result in enumerate(results):
+            with self.subTest(column=column):
+                fitted = mask[:, column]
+                exog = np.stack([np.ones(fitted.sum()), x[fitted]], axis=1)
+                params, sse, _, _ = np.linalg.lstsq(exog, y[fitted, column], rcond=None)
+                tss = ((y[fitted, column] - y[fitted, column].mean()) ** 2).sum()
+                self.assertAlmostEqual(result.intercept, params[0])
+                self.assertAlmostEqual(result.slope, params[1])
+                self.assertAlmostEqual(result.rsquared, 1 - sse[0] / tss)
+                np.testing.assert_allclose(result.prediction, params[0] + params[1] * to_predict[:, column])
+                self.assertTrue((result.confidence_lower < result.prediction).all())
+                self.assertTrue((result.confidence_upper > result.prediction).all())
+                for pvalue in result.pvalues:
+                    self.assertLess(float(pvalue), 0.05)
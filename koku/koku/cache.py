@@ -16,13 +16,20 @@
 #
 """Cache functions."""
 import logging
+import threading
+from collections import OrderedDict
+from uuid import uuid4
 
 from django.conf import settings
 from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.core.cache.backends.dummy import DummyCache
 from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django_redis.cache import omit_exception
 from django_redis.cache import RedisCache
 from redis import Redis
+from tenant_schemas.utils import schema_context
 
 from api.provider.models import Provider
 
@@ -44,6 +51,79 @@ OPENSHIFT_AZURE_CACHE_PREFIX = "openshift-azure-view"
 OPENSHIFT_ALL_CACHE_PREFIX = "openshift-all-view"
 SOURCES_PREFIX = "sources"
 
+VIEW_CACHE_PREFIXES = (
+    AWS_CACHE_PREFIX,
+    AZURE_CACHE_PREFIX,
+    GCP_CACHE_PREFIX,
+    OPENSHIFT_CACHE_PREFIX,
+    OPENSHIFT_AWS_CACHE_PREFIX,
+    OPENSHIFT_AZURE_CACHE_PREFIX,
+    OPENSHIFT_ALL_CACHE_PREFIX,
+    SOURCES_PREFIX,
+)
+VIEW_CACHE_INDEX_PREFIX = "view-cache-index"
+TAG_KEY_REGISTRY_PREFIX = "tag-key-registry"
+
+# Tag key sets kept in process, keyed by (schema, tag summary table, registry version)
+TAG_KEY_LRU_SIZE = 128
+_TAG_KEY_LRU = OrderedDict()
+_TAG_KEY_LRU_LOCK = threading.Lock()
+
+
+def get_view_cache_index_key(schema_name, cache_key_prefix):
+    """Return the Redis key of the set indexing a tenant's cached views for a prefix."""
+    return f"{schema_name}:{VIEW_CACHE_INDEX_PREFIX}:{cache_key_prefix}"
+
+
+def get_view_cache_key_prefix(key):
+    """Return the view cache prefix a cache_page key was created with, if any.
+
+    cache_page keys look like `views.decorators.cache.cache_page.<key_prefix>.GET.<hashes>`
+    and `views.decorators.cache.cache_header.<key_prefix>.<hash>`.
+    """
+    parts = key.split(".")
+    if len(parts) > 4 and parts[4] in VIEW_CACHE_PREFIXES:
+        return parts[4]
+    return None
+
+
+class KokuRedisCache(RedisCache):
+    """Redis cache that keeps a per-tenant index of the cached view keys.
+
+    Every cached view key is added to a set keyed by tenant and view prefix
+    so that invalidation only touches the keys belonging to that tenant.
+    """
+
+    @omit_exception
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None, nx=False, xx=False):
+        """Set the value and record the key in the tenant view index."""
+        result = self.client.set(key, value, timeout=timeout, version=version, client=client, nx=nx, xx=xx)
+        cache_key_prefix = get_view_cache_key_prefix(key)
+        if result and cache_key_prefix:
+            self._index_key(key, cache_key_prefix, timeout, version)
+        return result
+
+    def _index_key(self, key, cache_key_prefix, timeout, version):
+        """Add a cached view key to the index set of the current tenant."""
+        index_key = get_view_cache_index_key(connection.schema_name, cache_key_prefix)
+        redis_client = self.client.get_client(write=True)
+        pipeline = redis_client.pipeline()
+        pipeline.sadd(index_key, str(self.client.make_key(key, version=version)))
+        # Keep the index around as long as the newest key it holds
+        index_timeout = self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+        if index_timeout:
+            pipeline.expire(index_key, int(index_timeout))
+        pipeline.execute()
+
+
+def _invalidate_indexed_view_cache(cache, schema_name, cache_key_prefixes):
+    """Delete the keys recorded in the tenant view indexes for the given prefixes."""
+    redis_client = cache.client.get_client(write=True)
+    for cache_key_prefix in cache_key_prefixes:
+        index_key = get_view_cache_index_key(schema_name, cache_key_prefix)
+        keys_to_invalidate = redis_client.smembers(index_key)
+        redis_client.delete(index_key, *keys_to_invalidate)
+
 
 def invalidate_view_cache_for_tenant_and_cache_key(schema_name, cache_key_prefix=None):
     """Invalidate our view cache for a specific tenant and source type.
@@ -51,9 +131,15 @@ def invalidate_view_cache_for_tenant_and_cache_key(schema_name, cache_key_prefix
     If cache_key_prefix is None, all views will be invalidated.
     """
     cache = caches["default"]
-    if isinstance(cache, RedisCache):
+    if isinstance(cache, KokuRedisCache):
+        cache_key_prefixes = (cache_key_prefix,) if cache_key_prefix else VIEW_CACHE_PREFIXES
+        _invalidate_indexed_view_cache(cache, schema_name, cache_key_prefixes)
+        msg = f"Invalidated request cache for\n\ttenant: {schema_name}\n\tcache_key_prefix: {cache_key_prefix}"
+        LOG.info(msg)
+        return
+    elif isinstance(cache, RedisCache):
         cache = Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB)
-        all_keys = cache.keys("*")
+        all_keys = cache.scan_iter(match=f"{schema_name}:*")
         all_keys = [key.decode("utf-8") for key in all_keys]
     elif isinstance(cache, LocMemCache):
         all_keys = cache._cache.keys()
@@ -82,8 +168,73 @@ def invalidate_view_cache_for_tenant_and_cache_key(schema_name, cache_key_prefix
     LOG.info(msg)
 
 
+def get_tag_key_registry_version_key(schema_name):
+    """Return the cache key holding the current version of a tenant's tag key registry."""
+    return f"{schema_name}:{TAG_KEY_REGISTRY_PREFIX}:version"
+
+
+def get_tag_keys(schema_name, model):
+    """Return the set of tag keys in one of a tenant's tag summary tables.
+
+    The keys are shared across processes through the default cache under a
+    per-tenant registry version, and recent versions are kept in a local LRU,
+    so most requests cost a single cache lookup instead of a table scan.
+
+    Args:
+        schema_name (str): The tenant schema
+        model (Model): The tag summary model holding the keys
+
+    Returns:
+        (frozenset): The tag keys
+
+    """
+    cache = caches["default"]
+    table = model._meta.db_table
+    with schema_context(schema_name):
+        version_key = get_tag_key_registry_version_key(schema_name)
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, uuid4().hex, timeout=None)
+            version = cache.get(version_key)
+        if version is None:
+            # Caching is disabled or unavailable, so the local copy could never be invalidated
+            return frozenset(model.objects.values_list("key", flat=True))
+
+        lru_key = (schema_name, table, version)
+        with _TAG_KEY_LRU_LOCK:
+            tag_keys = _TAG_KEY_LRU.get(lru_key)
+            if tag_keys is not None:
+                _TAG_KEY_LRU.move_to_end(lru_key)
+                return tag_keys
+
+        cache_key = f"{schema_name}:{TAG_KEY_REGISTRY_PREFIX}:{table}:{version}"
+        tag_keys = cache.get(cache_key)
+        if tag_keys is None:
+            tag_keys = frozenset(model.objects.values_list("key", flat=True))
+            cache.set(cache_key, tag_keys)
+
+    with _TAG_KEY_LRU_LOCK:
+        _TAG_KEY_LRU[lru_key] = tag_keys
+        _TAG_KEY_LRU.move_to_end(lru_key)
+        while len(_TAG_KEY_LRU) > TAG_KEY_LRU_SIZE:
+            _TAG_KEY_LRU.popitem(last=False)
+    return tag_keys
+
+
+def invalidate_tag_keys_for_tenant(schema_name):
+    """Invalidate the tag key registry of a tenant in every process.
+
+    Dropping the version moves readers to a new one, which misses both the
+    shared cache and the local LRUs.
+    """
+    with schema_context(schema_name):
+        caches["default"].delete(get_tag_key_registry_version_key(schema_name))
+    LOG.info(f"Invalidated tag key registry for tenant: {schema_name}")
+
+
 def invalidate_view_cache_for_tenant_and_source_type(schema_name, source_type):
     """"Invalidate our view cache for a specific tenant and source type."""
+    invalidate_tag_keys_for_tenant(schema_name)
     cache_key_prefixes = ()
     if source_type in (Provider.PROVIDER_AWS, Provider.PROVIDER_AWS_LOCAL):
         cache_key_prefixes = (AWS_CACHE_PREFIX, OPENSHIFT_AWS_CACHE_PREFIX, OPENSHIFT_ALL_CACHE_PREFIX)
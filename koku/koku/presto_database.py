@@ -1,16 +1,34 @@
 import logging
 import os
 import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from decimal import Decimal
 
 import prestodb
 import sqlparse
 from prestodb.exceptions import PrestoQueryError
 from prestodb.transaction import IsolationLevel
+from prometheus_client import Counter
+from prometheus_client import Histogram
 
 
 LOG = logging.getLogger(__name__)
 
+PRESTO_STATEMENT_DURATION = Histogram(
+    "presto_statement_duration_seconds",
+    "Time spent executing a Presto statement and fetching its results",
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, float("inf")),
+)
+PRESTO_CONNECTIONS_CREATED_COUNTER = Counter(
+    "presto_connections_created", "Number of Presto connections opened by the connection pool"
+)
+PRESTO_HEALTH_CHECK_FAILURES_COUNTER = Counter(
+    "presto_health_check_failures", "Number of pooled Presto connections discarded by a failed health check"
+)
+
 POSITIONAL_VARS = re.compile("%s")
 NAMED_VARS = re.compile(r"%(.+)s")
 EOT = re.compile(r",\s*\)$")  # pylint: disable=anomalous-backslash-in-string
@@ -78,19 +96,15 @@ def sql_mogrify(sql, params=None):
         return sql
 
 
-def connect(**connect_args):
+def _connect_args(**connect_args):
     """
-    Establish a prestodb connection.
+    Resolve prestodb connection arguments from keyword arguments and the environment.
     Keyword Params:
-        schema (str) : prestodb schema (required)
-        host (str) : prestodb hostname (can set from environment)
-        port (int) : prestodb port (can set from environment)
-        user (str) : prestodb user (can set from environment)
-        catalog (str) : prestodb catalog (can set from enviromment)
+        See connect()
     Returns:
-        prestodb.dbapi.Connection : connection to prestodb if successful
+        dict : Arguments for prestodb.dbapi.connect
     """
-    presto_connect_args = {
+    return {
         "host": (
             connect_args.get("host") or os.environ.get("TRINO_HOST") or os.environ.get("PRESTO_HOST") or "presto"
         ),
@@ -110,10 +124,206 @@ def connect(**connect_args):
         ),
         "schema": connect_args["schema"],
     }
-    conn = prestodb.dbapi.connect(**presto_connect_args)
+
+
+def connect(**connect_args):
+    """
+    Establish a prestodb connection.
+    Keyword Params:
+        schema (str) : prestodb schema (required)
+        host (str) : prestodb hostname (can set from environment)
+        port (int) : prestodb port (can set from environment)
+        user (str) : prestodb user (can set from environment)
+        catalog (str) : prestodb catalog (can set from enviromment)
+    Returns:
+        prestodb.dbapi.Connection : connection to prestodb if successful
+    """
+    conn = prestodb.dbapi.connect(**_connect_args(**connect_args))
     return conn
 
 
+class PrestoConnectionPool:
+    """
+    Bounded pool of prestodb connections shared by the threads of one process.
+
+    Idle connections are kept per set of connection arguments and reused, which keeps
+    the HTTP session to the coordinator alive between statements. A connection that has
+    been idle longer than the health check interval is checked with a trivial query
+    before it is handed out and replaced when the check fails. The pool notices when it
+    is used from a forked child process and starts empty there.
+    """
+
+    def __init__(self, max_size=None, health_check_interval=None, acquire_timeout=None):
+        """
+        Params:
+            max_size (int) : Maximum number of open connections (can set from environment)
+            health_check_interval (int) : Seconds a connection may sit idle before it is checked
+                                          again (can set from environment)
+            acquire_timeout (int) : Seconds to wait for a free connection (can set from environment)
+        """
+        self.max_size = int(max_size or os.environ.get("PRESTO_POOL_SIZE") or 4)
+        self.health_check_interval = int(
+            health_check_interval
+            if health_check_interval is not None
+            else os.environ.get("PRESTO_POOL_HEALTH_CHECK_SECONDS", 60)
+        )
+        self.acquire_timeout = int(acquire_timeout or os.environ.get("PRESTO_POOL_ACQUIRE_TIMEOUT") or 600)
+        self._reset()
+
+    def _reset(self):
+        """Forget every connection, used at creation and after a fork."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._idle = {}
+        self._in_use = 0
+
+    def _check_pid(self):
+        """Start over with an empty pool when running in a forked process."""
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _is_healthy(self, presto_conn):
+        """Return True if the connection can still run a statement."""
+        try:
+            presto_cur = _execute(_cursor(presto_conn), "SELECT 1")
+            _fetchall(presto_cur)
+        except Exception as e:
+            LOG.warning(f"Discarding pooled Presto connection after failed health check : {str(e)}")
+            PRESTO_HEALTH_CHECK_FAILURES_COUNTER.inc()
+            return False
+        return True
+
+    def _take_idle(self, key):
+        """Return a healthy idle connection for key, or None if there is none."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                presto_conn, last_used = idle.pop()
+            if time.monotonic() - last_used < self.health_check_interval or self._is_healthy(presto_conn):
+                return presto_conn
+            _close(presto_conn)
+
+    def _evict_idle(self):
+        """Close the least recently used idle connection if the pool is over its size."""
+        with self._lock:
+            open_count = self._in_use + sum(len(idle) for idle in self._idle.values())
+            candidates = [(idle[0][1], key) for key, idle in self._idle.items() if idle]
+            if open_count <= self.max_size or not candidates:
+                return
+            _, key = min(candidates)
+            presto_conn, _ = self._idle[key].popleft()
+        _close(presto_conn)
+
+    def acquire(self, **connect_args):
+        """
+        Check out a connection, reusing an idle one when possible.
+        Keyword Params:
+            See connect()
+        Returns:
+            prestodb.dbapi.Connection : connection to prestodb
+        """
+        self._check_pid()
+        presto_connect_args = _connect_args(**connect_args)
+        key = tuple(sorted((k, str(v)) for k, v in presto_connect_args.items()))
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No Presto connection available after {self.acquire_timeout} seconds")
+        with self._lock:
+            self._in_use += 1
+        try:
+            presto_conn = self._take_idle(key)
+            if presto_conn is None:
+                # Idle connections opened for other schemas count against the pool size too.
+                self._evict_idle()
+                presto_conn = prestodb.dbapi.connect(**presto_connect_args)
+                PRESTO_CONNECTIONS_CREATED_COUNTER.inc()
+        except Exception:
+            self._checkin()
+            raise
+        presto_conn._pool_key = key
+        return presto_conn
+
+    def release(self, presto_conn, discard=False):
+        """
+        Return a checked out connection to the pool.
+        Params:
+            presto_conn (prestodb.dbapi.Connection) : connection returned by acquire()
+            discard (bool) : close the connection instead of keeping it for reuse
+        """
+        if discard:
+            _close(presto_conn)
+        else:
+            with self._lock:
+                self._idle.setdefault(presto_conn._pool_key, deque()).append((presto_conn, time.monotonic()))
+        self._checkin()
+
+    def _checkin(self):
+        """Give back the slot of a checked out connection."""
+        with self._lock:
+            self._in_use -= 1
+        self._slots.release()
+
+    def clear(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for presto_conn, _ in connections:
+                _close(presto_conn)
+
+    @contextmanager
+    def connection(self, **connect_args):
+        """
+        Context manager handing out a pooled connection.
+
+        The work is committed when the block succeeds. When it raises, the work is
+        rolled back and the connection is closed instead of being returned to the pool.
+        Keyword Params:
+            See connect()
+        Yields:
+            prestodb.dbapi.Connection : connection to prestodb
+        """
+        presto_conn = self.acquire(**connect_args)
+        try:
+            yield presto_conn
+            presto_conn.commit()
+        except BaseException:
+            try:
+                presto_conn.rollback()
+            except RuntimeError:
+                # If presto has not started a transaction, it will throw
+                # a RuntimeError that we just want to ignore.
+                pass
+            self.release(presto_conn, discard=True)
+            raise
+        else:
+            self.release(presto_conn)
+
+
+def _close(presto_conn):
+    """Close a connection, ignoring errors from an already broken connection."""
+    try:
+        presto_conn.close()
+    except Exception as e:
+        LOG.debug(f"Error closing Presto connection : {str(e)}")
+
+
+POOL = PrestoConnectionPool()
+
+
+def connection(**connect_args):
+    """
+    Context manager handing out a connection from the process wide pool.
+    Keyword Params:
+        See connect()
+    Returns:
+        contextmanager yielding a prestodb.dbapi.Connection
+    """
+    return POOL.connection(**connect_args)
+
+
 def _fetchall(presto_cur):
     """
     Wrapper around the prestodb.dbapi.Cursor.fetchall() method
@@ -170,8 +380,9 @@ def execute(presto_conn, sql, params=None):
     presto_cur = _cursor(presto_conn)
     try:
         LOG.debug(f"Executing PRESTO SQL: {presto_stmt}")
-        presto_cur = _execute(presto_cur, presto_stmt)
-        results = _fetchall(presto_cur)
+        with PRESTO_STATEMENT_DURATION.time():
+            presto_cur = _execute(presto_cur, presto_stmt)
+            results = _fetchall(presto_cur)
     except PrestoQueryError as e:
         LOG.error(f"Presto Query Error : {str(e)}{os.linesep}{presto_stmt}")
         raise e
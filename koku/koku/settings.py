@@ -202,7 +202,7 @@ if "test" in sys.argv:
 else:
     CACHES = {
         "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            "BACKEND": "koku.cache.KokuRedisCache",
             "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
             "KEY_FUNCTION": "tenant_schemas.cache.make_key",
             "REVERSE_KEY_FUNCTION": "tenant_schemas.cache.reverse_key",
@@ -402,6 +402,12 @@ CORS_ALLOW_HEADERS = default_headers + ("x-rh-identity", "HTTP_X_RH_IDENTITY")
 
 APPEND_SLASH = False
 
+# Apply report API limit/offset pagination in the database instead of in memory
+ENABLE_DATABASE_PAGINATION = ENVIRONMENT.bool("ENABLE_DATABASE_PAGINATION", default=False)
+# Stream report CSV exports from a server-side cursor
+ENABLE_CSV_STREAMING = ENVIRONMENT.bool("ENABLE_CSV_STREAMING", default=False)
+CSV_STREAMING_CHUNK_SIZE = ENVIRONMENT.int("CSV_STREAMING_CHUNK_SIZE", default=2000)
+
 DISABLE_LOGGING = ENVIRONMENT.bool("DISABLE_LOGGING", default=False)
 # disable log messages less than CRITICAL when running unit tests.
 if len(sys.argv) > 1 and sys.argv[1] == "test" and DISABLE_LOGGING:
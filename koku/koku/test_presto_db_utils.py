@@ -1,14 +1,51 @@
 import datetime
+import threading
 import uuid
+from unittest.mock import patch
 
 from jinjasql import JinjaSql
 from prestodb.dbapi import Connection
+from prometheus_client import REGISTRY
 
 from . import presto_database as kpdb
 from api.iam.test.iam_test_case import FakePrestoConn
+from api.iam.test.iam_test_case import FakePrestoCur
 from api.iam.test.iam_test_case import IamTestCase
 
 
+class StandInPrestoCur(FakePrestoCur):
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, *args, **kwargs):
+        if self.conn.broken:
+            raise ConnectionError("coordinator went away")
+        self.conn.statements.append(args[0])
+
+
+class StandInPrestoConn(FakePrestoConn):
+    """Stand-in for a presto server connection that records what is done with it."""
+
+    def __init__(self, *args, **kwargs):
+        self.connect_args = kwargs
+        self.broken = False
+        self.closed = False
+        self.committed = False
+        self.statements = []
+
+    def cursor(self):
+        return StandInPrestoCur(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        raise RuntimeError("no transaction was started")
+
+    def close(self):
+        self.closed = True
+
+
 class TestPrestoDatabaseUtils(IamTestCase):
     def test_connect(self):
         """
@@ -111,3 +148,82 @@ select a from b;
         conn = FakePrestoConn()
         res = kpdb.executescript(conn, sqlscript)
         self.assertEqual(res, [["eek"], ["eek"]])
+
+
+@patch("koku.presto_database.prestodb.dbapi.connect", side_effect=StandInPrestoConn)
+class TestPrestoConnectionPool(IamTestCase):
+    def test_connection_reused(self, mock_connect):
+        """Test that consecutive statements for a schema share one connection."""
+        pool = kpdb.PrestoConnectionPool(max_size=2)
+        for _ in range(3):
+            with pool.connection(schema=self.schema_name) as conn:
+                kpdb.execute(conn, "select 1")
+        mock_connect.assert_called_once()
+        self.assertEqual(conn.statements, ["select 1"] * 3)
+        self.assertTrue(conn.committed)
+        self.assertFalse(conn.closed)
+
+    def test_connection_per_schema(self, mock_connect):
+        """Test that connections are not shared between schemas and the pool stays bounded."""
+        pool = kpdb.PrestoConnectionPool(max_size=1)
+        with pool.connection(schema=self.schema_name) as first:
+            pass
+        with pool.connection(schema="acct10002") as second:
+            pass
+        self.assertEqual(mock_connect.call_count, 2)
+        self.assertEqual(second.connect_args["schema"], "acct10002")
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+    def test_connection_error_discards(self, mock_connect):
+        """Test that a connection that raised is closed instead of reused."""
+        pool = kpdb.PrestoConnectionPool(max_size=1)
+        with self.assertRaises(ValueError):
+            with pool.connection(schema=self.schema_name) as conn:
+                raise ValueError("bad statement")
+        self.assertTrue(conn.closed)
+        with pool.connection(schema=self.schema_name) as new_conn:
+            pass
+        self.assertIsNot(new_conn, conn)
+
+    def test_health_check(self, mock_connect):
+        """Test that a connection failing its health check is replaced."""
+        pool = kpdb.PrestoConnectionPool(max_size=1, health_check_interval=0)
+        with pool.connection(schema=self.schema_name) as conn:
+            pass
+        with pool.connection(schema=self.schema_name) as same_conn:
+            pass
+        self.assertIs(same_conn, conn)
+        self.assertEqual(conn.statements, ["SELECT 1"])
+
+        conn.broken = True
+        with pool.connection(schema=self.schema_name) as new_conn:
+            pass
+        self.assertIsNot(new_conn, conn)
+        self.assertTrue(conn.closed)
+
+    def test_pool_bounded(self, mock_connect):
+        """Test that acquiring beyond the pool size waits and then times out."""
+        pool = kpdb.PrestoConnectionPool(max_size=1, acquire_timeout=1)
+        errors = []
+
+        def acquire():
+            try:
+                pool.acquire(schema=self.schema_name)
+            except TimeoutError as e:
+                errors.append(e)
+
+        conn = pool.acquire(schema=self.schema_name)
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+
+        pool.release(conn)
+        self.assertIs(pool.acquire(schema=self.schema_name), conn)
+
+    def test_execute_timed(self, mock_connect):
+        """Test that statement execution time is recorded."""
+        before = REGISTRY.get_sample_value("presto_statement_duration_seconds_count") or 0
+        kpdb.execute(StandInPrestoConn(), "select 1")
+        self.assertEqual(REGISTRY.get_sample_value("presto_statement_duration_seconds_count"), before + 1)
@@ -17,16 +17,25 @@
 """Test view caching functions."""
 import logging
 import random
+from unittest.mock import Mock
+from unittest.mock import patch
+from unittest.mock import PropertyMock
 
 from django.core.cache import caches
+from django.db import connection
 from django.test.utils import override_settings
 
 from api.iam.test.iam_test_case import IamTestCase
 from koku.cache import AWS_CACHE_PREFIX
 from koku.cache import AZURE_CACHE_PREFIX
+from koku.cache import get_tag_keys
+from koku.cache import get_view_cache_index_key
+from koku.cache import get_view_cache_key_prefix
+from koku.cache import invalidate_tag_keys_for_tenant
 from koku.cache import invalidate_view_cache_for_tenant_and_cache_key
 from koku.cache import invalidate_view_cache_for_tenant_and_source_type
 from koku.cache import KokuCacheError
+from koku.cache import KokuRedisCache
 from koku.cache import OPENSHIFT_ALL_CACHE_PREFIX
 from koku.cache import OPENSHIFT_AWS_CACHE_PREFIX
 from koku.cache import OPENSHIFT_AZURE_CACHE_PREFIX
@@ -132,3 +141,74 @@ class KokuCacheTest(IamTestCase):
 
         for key in azure_cache_data:
             self.assertIsNone(self.cache.get(key))
+
+    def test_get_view_cache_key_prefix(self):
+        """Test that the view prefix is parsed out of cache_page keys."""
+        for prefix in CACHE_PREFIXES:
+            page_key = f"views.decorators.cache.cache_page.{prefix}.GET.abc123.def456.en-us.UTC"
+            header_key = f"views.decorators.cache.cache_header.{prefix}.abc123.en-us.UTC"
+            self.assertEqual(get_view_cache_key_prefix(page_key), prefix)
+            self.assertEqual(get_view_cache_key_prefix(header_key), prefix)
+        self.assertIsNone(get_view_cache_key_prefix("rbac-access"))
+        self.assertIsNone(get_view_cache_key_prefix("views.decorators.cache.cache_page.other-view.GET.abc"))
+
+    def test_koku_redis_cache_indexes_view_keys(self):
+        """Test that cached view keys are recorded in the tenant view index."""
+        cache = KokuRedisCache("redis://localhost:6379/0", {"TIMEOUT": 3600})
+        mock_client = Mock()
+        mock_client.make_key.side_effect = lambda key, version=None: f"{self.schema_name}:1:{key}"
+        mock_pipeline = mock_client.get_client.return_value.pipeline.return_value
+        view_key = f"views.decorators.cache.cache_page.{self.cache_key_prefix}.GET.abc123"
+        with patch.object(KokuRedisCache, "client", new_callable=PropertyMock, return_value=mock_client):
+            cache.set(view_key, "value")
+            cache.set("rbac-access", "value")
+
+        self.assertEqual(mock_client.set.call_count, 2)
+        index_key = get_view_cache_index_key(connection.schema_name, self.cache_key_prefix)
+        mock_pipeline.sadd.assert_called_once_with(index_key, f"{self.schema_name}:1:{view_key}")
+        mock_pipeline.expire.assert_called_once_with(index_key, 3600)
+        mock_pipeline.execute.assert_called_once()
+
+    @override_settings(CACHES={"default": {"BACKEND": "koku.cache.KokuRedisCache", "LOCATION": "redis://"}})
+    def test_invalidate_view_cache_for_tenant_and_cache_key_indexed(self):
+        """Test that invalidation only deletes the keys in the tenant view index."""
+        mock_client = Mock()
+        redis_client = mock_client.get_client.return_value
+        tenant_keys = {f"{self.schema_name}:1:key1".encode(), f"{self.schema_name}:1:key2".encode()}
+        redis_client.smembers.return_value = tenant_keys
+        with patch.object(KokuRedisCache, "client", new_callable=PropertyMock, return_value=mock_client):
+            invalidate_view_cache_for_tenant_and_cache_key(self.schema_name, self.cache_key_prefix)
+
+        index_key = get_view_cache_index_key(self.schema_name, self.cache_key_prefix)
+        redis_client.smembers.assert_called_once_with(index_key)
+        redis_client.delete.assert_called_once_with(index_key, *tenant_keys)
+        redis_client.keys.assert_not_called()
+
+    def test_get_tag_keys_cached_until_invalidated(self):
+        """Test that tag keys are queried once and again after the registry is invalidated."""
+        values_list = Mock(return_value=["app", "environment"])
+        model = Mock(_meta=Mock(db_table="reporting_awstags_summary"), objects=Mock(values_list=values_list))
+
+        self.assertEqual(get_tag_keys(self.schema_name, model), frozenset({"app", "environment"}))
+        self.assertEqual(get_tag_keys(self.schema_name, model), frozenset({"app", "environment"}))
+        values_list.assert_called_once_with("key", flat=True)
+
+        values_list.return_value = ["app"]
+        invalidate_view_cache_for_tenant_and_source_type(self.schema_name, "AWS")
+        self.assertEqual(get_tag_keys(self.schema_name, model), frozenset({"app"}))
+        self.assertEqual(values_list.call_count, 2)
+
+        values_list.return_value = ["cost_center"]
+        invalidate_tag_keys_for_tenant(self.schema_name)
+        self.assertEqual(get_tag_keys(self.schema_name, model), frozenset({"cost_center"}))
+        self.assertEqual(values_list.call_count, 3)
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+    def test_get_tag_keys_dummy_cache(self):
+        """Test that tag keys are always queried when caching is disabled."""
+        values_list = Mock(return_value=["app"])
+        model = Mock(_meta=Mock(db_table="reporting_awstags_summary"), objects=Mock(values_list=values_list))
+
+        self.assertEqual(get_tag_keys(self.schema_name, model), frozenset({"app"}))
+        self.assertEqual(get_tag_keys(self.schema_name, model), frozenset({"app"}))
+        self.assertEqual(values_list.call_count, 2)
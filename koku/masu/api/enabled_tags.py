@@ -27,6 +27,7 @@ from rest_framework.response import Response
 from rest_framework.settings import api_settings
 from tenant_schemas.utils import schema_context
 
+from koku.cache import invalidate_tag_keys_for_tenant
 from reporting.models import OCPEnabledTagKeys
 
 
@@ -83,5 +84,6 @@ def enabled_tags(request):
                     OCPEnabledTagKeys.objects.filter(key=key).delete()
                 msg = f"Deleted enabled tags for schema: {schema_name}."
                 LOG.info(msg)
+        invalidate_tag_keys_for_tenant(schema_name)
 
         return Response({RESPONSE_KEY: tag_keys})
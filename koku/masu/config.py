@@ -102,6 +102,39 @@ class Config:
     REPORT_PROCESSING_BATCH_SIZE = int(os.getenv("REPORT_PROCESSING_BATCH_SIZE", default=100000))
     REPORT_PROCESSING_TIMEOUT_HOURS = int(os.getenv("REPORT_PROCESSING_TIMEOUT_HOURS", default=2))
 
+    # Number of report files of a manifest downloaded and processed by one task, 1 queues a task per file
+    REPORT_PROCESSING_FILES_PER_TASK = int(os.getenv("REPORT_PROCESSING_FILES_PER_TASK", default=1))
+
+    # Maximum number of entries kept in each dimension id cache of the AWS report processor
+    REPORT_PROCESSING_LOOKUP_CACHE_SIZE = int(os.getenv("REPORT_PROCESSING_LOOKUP_CACHE_SIZE", default=250000))
+
+    # Number of CSV rows read into memory at a time when converting to parquet
+    PARQUET_PROCESSING_BATCH_SIZE = int(os.getenv("PARQUET_PROCESSING_BATCH_SIZE", default=200000))
+
+    # Number of files of a manifest converted to parquet at the same time, 1 converts them one after another
+    PARQUET_PROCESSING_WORKERS = int(os.getenv("PARQUET_PROCESSING_WORKERS", default=1))
+
+    # Number of line items summarized by one statement, 0 summarizes fixed 5 day chunks
+    SUMMARY_CHUNK_ROWS = int(os.getenv("SUMMARY_CHUNK_ROWS", default=0))
+
+    # Summarize the date chunks of an AWS summary update as parallel tasks instead of one after another
+    SUMMARY_FAN_OUT = False if os.getenv("SUMMARY_FAN_OUT", "False") == "False" else True
+
+    # Maximum number of date chunks of one summary update summarized at the same time when fanning out
+    SUMMARY_FAN_OUT_CONCURRENCY = int(os.getenv("SUMMARY_FAN_OUT_CONCURRENCY", default=3))
+
+    # Process OCP usage reports as chunked DataFrames instead of row by row
+    OCP_COLUMNAR_PROCESSING = False if os.getenv("OCP_COLUMNAR_PROCESSING", "False") == "False" else True
+
+    # Download AWS report files larger than one part as parallel ranged GETs that resume after a restart
+    AWS_RANGED_DOWNLOAD = False if os.getenv("AWS_RANGED_DOWNLOAD", "False") == "False" else True
+
+    # Size in bytes of each ranged GET of an AWS report file
+    AWS_DOWNLOAD_PART_SIZE = int(os.getenv("AWS_DOWNLOAD_PART_SIZE", default=64 * 1024 * 1024))
+
+    # Number of ranged GETs of one AWS report file in flight at the same time
+    AWS_DOWNLOAD_WORKERS = int(os.getenv("AWS_DOWNLOAD_WORKERS", default=4))
+
     AWS_DATETIME_STR_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
     OCP_DATETIME_STR_FORMAT = "%Y-%m-%d %H:%M:%S +0000 UTC"
     AZURE_DATETIME_STR_FORMAT = "%Y-%m-%d"
@@ -139,3 +172,9 @@ class Config:
     KAFKA_CONNECT = False if os.getenv("KAFKA_CONNECT", "False") == "False" else True
 
     RETRY_SECONDS = int(os.getenv("RETRY_SECONDS", "10"))
+
+    # Number of upload messages processed concurrently, 1 processes them one at a time
+    KAFKA_CONSUMER_WORKERS = int(os.getenv("KAFKA_CONSUMER_WORKERS", "1"))
+
+    # Extract upload payloads while they download instead of staging the tarball and its contents
+    KAFKA_STREAM_PAYLOADS = False if os.getenv("KAFKA_STREAM_PAYLOADS", "False") == "False" else True
@@ -20,7 +20,10 @@ import pkgutil
 import uuid
 
 from dateutil.parser import parse
+from django.db.models import Count
+from django.db.models import DateField
 from django.db.models import F
+from django.db.models.functions import Cast
 from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 
@@ -183,6 +186,29 @@ class AWSReportDBAccessor(ReportDBAccessorBase):
 
             return {res["reservation_arn"]: res["id"] for res in reservs}
 
+    def get_line_item_counts_by_day(self, start_date, end_date, bill_ids):
+        """Return the number of line items of each usage day.
+
+        Args:
+            start_date (datetime.date) The first usage day to count.
+            end_date (datetime.date) The last usage day to count.
+            bill_ids (list)
+
+        Returns
+            (dict): {datetime.date: number of line items}
+
+        """
+        with schema_context(self.schema):
+            counts = (
+                AWSCostEntryLineItem.objects.filter(cost_entry_bill_id__in=bill_ids)
+                .annotate(usage_day=Cast("usage_start", DateField()))
+                .filter(usage_day__gte=start_date, usage_day__lte=end_date)
+                .values("usage_day")
+                .annotate(count=Count("id"))
+                .values_list("usage_day", "count")
+            )
+            return dict(counts)
+
     def populate_line_item_daily_table(self, start_date, end_date, bill_ids):
         """Populate the daily aggregate of line items table.
 
@@ -40,6 +40,7 @@ from koku.database import JSONBBuildObject
 from masu.config import Config
 from masu.database import AWS_CUR_TABLE_MAP
 from masu.database import OCP_REPORT_TABLE_MAP
+from masu.database.report_db_accessor_base import get_sql_template
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
 from masu.util.common import month_date_range_tuple
 from reporting.provider.ocp.models import OCPUsageLineItemDailySummary
@@ -592,28 +593,19 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
             "month": start_date.strftime("%m"),
         }
 
-        LOG.info("PRESTO OCP: Connect")
-        presto_conn = kpdb.connect(schema=self.schema)
+        LOG.info("PRESTO OCP: Acquire pooled connection")
         try:
-            LOG.info("PRESTO OCP: executing SQL buffer for OCP usage processing")
-            kpdb.executescript(
-                presto_conn, tmpl_summary_sql, params=summary_sql_params, preprocessor=self.jinja_sql.prepare_query
-            )
+            with kpdb.connection(schema=self.schema) as presto_conn:
+                LOG.info("PRESTO OCP: executing SQL buffer for OCP usage processing")
+                kpdb.executescript(
+                    presto_conn,
+                    tmpl_summary_sql,
+                    params=summary_sql_params,
+                    preprocessor=self.jinja_sql.prepare_query,
+                )
         except Exception as e:
             LOG.error(f"PRESTO OCP ERROR : {e}")
-            try:
-                presto_conn.rollback()
-            except RuntimeError:
-                # If presto has not started a transaction, it will throw
-                # a RuntimeError that we just want to ignore.
-                pass
             raise e
-        else:
-            LOG.info("PRESTO OCP: Commit actions")
-            presto_conn.commit()
-        finally:
-            LOG.info("PRESTO OCP: Close connection")
-            presto_conn.close()
 
     def populate_pod_label_summary_table_presto(self, report_period_ids, start_date, end_date, source):
         """
@@ -649,26 +641,16 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
             "month": start_date.strftime("%m"),
         }
 
-        LOG.info("PRESTO OCP: Connect")
-        presto_conn = kpdb.connect(schema=self.schema)
+        LOG.info("PRESTO OCP: Acquire pooled connection")
         try:
-            LOG.info("PRESTO OCP: executing SQL buffer for OCP tag/label processing")
-            kpdb.executescript(presto_conn, agg_sql, params=agg_sql_params, preprocessor=self.jinja_sql.prepare_query)
+            with kpdb.connection(schema=self.schema) as presto_conn:
+                LOG.info("PRESTO OCP: executing SQL buffer for OCP tag/label processing")
+                kpdb.executescript(
+                    presto_conn, agg_sql, params=agg_sql_params, preprocessor=self.jinja_sql.prepare_query
+                )
         except Exception as e:
             LOG.error(f"PRESTO OCP ERROR : {e}")
-            try:
-                presto_conn.rollback()
-            except RuntimeError:
-                # If presto has not started a transaction, it will throw
-                # a RuntimeError that we just want to ignore.
-                pass
             raise e
-        else:
-            LOG.info("PRESTO OCP: Commit actions")
-            presto_conn.commit()
-        finally:
-            LOG.info("PRESTO OCP: Close connection")
-            presto_conn.close()
 
     def update_summary_infrastructure_cost(self, cluster_id, start_date, end_date):
         """Populate the infrastructure costs on the daily usage summary table.
@@ -738,6 +720,48 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
         agg_sql, agg_sql_params = self.jinja_sql.prepare_query(agg_sql, agg_sql_params)
         self._execute_raw_sql_query(table_name, agg_sql, bind_params=list(agg_sql_params))
 
+    def populate_ui_summary_tables(self, tables, start_date=None, end_date=None, source_uuid=None):
+        """Replace the rows of a source and date range in the OCP UI summary tables.
+
+        The rows are rebuilt from the daily summary table, so the cost is
+        bound by the changed data rather than by the tenant's history.
+        Rows older than last month are removed.
+
+        Args:
+            tables (Iterable) Summary table names
+            start_date (datetime.date) The date to start populating the tables, defaults to last month's start.
+            end_date (datetime.date) The date to end on, defaults to no end.
+            source_uuid (str) The source whose rows are replaced, defaults to all sources.
+
+        Returns
+            (None)
+
+        """
+        window_start = DateHelper().last_month_start.date()
+        if isinstance(start_date, str):
+            start_date = parse(start_date).date()
+        if isinstance(end_date, str):
+            end_date = parse(end_date).date()
+        if isinstance(start_date, datetime.datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime.datetime):
+            end_date = end_date.date()
+        if start_date is None or start_date < window_start:
+            start_date = window_start
+
+        for table_name in tables:
+            summary_sql = get_sql_template(f"sql/{table_name}.sql")
+            summary_sql_params = {
+                "schema": self.schema,
+                "start_date": start_date,
+                "end_date": end_date,
+                "source_uuid": str(source_uuid) if source_uuid else None,
+            }
+            summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
+            self._execute_raw_sql_query(
+                table_name, summary_sql, start_date, end_date, bind_params=list(summary_sql_params)
+            )
+
     def populate_markup_cost(self, markup, start_date, end_date, cluster_id):
         """Set markup cost for OCP including infrastructure cost markup."""
         with schema_context(self.schema):
@@ -897,41 +921,82 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
                     first_curr_month, first_next_month, cluster_id, cluster_alias, rate_type, rate_dict
                 )
 
+    def _upsert_monthly_cost(
+        self, cost_type, rate_source, rates, start_date, end_date, cluster_id, cluster_alias, rate_type
+    ):
+        """Update or insert the monthly cost rows for one month in a single statement.
+
+        Args:
+            cost_type (str): The monthly cost type, one of Node, Cluster or PVC
+            rate_source (str): flat for a single rate, tag for tag value rates
+                or default for tag default rates
+            rates (list): Rate rows with rate and optional tag_key, tag_value and defined_values
+            start_date (datetime): The first day of the month
+            end_date (datetime): The first day of the next month
+            cluster_id (str): The cluster to update
+            cluster_alias (str): The cluster alias
+            rate_type (str): The cost type, Infrastructure or Supplementary
+
+        Returns
+            (None)
+
+        """
+        if not rates:
+            return
+        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
+        if report_period is None and cost_type == "Cluster" and rate_source != "default":
+            return
+
+        table_name = OCP_REPORT_TABLE_MAP["line_item_daily_summary"]
+        monthly_cost_sql = get_sql_template("sql/reporting_ocpusagelineitem_daily_summary_monthly_cost.sql")
+        monthly_cost_sql_params = {
+            "schema": self.schema,
+            "cost_type": cost_type,
+            "rate_source": rate_source,
+            "rates": json.dumps(rates),
+            "cost_column": f"{rate_type.lower()}_monthly_cost",
+            "labels_field": "volume_labels" if cost_type == "PVC" else "pod_labels",
+            "start_date": str(start_date),
+            "end_date": str(end_date),
+            "report_period_id": report_period.id if report_period else None,
+            "cluster_id": cluster_id,
+            "cluster_alias": cluster_alias,
+        }
+        monthly_cost_sql, monthly_cost_sql_params = self.jinja_sql.prepare_query(
+            monthly_cost_sql, monthly_cost_sql_params
+        )
+        LOG.info("Populating %s %s %s monthly costs for cluster %s.", cost_type, rate_source, rate_type, cluster_id)
+        self._execute_raw_sql_query(
+            table_name, monthly_cost_sql, start_date, end_date, bind_params=list(monthly_cost_sql_params)
+        )
+
+    @staticmethod
+    def _get_monthly_tag_rates(rate_dict):
+        """Flatten a {tag_key: {tag_value: rate}} dictionary into rate rows."""
+        return [
+            {"tag_key": tag_key, "tag_value": value_name, "rate": str(rate_value)}
+            for tag_key, tag_values in (rate_dict or {}).items()
+            for value_name, rate_value in tag_values.items()
+        ]
+
+    @staticmethod
+    def _get_monthly_tag_default_rates(rate_dict):
+        """Flatten a {tag_key: {default_value, defined_keys}} dictionary into rate rows."""
+        return [
+            {
+                "tag_key": tag_key,
+                "rate": str(tag_values.get("default_value")),
+                "defined_values": list(tag_values.get("defined_keys")),
+            }
+            for tag_key, tag_values in (rate_dict or {}).items()
+        ]
+
     def upsert_monthly_node_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, node_cost
     ):
         """Update or insert daily summary line item for node cost."""
-        unique_nodes = self.get_distinct_nodes(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for node in unique_nodes:
-                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start=start_date,
-                    usage_end=start_date,
-                    report_period=report_period,
-                    cluster_id=cluster_id,
-                    cluster_alias=cluster_alias,
-                    monthly_cost_type="Node",
-                    node=node,
-                ).first()
-                if not line_item:
-                    line_item = OCPUsageLineItemDailySummary(
-                        uuid=uuid.uuid4(),
-                        usage_start=start_date,
-                        usage_end=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="Node",
-                        node=node,
-                    )
-                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                    LOG.info("Node (%s) has a monthly infrastructure cost of %s.", node, node_cost)
-                    line_item.infrastructure_monthly_cost = node_cost
-                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                    LOG.info("Node (%s) has a monthly supplemenarty cost of %s.", node, node_cost)
-                    line_item.supplementary_monthly_cost = node_cost
-                line_item.save()
+        rates = [{"rate": str(node_cost)}]
+        self._upsert_monthly_cost("Node", "flat", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def tag_upsert_monthly_node_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict
@@ -943,67 +1008,8 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
         that contains the tag key:value pair,
         if it does then the price is added to the monthly cost.
         """
-        unique_nodes = self.get_distinct_nodes(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for node in unique_nodes:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        for value_name, rate_value in tag_values.items():
-                            # this makes sure that there is an entry for that node
-                            # that contains the specified key_value pair
-                            item_check = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start__gte=start_date,
-                                usage_end__lte=end_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                node=node,
-                                pod_labels__contains={tag_key: value_name},
-                            ).first()
-                            if item_check:
-                                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                    usage_start=start_date,
-                                    usage_end=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="Node",
-                                    node=node,
-                                ).first()
-                                if not line_item:
-                                    line_item = OCPUsageLineItemDailySummary(
-                                        uuid=uuid.uuid4(),
-                                        usage_start=start_date,
-                                        usage_end=start_date,
-                                        report_period=report_period,
-                                        cluster_id=cluster_id,
-                                        cluster_alias=cluster_alias,
-                                        monthly_cost_type="Node",
-                                        node=node,
-                                    )
-                                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                    LOG.info("Node (%s) has a monthly infrastructure cost of %s.", node, rate_value)
-                                    line_item.infrastructure_monthly_cost = (
-                                        Coalesce(
-                                            line_item.infrastructure_monthly_cost,
-                                            Value(0.0),
-                                            output_field=DecimalField(),
-                                        )
-                                        + rate_value
-                                    )
-                                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                    LOG.info("Node (%s) has a monthly supplemenarty cost of %s.", node, rate_value)
-                                    line_item.supplementary_monthly_cost = (
-                                        Coalesce(
-                                            line_item.supplementary_monthly_cost,
-                                            Value(0.0),
-                                            output_field=DecimalField(),
-                                        )
-                                        + rate_value
-                                    )
-                                line_item.save()
+        rates = self._get_monthly_tag_rates(rate_dict)
+        self._upsert_monthly_cost("Node", "tag", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def tag_upsert_monthly_default_node_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict
@@ -1011,187 +1017,32 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
         """
         Update or insert daily summary line item for node cost.
         It checks to see if a line item exists for each node
-        that contains the tag key:value pair,
-        if it does then the price is added to the monthly cost.
+        that contains the tag key with a value that has no defined rate,
+        if it does then the default price is added to the monthly cost
+        once for each such value.
         """
-        unique_nodes = self.get_distinct_nodes(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for node in unique_nodes:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        tag_default = tag_values.get("default_value")
-                        values_to_skip = tag_values.get("defined_keys")
-                        item_check = OCPUsageLineItemDailySummary.objects.filter(
-                            usage_start__gte=start_date,
-                            usage_end__lte=end_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            node=node,
-                            pod_labels__has_key=tag_key,
-                        )
-                        for value in values_to_skip:
-                            item_check = item_check.exclude(pod_labels__contains={tag_key: value})
-                        # this won't run if there are no matching items and item_check will continue to be
-                        # filtered until there are no items left
-                        while item_check:
-                            # get the first value for our tag key and exclude it from the queryset for the next check
-                            # will remove values until there are none left
-                            tag_key_value = item_check.first().pod_labels.get(tag_key)
-                            item_check = item_check.exclude(pod_labels__contains={tag_key: tag_key_value})
-                            line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start=start_date,
-                                usage_end=start_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                monthly_cost_type="Node",
-                                node=node,
-                            ).first()
-                            if not line_item:
-                                line_item = OCPUsageLineItemDailySummary(
-                                    uuid=uuid.uuid4(),
-                                    usage_start=start_date,
-                                    usage_end=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="Node",
-                                    node=node,
-                                )
-                            if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                LOG.info(
-                                    "Node (%s) has a default monthly infrastructure cost of %s.", node, tag_default
-                                )
-                                line_item.infrastructure_monthly_cost = (
-                                    Coalesce(
-                                        line_item.infrastructure_monthly_cost, Value(0.0), output_field=DecimalField()
-                                    )
-                                    + tag_default
-                                )
-                            elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                LOG.info(
-                                    "Node (%s) has a default monthly supplemenarty cost of %s.", node, tag_default
-                                )
-                                line_item.supplementary_monthly_cost = (
-                                    Coalesce(
-                                        line_item.supplementary_monthly_cost, Value(0.0), output_field=DecimalField()
-                                    )
-                                    + tag_default
-                                )
-                            line_item.save()
+        rates = self._get_monthly_tag_default_rates(rate_dict)
+        self._upsert_monthly_cost("Node", "default", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def tag_upsert_monthly_default_pvc_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict
     ):
         """
-        Update or insert daily summary line item for node cost.
-        It checks to see if a line item exists for each node
-        that contains the tag key:value pair,
-        if it does then the price is added to the monthly cost.
+        Update or insert daily summary line item for PVC cost.
+        It checks to see if a line item exists for each PVC
+        that contains the tag key with a value that has no defined rate,
+        if it does then the default price is added to the monthly cost
+        once for each such value.
         """
-        unique_pvcs = self.get_distinct_pvcs(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for pvc, node in unique_pvcs:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        tag_default = tag_values.get("default_value")
-                        values_to_skip = tag_values.get("defined_keys")
-                        item_check = OCPUsageLineItemDailySummary.objects.filter(
-                            usage_start__gte=start_date,
-                            usage_end__lte=end_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            persistentvolumeclaim=pvc,
-                            node=node,
-                            volume_labels__has_key=tag_key,
-                        )
-                        for value in values_to_skip:
-                            item_check = item_check.exclude(volume_labels__contains={tag_key: value})
-                        # this won't run if there are no matching items and item_check will continue to be
-                        # filtered until there are no items left
-                        while item_check:
-                            # get the first value for our tag key and exclude it from the queryset for the next check
-                            # will remove values until there are none left
-                            tag_key_value = item_check.first().volume_labels.get(tag_key)
-                            item_check = item_check.exclude(volume_labels__contains={tag_key: tag_key_value})
-                            line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start=start_date,
-                                usage_end=start_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                monthly_cost_type="PVC",
-                                persistentvolumeclaim=pvc,
-                                node=node,
-                            ).first()
-                            if not line_item:
-                                line_item = OCPUsageLineItemDailySummary(
-                                    uuid=uuid.uuid4(),
-                                    usage_start=start_date,
-                                    usage_end=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="PVC",
-                                    persistentvolumeclaim=pvc,
-                                    node=node,
-                                )
-                            if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                LOG.info("PVC (%s) has a default monthly infrastructure cost of %s.", pvc, tag_default)
-                                line_item.infrastructure_monthly_cost = (
-                                    Coalesce(
-                                        line_item.infrastructure_monthly_cost, Value(0.0), output_field=DecimalField()
-                                    )
-                                    + tag_default
-                                )
-                            elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                LOG.info("PVC (%s) has a default monthly supplemenarty cost of %s.", pvc, tag_default)
-                                line_item.supplementary_monthly_cost = (
-                                    Coalesce(
-                                        line_item.supplementary_monthly_cost, Value(0.0), output_field=DecimalField()
-                                    )
-                                    + tag_default
-                                )
-                            line_item.save()
+        rates = self._get_monthly_tag_default_rates(rate_dict)
+        self._upsert_monthly_cost("PVC", "default", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def upsert_monthly_cluster_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, cluster_cost
     ):
         """Update or insert a daily summary line item for cluster cost."""
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        if report_period:
-            with schema_context(self.schema):
-                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start=start_date,
-                    usage_end=start_date,
-                    report_period=report_period,
-                    cluster_id=cluster_id,
-                    cluster_alias=cluster_alias,
-                    monthly_cost_type="Cluster",
-                ).first()
-                if not line_item:
-                    line_item = OCPUsageLineItemDailySummary(
-                        uuid=uuid.uuid4(),
-                        usage_start=start_date,
-                        usage_end=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="Cluster",
-                    )
-                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                    LOG.info("Cluster (%s) has a monthly infrastructure cost of %s.", cluster_id, cluster_cost)
-                    line_item.infrastructure_monthly_cost = cluster_cost
-                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                    LOG.info("Cluster (%s) has a monthly supplemenarty cost of %s.", cluster_id, cluster_cost)
-                    line_item.supplementary_monthly_cost = cluster_cost
-                line_item.save()
+        rates = [{"rate": str(cluster_cost)}]
+        self._upsert_monthly_cost("Cluster", "flat", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def tag_upsert_monthly_pvc_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict
@@ -1203,104 +1054,13 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
         that contains the tag key:value pair,
         if it does then the price is added to the monthly cost.
         """
-        unique_pvcs = self.get_distinct_pvcs(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for pvc, node in unique_pvcs:
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        for value_name, rate_value in tag_values.items():
-                            item_check = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start__gte=start_date,
-                                usage_end__lte=end_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                persistentvolumeclaim=pvc,
-                                node=node,
-                                volume_labels__contains={tag_key: value_name},
-                            ).first()
-                            if item_check:
-                                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                    usage_start=start_date,
-                                    usage_end=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="PVC",
-                                    persistentvolumeclaim=pvc,
-                                    node=node,
-                                ).first()
-                                if not line_item:
-                                    line_item = OCPUsageLineItemDailySummary(
-                                        uuid=uuid.uuid4(),
-                                        usage_start=start_date,
-                                        usage_end=start_date,
-                                        report_period=report_period,
-                                        cluster_id=cluster_id,
-                                        cluster_alias=cluster_alias,
-                                        monthly_cost_type="PVC",
-                                        persistentvolumeclaim=pvc,
-                                        node=node,
-                                    )
-                                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                    LOG.info("PVC (%s) has a monthly infrastructure cost of %s.", pvc, rate_value)
-                                    line_item.infrastructure_monthly_cost = (
-                                        Coalesce(
-                                            line_item.infrastructure_monthly_cost,
-                                            Value(0.0),
-                                            output_field=DecimalField(),
-                                        )
-                                        + rate_value
-                                    )
-                                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                    LOG.info("PVC (%s) has a monthly supplemenarty cost of %s.", pvc, rate_value)
-                                    line_item.supplementary_monthly_cost = (
-                                        Coalesce(
-                                            line_item.supplementary_monthly_cost,
-                                            Value(0.0),
-                                            output_field=DecimalField(),
-                                        )
-                                        + rate_value
-                                    )
-                                line_item.save()
+        rates = self._get_monthly_tag_rates(rate_dict)
+        self._upsert_monthly_cost("PVC", "tag", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def upsert_monthly_pvc_cost_line_item(self, start_date, end_date, cluster_id, cluster_alias, rate_type, pvc_cost):
         """Update or insert daily summary line item for pvc cost."""
-        unique_pvcs = self.get_distinct_pvcs(start_date, end_date, cluster_id)
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            for pvc, node in unique_pvcs:
-                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                    usage_start=start_date,
-                    usage_end=start_date,
-                    report_period=report_period,
-                    cluster_id=cluster_id,
-                    cluster_alias=cluster_alias,
-                    monthly_cost_type="PVC",
-                    persistentvolumeclaim=pvc,
-                    node=node,
-                ).first()
-                if not line_item:
-                    line_item = OCPUsageLineItemDailySummary(
-                        uuid=uuid.uuid4(),
-                        usage_start=start_date,
-                        usage_end=start_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        monthly_cost_type="PVC",
-                        persistentvolumeclaim=pvc,
-                        node=node,
-                    )
-                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                    LOG.info("PVC (%s) has a monthly infrastructure cost of %s.", pvc, pvc_cost)
-                    line_item.infrastructure_monthly_cost = pvc_cost
-                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                    LOG.info("PVC (%s) has a monthly supplemenarty cost of %s.", pvc, pvc_cost)
-                    line_item.supplementary_monthly_cost = pvc_cost
-                line_item.save()
+        rates = [{"rate": str(pvc_cost)}]
+        self._upsert_monthly_cost("PVC", "flat", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def tag_upsert_monthly_cluster_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict
@@ -1311,71 +1071,8 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
         that contains the tag key:value pair,
         if it does then the price is added to the monthly cost.
         """
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        if report_period:
-            with schema_context(self.schema):
-                if rate_dict is not None:
-                    for tag_key in rate_dict:
-                        tag_values = rate_dict.get(tag_key)
-                        for value_name, rate_value in tag_values.items():
-                            # this makes sure that there is an entry for that node
-                            # that contains the specified key_value pair
-                            item_check = line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                usage_start__gte=start_date,
-                                usage_end__lte=end_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                pod_labels__contains={tag_key: value_name},
-                            ).first()
-                            if item_check:
-                                line_item = OCPUsageLineItemDailySummary.objects.filter(
-                                    usage_start=start_date,
-                                    usage_end=start_date,
-                                    report_period=report_period,
-                                    cluster_id=cluster_id,
-                                    cluster_alias=cluster_alias,
-                                    monthly_cost_type="Cluster",
-                                ).first()
-                                if not line_item:
-                                    line_item = OCPUsageLineItemDailySummary(
-                                        uuid=uuid.uuid4(),
-                                        usage_start=start_date,
-                                        usage_end=start_date,
-                                        report_period=report_period,
-                                        cluster_id=cluster_id,
-                                        cluster_alias=cluster_alias,
-                                        monthly_cost_type="Cluster",
-                                    )
-                                if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                                    LOG.info(
-                                        "Cluster (%s) has a monthly infrastructure cost of %s from tag rates.",
-                                        cluster_id,
-                                        rate_value,
-                                    )
-                                    line_item.infrastructure_monthly_cost = (
-                                        Coalesce(
-                                            line_item.infrastructure_monthly_cost,
-                                            Value(0.0),
-                                            output_field=DecimalField(),
-                                        )
-                                        + rate_value
-                                    )
-                                elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                                    LOG.info(
-                                        "Cluster (%s) has a monthly supplemenarty cost of %s from tag rates.",
-                                        cluster_id,
-                                        rate_value,
-                                    )
-                                    line_item.supplementary_monthly_cost = (
-                                        Coalesce(
-                                            line_item.supplementary_monthly_cost,
-                                            Value(0.0),
-                                            output_field=DecimalField(),
-                                        )
-                                        + rate_value
-                                    )
-                                line_item.save()
+        rates = self._get_monthly_tag_rates(rate_dict)
+        self._upsert_monthly_cost("Cluster", "tag", rates, start_date, end_date, cluster_id, cluster_alias, rate_type)
 
     def tag_upsert_monthly_default_cluster_cost_line_item(
         self, start_date, end_date, cluster_id, cluster_alias, rate_type, rate_dict
@@ -1383,73 +1080,15 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
         """
         Update or insert daily summary line item for cluster cost.
 
-        It checks to see if a line item exists for each cluster
-        that contains the tag key:value pair,
-        if it does then the price is added to the monthly cost.
+        It checks to see if a line item exists for the cluster
+        that contains the tag key with a value that has no defined rate,
+        if it does then the default price is added to the monthly cost
+        once for each such value.
         """
-        report_period = self.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
-        with schema_context(self.schema):
-            if rate_dict is not None:
-                for tag_key in rate_dict:
-                    tag_values = rate_dict.get(tag_key)
-                    tag_default = tag_values.get("default_value")
-                    values_to_skip = tag_values.get("defined_keys")
-                    item_check = OCPUsageLineItemDailySummary.objects.filter(
-                        usage_start__gte=start_date,
-                        usage_end__lte=end_date,
-                        report_period=report_period,
-                        cluster_id=cluster_id,
-                        cluster_alias=cluster_alias,
-                        pod_labels__has_key=tag_key,
-                    )
-                    for value in values_to_skip:
-                        item_check = item_check.exclude(pod_labels__contains={tag_key: value})
-                    # this won't run if there are no matching items and item_check will continue to be
-                    # filtered until there are no items left
-                    while item_check:
-                        # get the first value for our tag key and exclude it from the queryset for the next check
-                        # will remove values until there are none left
-                        tag_key_value = item_check.first().pod_labels.get(tag_key)
-                        item_check = item_check.exclude(pod_labels__contains={tag_key: tag_key_value})
-                        line_item = OCPUsageLineItemDailySummary.objects.filter(
-                            usage_start=start_date,
-                            usage_end=start_date,
-                            report_period=report_period,
-                            cluster_id=cluster_id,
-                            cluster_alias=cluster_alias,
-                            monthly_cost_type="Cluster",
-                        ).first()
-                        if not line_item:
-                            line_item = OCPUsageLineItemDailySummary(
-                                uuid=uuid.uuid4(),
-                                usage_start=start_date,
-                                usage_end=start_date,
-                                report_period=report_period,
-                                cluster_id=cluster_id,
-                                cluster_alias=cluster_alias,
-                                monthly_cost_type="Cluster",
-                            )
-                        if rate_type == metric_constants.INFRASTRUCTURE_COST_TYPE:
-                            LOG.info(
-                                "Cluster (%s) has a default monthly infrastructure cost of %s.",
-                                cluster_id,
-                                tag_default,
-                            )
-                            line_item.infrastructure_monthly_cost = (
-                                Coalesce(
-                                    line_item.infrastructure_monthly_cost, Value(0.0), output_field=DecimalField()
-                                )
-                                + tag_default
-                            )
-                        elif rate_type == metric_constants.SUPPLEMENTARY_COST_TYPE:
-                            LOG.info(
-                                "Cluster (%s) has a default monthly supplemenarty cost of %s.", cluster_id, tag_default
-                            )
-                            line_item.supplementary_monthly_cost = (
-                                Coalesce(line_item.supplementary_monthly_cost, Value(0.0), output_field=DecimalField())
-                                + tag_default
-                            )
-                        line_item.save()
+        rates = self._get_monthly_tag_default_rates(rate_dict)
+        self._upsert_monthly_cost(
+            "Cluster", "default", rates, start_date, end_date, cluster_id, cluster_alias, rate_type
+        )
 
     def remove_monthly_cost(self, start_date, end_date, cluster_id, cost_type):
         """Delete all monthly costs of a specific type over a date range."""
@@ -1584,14 +1223,11 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
             ),
         )
 
-    def populate_tag_usage_costs(  # noqa: C901
-        self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id
-    ):
+    def populate_tag_usage_costs(self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id):
         """
         Update the reporting_ocpusagelineitem_daily_summary table with
         usage costs based on tag rates.
-        Due to the way the tag_keys are stored it loops through all of
-        the tag keys to filter and update costs.
+        All tag rates of a cost type are applied together in one update.
 
         The data structure for infrastructure and supplementary rates are
         a dictionary that include the metric name, the tag key,
@@ -1603,66 +1239,20 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
                 }
             }
         """
-        # defines the usage type for each metric
-        metric_usage_type_map = {
-            "cpu_core_usage_per_hour": "cpu",
-            "cpu_core_request_per_hour": "cpu",
-            "memory_gb_usage_per_hour": "memory",
-            "memory_gb_request_per_hour": "memory",
-            "storage_gb_usage_per_month": "storage",
-            "storage_gb_request_per_month": "storage",
+        rate_types = {
+            metric_constants.INFRASTRUCTURE_COST_TYPE: infrastructure_rates,
+            metric_constants.SUPPLEMENTARY_COST_TYPE: supplementary_rates,
         }
-        # define the rates so the loop can operate on both rate types
-        rate_types = [
-            {"rates": infrastructure_rates, "sql_file": "sql/infrastructure_tag_rates.sql"},
-            {"rates": supplementary_rates, "sql_file": "sql/supplementary_tag_rates.sql"},
-        ]
-        # Cast start_date and end_date to date object, if they aren't already
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        if isinstance(start_date, datetime.datetime):
-            start_date = start_date.date()
-            end_date = end_date.date()
-        # updates costs from tags
-        for rate_type in rate_types:
-            rate = rate_type.get("rates")
-            sql_file = rate_type.get("sql_file")
-            for metric in rate:
-                tags = rate.get(metric, {})
-                usage_type = metric_usage_type_map.get(metric)
-                if usage_type == "storage":
-                    labels_field = "volume_labels"
-                else:
-                    labels_field = "pod_labels"
-                table_name = OCP_REPORT_TABLE_MAP["line_item_daily_summary"]
-                for tag_key in tags:
-                    tag_vals = tags.get(tag_key, {})
-                    value_names = list(tag_vals.keys())
-                    for val_name in value_names:
-                        rate_value = tag_vals[val_name]
-                        key_value_pair = f'{{"{tag_key}": "{val_name}"}}'
-                        tag_rates_sql = pkgutil.get_data("masu.database", sql_file)
-                        tag_rates_sql = tag_rates_sql.decode("utf-8")
-                        tag_rates_sql_params = {
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "rate": rate_value,
-                            "cluster_id": cluster_id,
-                            "schema": self.schema,
-                            "usage_type": usage_type,
-                            "metric": metric,
-                            "k_v_pair": key_value_pair,
-                            "labels_field": labels_field,
-                        }
-                        tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(
-                            tag_rates_sql, tag_rates_sql_params
-                        )
-                        self._execute_raw_sql_query(
-                            table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
-                        )
-
-    def populate_tag_usage_default_costs(  # noqa: C901
+        for rate_type, rates in rate_types.items():
+            tag_rates = [
+                {"metric": metric, "tag_key": tag_key, "tag_value": value_name, "rate": str(rate_value)}
+                for metric, tags in rates.items()
+                for tag_key, tag_values in tags.items()
+                for value_name, rate_value in tag_values.items()
+            ]
+            self._populate_tag_usage_cost_rates("tag", rate_type, tag_rates, start_date, end_date, cluster_id)
+
+    def populate_tag_usage_default_costs(
         self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id
     ):
         """
@@ -1682,6 +1272,41 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
                 }
             }
         """
+        rate_types = {
+            metric_constants.INFRASTRUCTURE_COST_TYPE: infrastructure_rates,
+            metric_constants.SUPPLEMENTARY_COST_TYPE: supplementary_rates,
+        }
+        for rate_type, rates in rate_types.items():
+            default_rates = [
+                {
+                    "metric": metric,
+                    "tag_key": tag_key,
+                    "defined_values": list(tag_values.get("defined_keys", [])),
+                    "rate": str(tag_values.get("default_value", 0)),
+                }
+                for metric, tags in rates.items()
+                for tag_key, tag_values in tags.items()
+                if tag_values.get("default_value", 0) != 0
+            ]
+            self._populate_tag_usage_cost_rates("default", rate_type, default_rates, start_date, end_date, cluster_id)
+
+    def _populate_tag_usage_cost_rates(self, rate_source, rate_type, rates, start_date, end_date, cluster_id):
+        """Add the usage cost of a list of tag rates to the daily summary usage costs.
+
+        Args:
+            rate_source (str): tag for tag value rates or default for tag default rates
+            rate_type (str): The cost type, Infrastructure or Supplementary
+            rates (list): Rate rows with metric, tag_key, rate and either tag_value or defined_values
+            start_date (datetime.date, str): The first usage date to update
+            end_date (datetime.date, str): The last usage date to update
+            cluster_id (str): The cluster to update
+
+        Returns
+            (None)
+
+        """
+        if not rates:
+            return
         # defines the usage type for each metric
         metric_usage_type_map = {
             "cpu_core_usage_per_hour": "cpu",
@@ -1691,11 +1316,6 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
             "storage_gb_usage_per_month": "storage",
             "storage_gb_request_per_month": "storage",
         }
-        # define the rates so the loop can operate on both rate types
-        rate_types = [
-            {"rates": infrastructure_rates, "sql_file": "sql/default_infrastructure_tag_rates.sql"},
-            {"rates": supplementary_rates, "sql_file": "sql/default_supplementary_tag_rates.sql"},
-        ]
         # Cast start_date and end_date to date object, if they aren't already
         if isinstance(start_date, str):
             start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -1703,46 +1323,22 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
         if isinstance(start_date, datetime.datetime):
             start_date = start_date.date()
             end_date = end_date.date()
+        for rate in rates:
+            rate["usage_type"] = metric_usage_type_map.get(rate["metric"])
 
-        # updates costs from tags
-        for rate_type in rate_types:
-            rate = rate_type.get("rates")
-            sql_file = rate_type.get("sql_file")
-            for metric in rate:
-                tags = rate.get(metric, {})
-                usage_type = metric_usage_type_map.get(metric)
-                if usage_type == "storage":
-                    labels_field = "volume_labels"
-                else:
-                    labels_field = "pod_labels"
-                table_name = OCP_REPORT_TABLE_MAP["line_item_daily_summary"]
-                for tag_key in tags:
-                    key_value_pair = []
-                    tag_vals = tags.get(tag_key)
-                    rate_value = tag_vals.get("default_value", 0)
-                    if rate_value == 0:
-                        continue
-                    value_names = tag_vals.get("defined_keys", [])
-                    for value_to_skip in value_names:
-                        key_value_pair.append(f'{{"{tag_key}": "{value_to_skip}"}}')
-                    json.dumps(key_value_pair)
-                    tag_rates_sql = pkgutil.get_data("masu.database", sql_file)
-                    tag_rates_sql = tag_rates_sql.decode("utf-8")
-                    tag_rates_sql_params = {
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "rate": rate_value,
-                        "cluster_id": cluster_id,
-                        "schema": self.schema,
-                        "usage_type": usage_type,
-                        "metric": metric,
-                        "tag_key": tag_key,
-                        "k_v_pair": key_value_pair,
-                        "labels_field": labels_field,
-                    }
-                    tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(
-                        tag_rates_sql, tag_rates_sql_params
-                    )
-                    self._execute_raw_sql_query(
-                        table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
-                    )
+        table_name = OCP_REPORT_TABLE_MAP["line_item_daily_summary"]
+        tag_rates_sql = get_sql_template("sql/reporting_ocpusagelineitem_daily_summary_tag_rates.sql")
+        tag_rates_sql_params = {
+            "schema": self.schema,
+            "rate_source": rate_source,
+            "rates": json.dumps(rates),
+            "cost_column": f"{rate_type.lower()}_usage_cost",
+            "start_date": start_date,
+            "end_date": end_date,
+            "cluster_id": cluster_id,
+        }
+        tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(tag_rates_sql, tag_rates_sql_params)
+        LOG.info("Applying %d %s %s tag rates for cluster %s.", len(rates), rate_source, rate_type, cluster_id)
+        self._execute_raw_sql_query(
+            table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
+        )
@@ -16,9 +16,11 @@
 #
 """Database accessor for report data."""
 import logging
+import pkgutil
 import uuid
 from decimal import Decimal
 from decimal import InvalidOperation
+from functools import lru_cache
 
 import ciso8601
 import django.apps
@@ -36,6 +38,26 @@ from reporting_common import REPORT_COLUMN_MAP
 
 LOG = logging.getLogger(__name__)
 
+SQL_TEMPLATE_ENV = JinjaSql().env
+
+
+@lru_cache(maxsize=None)
+def get_sql_template(sql_file):
+    """Return the compiled JinjaSql template for a masu.database SQL file.
+
+    Each template is read and compiled once per process and can be passed
+    to JinjaSql.prepare_query in place of the SQL string.
+
+    Args:
+        sql_file (str): The path of the file relative to masu.database
+
+    Returns:
+        (jinja2.Template): The compiled template
+
+    """
+    sql = pkgutil.get_data("masu.database", sql_file).decode("utf-8")
+    return SQL_TEMPLATE_ENV.from_string(sql)
+
 
 class ReportSchema:
     """A container for the reporting table objects."""
@@ -351,18 +373,16 @@ class ReportDBAccessorBase(KokuDBAccess):
         LOG.info("Finished updating %s.", table)
 
     def _execute_presto_raw_sql_query(self, schema, sql, bind_params=None):
-        """Execute a single presto query"""
-        presto_conn = kpdb.connect(schema=schema)
-        presto_cur = presto_conn.cursor()
-        presto_cur.execute(sql, bind_params)
-        return presto_cur.fetchall()
+        """Execute a single presto query on a pooled connection"""
+        with kpdb.connection(schema=schema) as presto_conn:
+            return kpdb.execute(presto_conn, sql, params=bind_params)
 
     def _execute_presto_multipart_sql_query(
         self, schema, sql, bind_params=None, preprocessor=JinjaSql().prepare_query
     ):
-        """Execute multiple related SQL queries in Presto."""
-        presto_conn = kpdb.connect(schema=self.schema)
-        return kpdb.executescript(presto_conn, sql, params=bind_params, preprocessor=preprocessor)
+        """Execute multiple related SQL queries in Presto on one pooled connection."""
+        with kpdb.connection(schema=self.schema) as presto_conn:
+            return kpdb.executescript(presto_conn, sql, params=bind_params, preprocessor=preprocessor)
 
     def get_existing_partitions(self, table):
         if isinstance(table, str):
@@ -421,3 +441,83 @@ class ReportDBAccessorBase(KokuDBAccess):
             )
         if created:
             LOG.info(f"Created a new parttiion for {newpart.partition_of_table_name} : {newpart.table_name}")
+
+    def get_expired_partitions(self, table, expired_date):
+        """Return the monthly partitions of a table holding only data on or before the expired date.
+
+        The cleaners expire every bill or report period starting on or before
+        the expired date, so a monthly partition starting on or before it only
+        holds expired data. The default partition is never expired.
+
+        Args:
+            table (str or Model): The partitioned table
+            expired_date (datetime.datetime): The cutoff date for removing data
+
+        Returns:
+            ([PartitionedTable]) The expired partitions
+
+        """
+        expired_date = expired_date.date() if hasattr(expired_date, "date") else expired_date
+        with schema_context(self.schema):
+            partitions = list(self.get_existing_partitions(table))
+        return [
+            partition
+            for partition in partitions
+            if not partition.partition_parameters["default"]
+            and ciso8601.parse_datetime(partition.partition_parameters["from"]).date() <= expired_date
+        ]
+
+    def get_partition_sizes(self, partitions):
+        """Return the total size in bytes of each partition, keyed by partition table name."""
+        sql = """
+            SELECT c.relname, pg_total_relation_size(c.oid)
+              FROM pg_class c
+              JOIN pg_namespace n
+                ON n.oid = c.relnamespace
+             WHERE n.nspname = %s
+               AND c.relname = ANY(%s)
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.schema, [partition.table_name for partition in partitions]])
+            return dict(cursor.fetchall())
+
+    def purge_expired_partitions(self, table, expired_date, simulate=False):
+        """Drop the monthly partitions of a table that only hold expired data.
+
+        Deleting a partition tracking record detaches and drops the partition
+        in the partitioned_tables trigger, so a month is removed without
+        deleting its rows one by one.
+
+        Args:
+            table (str or Model): The partitioned table
+            expired_date (datetime.datetime): The cutoff date for removing data
+            simulate (bool): Only report the partitions that would be dropped
+
+        Returns:
+            ([{}]) List of dictionaries containing 'partition', 'partition_start' and 'size' in bytes
+
+        """
+        partitions = self.get_expired_partitions(table, expired_date)
+        if not partitions:
+            return []
+
+        sizes = self.get_partition_sizes(partitions)
+        purged_partitions = []
+        for partition in partitions:
+            purged_partition = {
+                "partition": partition.table_name,
+                "partition_start": str(ciso8601.parse_datetime(partition.partition_parameters["from"]).date()),
+                "size": sizes.get(partition.table_name, 0),
+            }
+            if not simulate:
+                with schema_context(self.schema):
+                    partition.delete()
+            LOG.info(
+                "Dropped expired partition %s of %s (%s bytes)%s",
+                partition.table_name,
+                partition.partition_of_table_name,
+                purged_partition["size"],
+                " (simulated)" if simulate else "",
+            )
+            purged_partitions.append(purged_partition)
+        return purged_partitions
@@ -24,6 +24,7 @@ from tenant_schemas.utils import schema_context
 from masu.database.koku_database_access import KokuDBAccess
 from masu.external.date_accessor import DateAccessor
 from reporting_common.models import CostUsageReportManifest
+from reporting_common.models import CostUsageReportObject
 from reporting_common.models import CostUsageReportStatus
 
 LOG = get_task_logger(__name__)
@@ -141,6 +142,26 @@ class ReportManifestDBAccessor(KokuDBAccess):
                 assembly_ids.append(manifest.assembly_id)
         return assembly_ids
 
+    def set_report_object_manifest(self, key, manifest_id):
+        """Record the manifest of an uploaded report object, or forget the object if it has none."""
+        if manifest_id is None:
+            CostUsageReportObject.objects.filter(key=key).delete()
+        else:
+            CostUsageReportObject.objects.update_or_create(key=key, defaults={"manifest_id": str(manifest_id)})
+
+    def get_report_object_manifests(self, prefix):
+        """Return the recorded manifest id of each report object under a key prefix."""
+        return dict(CostUsageReportObject.objects.filter(key__startswith=prefix).values_list("key", "manifest_id"))
+
+    def delete_report_objects(self, keys):
+        """Forget the report objects removed from S3."""
+        CostUsageReportObject.objects.filter(key__in=keys).delete()
+
+    def _delete_manifest_report_objects(self, manifests):
+        """Forget the report objects of manifests being deleted."""
+        manifest_ids = [str(manifest_id) for manifest_id in manifests.values_list("id", flat=True)]
+        CostUsageReportObject.objects.filter(manifest_id__in=manifest_ids).delete()
+
     def purge_expired_report_manifest(self, provider_type, expired_date):
         """
         Deletes Cost usage Report Manifests older than expired_date.
@@ -149,9 +170,11 @@ class ReportManifestDBAccessor(KokuDBAccess):
             provider_type   (String) the provider type to delete associated manifests
             expired_date (datetime.datetime) delete all manifests older than this date, exclusive.
         """
-        delete_count = CostUsageReportManifest.objects.filter(
+        manifests = CostUsageReportManifest.objects.filter(
             provider__type=provider_type, billing_period_start_datetime__lt=expired_date
-        ).delete()[0]
+        )
+        self._delete_manifest_report_objects(manifests)
+        delete_count = manifests.delete()[0]
         LOG.info(
             "Removed %s CostUsageReportManifest(s) for provider type %s that had a billing period start date before %s",
             delete_count,
@@ -167,9 +190,11 @@ class ReportManifestDBAccessor(KokuDBAccess):
             provider_uuid (uuid) The provider uuid to use to delete associated manifests
             expired_date (datetime.datetime) delete all manifests older than this date, exclusive.
         """
-        delete_count = CostUsageReportManifest.objects.filter(
+        manifests = CostUsageReportManifest.objects.filter(
             provider_id=provider_uuid, billing_period_start_datetime__lt=expired_date
-        ).delete()
+        )
+        self._delete_manifest_report_objects(manifests)
+        delete_count = manifests.delete()
         LOG.info(
             "Removed %s CostUsageReportManifest(s) for provider_uuid %s that had a billing period start date before %s",
             delete_count,
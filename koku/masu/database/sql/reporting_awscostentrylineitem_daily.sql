@@ -131,7 +131,7 @@ INSERT INTO {{schema | sqlsafe}}.reporting_awsenabledtagkeys (
         FROM {{schema | sqlsafe}}.reporting_awsenabledtagkeys
         WHERE key = labels.key)
         AND NOT key = ANY(SELECT DISTINCT(key) FROM {{schema | sqlsafe}}.reporting_awstags_summary)
-
+    ON CONFLICT (key) DO NOTHING
 ;
 TRUNCATE TABLE reporting_awscostentrylineitem_daily_{{uuid | sqlsafe}};
 DROP TABLE reporting_awscostentrylineitem_daily_{{uuid | sqlsafe}};
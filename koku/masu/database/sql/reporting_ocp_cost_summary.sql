@@ -0,0 +1,58 @@
+-- Replace the reporting_ocp_cost_summary rows of a source and date range from the daily summary
+-- Only this month and last month are kept
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_cost_summary
+WHERE usage_start < DATE_TRUNC('month', NOW() - '1 month'::interval)::date
+;
+
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_cost_summary
+WHERE usage_start >= {{start_date}}::date
+{% if end_date %}
+    AND usage_start <= {{end_date}}::date
+{% endif %}
+{% if source_uuid %}
+    AND source_uuid = {{source_uuid}}::uuid
+{% endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_ocp_cost_summary (
+    usage_start,
+    usage_end,
+    cluster_id,
+    cluster_alias,
+    supplementary_usage_cost,
+    infrastructure_usage_cost,
+    infrastructure_raw_cost,
+    infrastructure_markup_cost,
+    supplementary_monthly_cost,
+    infrastructure_monthly_cost,
+    source_uuid
+)
+    SELECT usage_start as usage_start,
+        usage_start as usage_end,
+        cluster_id,
+        cluster_alias,
+        json_build_object(
+            'cpu', sum((supplementary_usage_cost->>'cpu')::decimal),
+            'memory', sum((supplementary_usage_cost->>'memory')::decimal),
+            'storage', sum((supplementary_usage_cost->>'storage')::decimal)
+        )::jsonb as supplementary_usage_cost,
+        json_build_object(
+            'cpu', sum((infrastructure_usage_cost->>'cpu')::decimal),
+            'memory', sum((infrastructure_usage_cost->>'memory')::decimal),
+            'storage', sum((infrastructure_usage_cost->>'storage')::decimal)
+        )::jsonb as infrastructure_usage_cost,
+        sum(infrastructure_raw_cost) as infrastructure_raw_cost,
+        sum(infrastructure_markup_cost) as infrastructure_markup_cost,
+        sum(supplementary_monthly_cost) as supplementary_monthly_cost,
+        sum(infrastructure_monthly_cost) as infrastructure_monthly_cost,
+        source_uuid
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+    WHERE usage_start >= {{start_date}}::date
+    {% if end_date %}
+        AND usage_start <= {{end_date}}::date
+    {% endif %}
+    {% if source_uuid %}
+        AND source_uuid = {{source_uuid}}::uuid
+    {% endif %}
+    GROUP BY usage_start, cluster_id, cluster_alias, source_uuid
+;
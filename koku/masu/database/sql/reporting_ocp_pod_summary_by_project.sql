@@ -0,0 +1,79 @@
+-- Replace the reporting_ocp_pod_summary_by_project rows of a source and date range from the daily summary
+-- Only this month and last month are kept
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_pod_summary_by_project
+WHERE usage_start < DATE_TRUNC('month', NOW() - '1 month'::interval)::date
+;
+
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_pod_summary_by_project
+WHERE usage_start >= {{start_date}}::date
+{% if end_date %}
+    AND usage_start <= {{end_date}}::date
+{% endif %}
+{% if source_uuid %}
+    AND source_uuid = {{source_uuid}}::uuid
+{% endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_ocp_pod_summary_by_project (
+    usage_start,
+    usage_end,
+    cluster_id,
+    cluster_alias,
+    namespace,
+    data_source,
+    resource_ids,
+    resource_count,
+    supplementary_usage_cost,
+    infrastructure_usage_cost,
+    infrastructure_raw_cost,
+    infrastructure_markup_cost,
+    pod_usage_cpu_core_hours,
+    pod_request_cpu_core_hours,
+    pod_limit_cpu_core_hours,
+    cluster_capacity_cpu_core_hours,
+    pod_usage_memory_gigabyte_hours,
+    pod_request_memory_gigabyte_hours,
+    pod_limit_memory_gigabyte_hours,
+    cluster_capacity_memory_gigabyte_hours,
+    source_uuid
+)
+    SELECT usage_start as usage_start,
+        usage_start as usage_end,
+        cluster_id,
+        cluster_alias,
+        namespace,
+        max(data_source) as data_source,
+        array_agg(DISTINCT resource_id) as resource_ids,
+        count(DISTINCT resource_id) as resource_count,
+        json_build_object(
+            'cpu', sum((supplementary_usage_cost->>'cpu')::decimal),
+            'memory', sum((supplementary_usage_cost->>'memory')::decimal),
+            'storage', sum((supplementary_usage_cost->>'storage')::decimal)
+        )::jsonb as supplementary_usage_cost,
+        json_build_object(
+            'cpu', sum((infrastructure_usage_cost->>'cpu')::decimal),
+            'memory', sum((infrastructure_usage_cost->>'memory')::decimal),
+            'storage', sum((infrastructure_usage_cost->>'storage')::decimal)
+        )::jsonb as infrastructure_usage_cost,
+        sum(infrastructure_raw_cost) as infrastructure_raw_cost,
+        sum(infrastructure_markup_cost) as infrastructure_markup_cost,
+        sum(pod_usage_cpu_core_hours) as pod_usage_cpu_core_hours,
+        sum(pod_request_cpu_core_hours) as pod_request_cpu_core_hours,
+        sum(pod_limit_cpu_core_hours) as pod_limit_cpu_core_hours,
+        max(cluster_capacity_cpu_core_hours) as cluster_capacity_cpu_core_hours,
+        sum(pod_usage_memory_gigabyte_hours) as pod_usage_memory_gigabyte_hours,
+        sum(pod_request_memory_gigabyte_hours) as pod_request_memory_gigabyte_hours,
+        sum(pod_limit_memory_gigabyte_hours) as pod_limit_memory_gigabyte_hours,
+        max(cluster_capacity_memory_gigabyte_hours) as cluster_capacity_memory_gigabyte_hours,
+        source_uuid
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+    WHERE usage_start >= {{start_date}}::date
+    {% if end_date %}
+        AND usage_start <= {{end_date}}::date
+    {% endif %}
+    {% if source_uuid %}
+        AND source_uuid = {{source_uuid}}::uuid
+    {% endif %}
+        AND data_source = 'Pod'
+    GROUP BY usage_start, cluster_id, cluster_alias, namespace, source_uuid
+;
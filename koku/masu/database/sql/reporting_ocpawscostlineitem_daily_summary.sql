@@ -68,6 +68,8 @@ CREATE TEMPORARY TABLE matched_tags_{{uuid | sqlsafe}} AS (
         {% endif %}
     )
     SELECT jsonb_build_object(key, value) as tag,
+        key,
+        value,
         cost_entry_bill_id,
         report_period_id
     FROM (
@@ -156,6 +158,14 @@ CREATE TEMPORARY TABLE reporting_aws_with_enabled_tags_{{uuid | sqlsafe}} AS (
         FROM {{schema | sqlsafe}}.reporting_awscostentrylineitem_daily as aws
         LEFT JOIN cte_filtered_aws_tags as fvl
             ON aws.id = fvl.id
+        WHERE aws.usage_start >= {{start_date}}::date
+            AND aws.usage_start <= {{end_date}}::date
+            {% if bill_ids %}
+            AND aws.cost_entry_bill_id IN (
+                {%- for bill_id in bill_ids  -%}
+                    {{bill_id}}{% if not loop.last %},{% endif %}
+                {%- endfor -%})
+            {% endif %}
 )
 ;
 -- We use a LATERAL JOIN here to get the JSON tags split out into key, value
@@ -168,9 +178,11 @@ CREATE TEMPORARY TABLE reporting_aws_tags_{{uuid | sqlsafe}} AS (
             lower(aws.tags::text)::jsonb as lower_tags,
             row_number() OVER (PARTITION BY aws.id ORDER BY aws.id) as row_number
             FROM reporting_aws_with_enabled_tags_{{uuid | sqlsafe}} as aws
+            CROSS JOIN LATERAL jsonb_each_text(aws.tags) AS labels(key, value)
             JOIN matched_tags_{{uuid | sqlsafe}} as tag
                 ON aws.cost_entry_bill_id = tag.cost_entry_bill_id
-                    AND aws.tags @> tag.tag
+                    AND labels.key = tag.key
+                    AND labels.value = tag.value
             WHERE aws.usage_start >= {{start_date}}::date
                 AND aws.usage_start <= {{end_date}}::date
                 --aws_where_clause
@@ -238,9 +250,11 @@ CREATE TEMPORARY TABLE reporting_ocp_storage_tags_{{uuid | sqlsafe}} AS (
     SELECT ocp.*,
         lower(tag.tag::text)::jsonb as tag
     FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary as ocp
+    CROSS JOIN LATERAL jsonb_each_text(ocp.volume_labels) AS labels(key, value)
     JOIN matched_tags_{{uuid | sqlsafe}} AS tag
         ON ocp.report_period_id = tag.report_period_id
-            AND ocp.volume_labels @> tag.tag
+            AND labels.key = tag.key
+            AND labels.value = tag.value
     WHERE ocp.usage_start >= {{start_date}}::date
         AND ocp.usage_start <= {{end_date}}::date
         AND ocp.data_source = 'Storage'
@@ -255,9 +269,11 @@ CREATE TEMPORARY TABLE reporting_ocp_pod_tags_{{uuid | sqlsafe}} AS (
     SELECT ocp.*,
         lower(tag.tag::text)::jsonb as tag
     FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary as ocp
+    CROSS JOIN LATERAL jsonb_each_text(ocp.pod_labels) AS labels(key, value)
     JOIN matched_tags_{{uuid | sqlsafe}} AS tag
         ON ocp.report_period_id = tag.report_period_id
-            AND ocp.pod_labels @> tag.tag
+            AND labels.key = tag.key
+            AND labels.value = tag.value
     WHERE ocp.usage_start >= {{start_date}}::date
         AND ocp.usage_start <= {{end_date}}::date
         AND ocp.data_source = 'Pod'
@@ -144,6 +144,15 @@ CREATE TEMPORARY TABLE reporting_azure_with_enabled_tags_{{uuid | sqlsafe}} AS (
     FROM {{schema | sqlsafe}}.reporting_azurecostentrylineitem_daily as azure
     LEFT JOIN cte_filtered_azure_tags as fvl
         ON azure.id = fvl.id
+    WHERE azure.usage_date >= {{start_date}}::date
+        AND azure.usage_date <= {{end_date}}::date
+        {% if bill_ids %}
+        AND azure.cost_entry_bill_id IN (
+            {%- for bill_id in bill_ids -%}
+            {{bill_id}}{% if not loop.last %},{% endif %}
+            {%- endfor -%}
+        )
+        {% endif %}
 )
 ;
 
@@ -156,9 +165,11 @@ CREATE TEMPORARY TABLE reporting_azure_tags_{{uuid | sqlsafe}} AS (
             tag.key,
             tag.value
             FROM reporting_azure_with_enabled_tags_{{uuid | sqlsafe}} as azure
+            CROSS JOIN LATERAL jsonb_each_text(azure.tags) AS labels(key, value)
             JOIN matched_tags_{{uuid | sqlsafe}} as tag
                 ON azure.cost_entry_bill_id = tag.cost_entry_bill_id
-                    AND azure.tags @> tag.tag
+                    AND labels.key = tag.key
+                    AND labels.value = tag.value
             WHERE azure.usage_date >= {{start_date}}::date
                 AND azure.usage_date <= {{end_date}}::date
                 --azure_where_clause
@@ -227,9 +238,11 @@ CREATE TEMPORARY TABLE reporting_ocp_storage_tags_{{uuid | sqlsafe}} AS (
     SELECT ocp.*,
         lower(tag.tag::text)::jsonb as tag
     FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary as ocp
+    CROSS JOIN LATERAL jsonb_each_text(ocp.volume_labels) AS labels(key, value)
     JOIN matched_tags_{{uuid | sqlsafe}} AS tag
         ON ocp.report_period_id = tag.report_period_id
-            AND ocp.volume_labels @> tag.tag
+            AND labels.key = tag.key
+            AND labels.value = tag.value
     WHERE ocp.usage_start >= {{start_date}}::date
         AND ocp.usage_start <= {{end_date}}::date
         AND ocp.data_source = 'Storage'
@@ -244,9 +257,11 @@ CREATE TEMPORARY TABLE reporting_ocp_pod_tags_{{uuid | sqlsafe}} AS (
     SELECT ocp.*,
         lower(tag.tag::text)::jsonb as tag
     FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary as ocp
+    CROSS JOIN LATERAL jsonb_each_text(ocp.pod_labels) AS labels(key, value)
     JOIN matched_tags_{{uuid | sqlsafe}} AS tag
         ON ocp.report_period_id = tag.report_period_id
-            AND ocp.pod_labels @> tag.tag
+            AND labels.key = tag.key
+            AND labels.value = tag.value
     WHERE ocp.usage_start >= {{start_date}}::date
         AND ocp.usage_start <= {{end_date}}::date
         AND ocp.data_source = 'Pod'
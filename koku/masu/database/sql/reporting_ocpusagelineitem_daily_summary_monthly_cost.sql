@@ -0,0 +1,120 @@
+-- Upsert the Node, Cluster or PVC monthly cost rows for one month in a single statement
+WITH cte_rates AS (
+    SELECT tag_key,
+        tag_value,
+        rate,
+        defined_values
+    FROM jsonb_to_recordset({{rates}}::jsonb) AS r(tag_key text, tag_value text, rate numeric, defined_values jsonb)
+),
+cte_line_items AS (
+    SELECT {% if cost_type != 'Cluster' %}lids.node{% else %}NULL::varchar{% endif %} AS node,
+        {% if cost_type == 'PVC' %}lids.persistentvolumeclaim{% else %}NULL::varchar{% endif %} AS persistentvolumeclaim,
+        lids.{{labels_field | sqlsafe}} AS labels
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    WHERE lids.cluster_id = {{cluster_id}}
+        AND lids.usage_start >= {{start_date}}::date
+    {% if rate_source == 'flat' %}
+        AND lids.usage_start < {{end_date}}::date
+    {% else %}
+        AND lids.usage_end <= {{end_date}}::date
+        AND lids.report_period_id IS NOT DISTINCT FROM {{report_period_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.{{labels_field | sqlsafe}} IS NOT NULL
+    {% endif %}
+    {% if cost_type == 'Node' %}
+        AND lids.node IS NOT NULL
+    {% elif cost_type == 'PVC' %}
+        AND lids.persistentvolumeclaim IS NOT NULL
+    {% endif %}
+),
+cte_costs AS (
+{% if rate_source == 'flat' and cost_type == 'Cluster' %}
+    SELECT NULL::varchar AS node,
+        NULL::varchar AS persistentvolumeclaim,
+        rate AS cost
+    FROM cte_rates
+{% elif rate_source == 'flat' %}
+    SELECT DISTINCT li.node,
+        li.persistentvolumeclaim,
+        r.rate AS cost
+    FROM cte_line_items AS li
+    CROSS JOIN cte_rates AS r
+{% else %}
+    -- Each matching tag value is charged once per node, PVC or cluster
+    SELECT matched.node,
+        matched.persistentvolumeclaim,
+        sum(matched.rate) AS cost
+    FROM (
+        SELECT DISTINCT li.node,
+            li.persistentvolumeclaim,
+            r.tag_key,
+        {% if rate_source == 'tag' %}
+            r.tag_value,
+        {% else %}
+            li.labels ->> r.tag_key AS tag_value,
+        {% endif %}
+            r.rate
+        FROM cte_line_items AS li
+        JOIN cte_rates AS r
+        {% if rate_source == 'tag' %}
+            ON li.labels @> jsonb_build_object(r.tag_key, r.tag_value)
+        {% else %}
+            ON li.labels ? r.tag_key
+                AND NOT r.defined_values ? (li.labels ->> r.tag_key)
+        {% endif %}
+    ) AS matched
+    GROUP BY matched.node, matched.persistentvolumeclaim
+{% endif %}
+),
+cte_updated AS (
+    UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    SET {{cost_column | sqlsafe}} = {% if rate_source != 'flat' %}coalesce(lids.{{cost_column | sqlsafe}}, 0) + {% endif %}c.cost
+    FROM cte_costs AS c
+    WHERE lids.usage_start = {{start_date}}::date
+        AND lids.usage_end = {{start_date}}::date
+        AND lids.report_period_id IS NOT DISTINCT FROM {{report_period_id}}
+        AND lids.cluster_id = {{cluster_id}}
+        AND lids.cluster_alias IS NOT DISTINCT FROM {{cluster_alias}}
+        AND lids.monthly_cost_type = {{cost_type}}
+    {% if cost_type != 'Cluster' %}
+        AND lids.node IS NOT DISTINCT FROM c.node
+    {% endif %}
+    {% if cost_type == 'PVC' %}
+        AND lids.persistentvolumeclaim IS NOT DISTINCT FROM c.persistentvolumeclaim
+    {% endif %}
+    RETURNING c.node, c.persistentvolumeclaim
+)
+INSERT INTO {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary (
+    uuid,
+    report_period_id,
+    cluster_id,
+    cluster_alias,
+    usage_start,
+    usage_end,
+    monthly_cost_type,
+    node,
+    persistentvolumeclaim,
+    infrastructure_raw_cost,
+    infrastructure_project_raw_cost,
+    {{cost_column | sqlsafe}}
+)
+SELECT uuid_generate_v4(),
+    {{report_period_id}}::integer,
+    {{cluster_id}}::varchar,
+    {{cluster_alias}}::varchar,
+    {{start_date}}::date,
+    {{start_date}}::date,
+    {{cost_type}}::text,
+    c.node,
+    c.persistentvolumeclaim,
+    0,
+    0,
+    c.cost
+FROM cte_costs AS c
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM cte_updated AS u
+    WHERE u.node IS NOT DISTINCT FROM c.node
+        AND u.persistentvolumeclaim IS NOT DISTINCT FROM c.persistentvolumeclaim
+)
+;
@@ -0,0 +1,74 @@
+-- Add the usage cost of every tag rate of one cost type to the daily summary in a single update
+WITH cte_rates AS (
+    SELECT metric,
+        usage_type,
+        tag_key,
+        tag_value,
+        defined_values,
+        rate
+    FROM jsonb_to_recordset({{rates}}::jsonb) AS r(
+        metric text,
+        usage_type text,
+        tag_key text,
+        tag_value text,
+        defined_values jsonb,
+        rate numeric
+    )
+),
+cte_tag_costs AS (
+    SELECT lids.uuid,
+        r.usage_type,
+        sum(
+            coalesce(
+                r.rate * CASE r.metric
+                    WHEN 'cpu_core_usage_per_hour' THEN lids.pod_usage_cpu_core_hours
+                    WHEN 'cpu_core_request_per_hour' THEN lids.pod_request_cpu_core_hours
+                    WHEN 'memory_gb_usage_per_hour' THEN lids.pod_usage_memory_gigabyte_hours
+                    WHEN 'memory_gb_request_per_hour' THEN lids.pod_request_memory_gigabyte_hours
+                    WHEN 'storage_gb_usage_per_month' THEN lids.persistentvolumeclaim_usage_gigabyte_months
+                    WHEN 'storage_gb_request_per_month' THEN lids.volume_request_storage_gigabyte_months
+                END,
+                0.0
+            )
+        ) AS cost
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    JOIN cte_rates AS r
+        ON CASE WHEN r.usage_type = 'storage' THEN lids.volume_labels ELSE lids.pod_labels END
+        {% if rate_source == 'tag' %}
+            @> jsonb_build_object(r.tag_key, r.tag_value)
+        {% else %}
+            ? r.tag_key
+            AND NOT r.defined_values ? (
+                CASE WHEN r.usage_type = 'storage' THEN lids.volume_labels ELSE lids.pod_labels END ->> r.tag_key
+            )
+        {% endif %}
+    WHERE lids.cluster_id = {{cluster_id}}
+        AND lids.usage_start >= {{start_date}}
+        AND lids.usage_start <= {{end_date}}
+        AND lids.{{cost_column | sqlsafe}} IS NOT NULL
+    GROUP BY lids.uuid, r.usage_type
+),
+cte_usage_costs AS (
+    SELECT lids.uuid,
+        jsonb_object_agg(
+            usage_cost.key,
+            usage_cost.value::numeric + coalesce(tc.cost, 0.0)
+        ) AS usage_cost
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    CROSS JOIN LATERAL jsonb_each_text(lids.{{cost_column | sqlsafe}}) AS usage_cost
+    LEFT JOIN cte_tag_costs AS tc
+        ON tc.uuid = lids.uuid
+            AND tc.usage_type = usage_cost.key
+    WHERE lids.cluster_id = {{cluster_id}}
+        AND lids.usage_start >= {{start_date}}
+        AND lids.usage_start <= {{end_date}}
+        AND lids.uuid IN (SELECT uuid FROM cte_tag_costs)
+    GROUP BY lids.uuid
+)
+UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+SET {{cost_column | sqlsafe}} = uc.usage_cost
+FROM cte_usage_costs AS uc
+WHERE lids.uuid = uc.uuid
+    AND lids.usage_start >= {{start_date}}
+    AND lids.usage_start <= {{end_date}}
+;
@@ -21,6 +21,9 @@ import logging
 import os
 import shutil
 import struct
+import time
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from botocore.exceptions import ClientError
 from django.conf import settings
@@ -31,6 +34,8 @@ from masu.config import Config
 from masu.exceptions import MasuProviderError
 from masu.external.downloader.downloader_interface import DownloaderInterface
 from masu.external.downloader.report_downloader_base import ReportDownloaderBase
+from masu.prometheus_stats import REPORT_FILE_DOWNLOAD_BYTES_COUNTER
+from masu.prometheus_stats import REPORT_FILE_DOWNLOAD_THROUGHPUT
 from masu.util.aws import common as utils
 from masu.util.common import get_path_prefix
 
@@ -258,7 +263,14 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
 
         if s3_etag != stored_etag or not os.path.isfile(full_file_path):
             LOG.debug("Downloading key: %s to file path: %s", key, full_file_path)
-            self.s3_client.download_file(self.report.get("S3Bucket"), key, full_file_path)
+            download_start = time.monotonic()
+            size = int(s3_file.get("ContentLength", 0))
+            if Config.AWS_RANGED_DOWNLOAD and size > Config.AWS_DOWNLOAD_PART_SIZE:
+                downloaded = self._download_ranged(key, full_file_path, s3_etag, size)
+            else:
+                self.s3_client.download_file(self.report.get("S3Bucket"), key, full_file_path)
+                downloaded = os.path.getsize(full_file_path) if os.path.isfile(full_file_path) else 0
+            self._record_download(downloaded, time.monotonic() - download_start)
             # Push to S3
             s3_csv_path = get_path_prefix(
                 self.account, Provider.PROVIDER_AWS, self._provider_uuid, start_date, Config.CSV_DATA_TYPE
@@ -270,6 +282,124 @@ class AWSReportDownloader(ReportDownloaderBase, DownloaderInterface):
 
         return full_file_path, s3_etag, file_creation_date
 
+    def _record_download(self, downloaded, elapsed):
+        """Report the bytes fetched by a download and its throughput."""
+        REPORT_FILE_DOWNLOAD_BYTES_COUNTER.labels(provider_type=Provider.PROVIDER_AWS).inc(downloaded)
+        if downloaded and elapsed > 0:
+            REPORT_FILE_DOWNLOAD_THROUGHPUT.labels(provider_type=Provider.PROVIDER_AWS).observe(downloaded / elapsed)
+
+    def _download_range(self, key, s3_etag, file_descriptor, start, end):
+        """
+        Download one byte range of an S3 object into its place in a local file.
+
+        Args:
+            key (str): The S3 object key
+            s3_etag (str): The ETag the object must still have
+            file_descriptor (int): Descriptor of the local file open for writing
+            start (int): First byte of the range
+            end (int): Last byte of the range
+
+        Returns:
+            (int): The number of bytes written
+
+        """
+        resp = self.s3_client.get_object(
+            Bucket=self.report.get("S3Bucket"), Key=key, Range=f"bytes={start}-{end}", IfMatch=s3_etag
+        )
+        offset = start
+        for chunk in iter(lambda: resp["Body"].read(1024 * 1024), b""):
+            os.pwrite(file_descriptor, chunk, offset)
+            offset += len(chunk)
+        if offset != end + 1:
+            raise AWSReportDownloaderError(f"Incomplete range {start}-{end} of {key}: got {offset - start} bytes")
+        return offset - start
+
+    def _download_ranged(self, key, full_file_path, s3_etag, size):
+        """
+        Download an S3 object as parallel ranged GETs, resuming an earlier partial download.
+
+        Parts are written to a partial file and each finished part is recorded in a state
+        file next to it together with the object's ETag and size. When a download is
+        retried for the same ETag only the missing parts are fetched; a changed object
+        starts over.
+
+        Args:
+            key (str): The S3 object key
+            full_file_path (str): Path of the downloaded file
+            s3_etag (str): The ETag of the object
+            size (int): The size of the object in bytes
+
+        Returns:
+            (int): The number of bytes fetched by this attempt
+
+        """
+        part_size = Config.AWS_DOWNLOAD_PART_SIZE
+        partial_path = f"{full_file_path}.part"
+        state_path = f"{partial_path}.json"
+        state = {"etag": s3_etag, "size": size, "part_size": part_size, "done": []}
+
+        done = self._get_downloaded_parts(partial_path, state_path, state)
+        state["done"] = sorted(done)
+        if not done:
+            with open(partial_path, "wb") as partial_file:
+                partial_file.truncate(size)
+
+        parts = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size) if start not in done]
+        msg = f"Downloading {len(parts)} parts of {key}, {len(done)} parts already downloaded"
+        LOG.info(log_json(self.request_id, msg, self.context))
+
+        file_descriptor = os.open(partial_path, os.O_WRONLY)
+        try:
+            downloaded = self._download_parts(key, s3_etag, file_descriptor, parts, state_path, state)
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] == "PreconditionFailed":
+                # The object changed while it was being downloaded, so the parts on disk are useless.
+                if os.path.isfile(state_path):
+                    os.remove(state_path)
+            raise AWSReportDownloaderError(str(ex))
+        finally:
+            os.close(file_descriptor)
+
+        os.replace(partial_path, full_file_path)
+        if os.path.isfile(state_path):
+            os.remove(state_path)
+        return downloaded
+
+    def _download_parts(self, key, s3_etag, file_descriptor, parts, state_path, state):
+        """Download parts in parallel, recording each finished part in the state file."""
+        downloaded = 0
+        done = set(state["done"])
+        with ThreadPoolExecutor(max_workers=Config.AWS_DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(self._download_range, key, s3_etag, file_descriptor, start, end): start
+                for start, end in parts
+            }
+            try:
+                for future in as_completed(futures):
+                    downloaded += future.result()
+                    done.add(futures[future])
+                    state["done"] = sorted(done)
+                    with open(state_path, "w") as state_file:
+                        json.dump(state, state_file)
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        return downloaded
+
+    def _get_downloaded_parts(self, partial_path, state_path, state):
+        """Return the start offsets of parts already downloaded for the same object, if any."""
+        if not (os.path.isfile(partial_path) and os.path.isfile(state_path)):
+            return set()
+        try:
+            with open(state_path) as state_file:
+                saved_state = json.load(state_file)
+        except (OSError, ValueError):
+            return set()
+        if any(saved_state.get(field) != state[field] for field in ("etag", "size", "part_size")):
+            return set()
+        return set(saved_state.get("done", []))
+
     def get_manifest_context_for_date(self, date):
         """
         Get the manifest context for a provided date.
@@ -25,11 +25,18 @@ import tempfile
 import threading
 import time
 import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from functools import partial
 from tarfile import ReadError
+from tarfile import StreamError
 from tarfile import TarFile
 
 import requests
 from confluent_kafka import Consumer
+from confluent_kafka import KafkaException
 from confluent_kafka import Producer
 from confluent_kafka import TopicPartition
 from django.db import connections
@@ -237,6 +244,45 @@ def construct_parquet_reports(request_id, context, report_meta, payload_destinat
     return daily_parquet_files
 
 
+def prepare_report_destination(report_meta, request_id, context={}):
+    """
+    Add the account of the payload's cluster to the report meta and create the report directory.
+
+    Args:
+        report_meta (dict): Manifest details of the payload
+        request_id (String): Identifier associated with the payload
+        context (Dict): Context for logging (account, etc)
+
+    Returns:
+        (String): local report directory of the payload, None if the cluster has no provider
+
+    """
+    # Filter and get account from payload's cluster-id
+    cluster_id = report_meta.get("cluster_id")
+    if context:
+        context["cluster_id"] = cluster_id
+    account = get_account_from_cluster_id(cluster_id, request_id, context)
+    if not account:
+        msg = f"Recieved unexpected OCP report from {cluster_id}"
+        LOG.error(log_json(request_id, msg, context))
+        return None
+    schema_name = account.get("schema_name")
+    provider_type = account.get("provider_type")
+    context["account"] = schema_name[4:]
+    context["provider_type"] = provider_type
+    report_meta["provider_uuid"] = account.get("provider_uuid")
+    report_meta["provider_type"] = provider_type
+    report_meta["schema_name"] = schema_name
+    report_meta["account"] = schema_name[4:]
+    report_meta["request_id"] = request_id
+
+    # Create directory tree for report.
+    usage_month = utils.month_date_range(report_meta.get("date"))
+    destination_dir = f"{Config.INSIGHTS_LOCAL_REPORT_DIR}/{report_meta.get('cluster_id')}/{usage_month}"
+    os.makedirs(destination_dir, exist_ok=True)
+    return destination_dir
+
+
 # pylint: disable=too-many-locals
 def extract_payload(url, request_id, context={}):  # noqa: C901
     """
@@ -286,6 +332,9 @@ def extract_payload(url, request_id, context={}):  # noqa: C901
                 current_file: String
 
     """
+    if Config.KAFKA_STREAM_PAYLOADS:
+        return stream_payload(url, request_id, context)
+
     temp_dir, temp_file_path, temp_file = download_payload(request_id, url, context)
     manifest_path = extract_payload_contents(request_id, temp_dir, temp_file_path, temp_file, context)
 
@@ -293,30 +342,11 @@ def extract_payload(url, request_id, context={}):  # noqa: C901
     full_manifest_path = f"{temp_dir}/{manifest_path[0]}"
     report_meta = utils.get_report_details(os.path.dirname(full_manifest_path))
 
-    # Filter and get account from payload's cluster-id
-    cluster_id = report_meta.get("cluster_id")
-    if context:
-        context["cluster_id"] = cluster_id
-    account = get_account_from_cluster_id(cluster_id, request_id, context)
-    if not account:
-        msg = f"Recieved unexpected OCP report from {cluster_id}"
-        LOG.error(log_json(request_id, msg, context))
+    destination_dir = prepare_report_destination(report_meta, request_id, context)
+    if not destination_dir:
         shutil.rmtree(temp_dir)
         return None
-    schema_name = account.get("schema_name")
-    provider_type = account.get("provider_type")
-    context["account"] = schema_name[4:]
-    context["provider_type"] = provider_type
-    report_meta["provider_uuid"] = account.get("provider_uuid")
-    report_meta["provider_type"] = provider_type
-    report_meta["schema_name"] = schema_name
-    report_meta["account"] = schema_name[4:]
-    report_meta["request_id"] = request_id
-
-    # Create directory tree for report.
     usage_month = utils.month_date_range(report_meta.get("date"))
-    destination_dir = f"{Config.INSIGHTS_LOCAL_REPORT_DIR}/{report_meta.get('cluster_id')}/{usage_month}"
-    os.makedirs(destination_dir, exist_ok=True)
 
     # Copy manifest
     manifest_destination_path = f"{destination_dir}/{os.path.basename(report_meta.get('manifest_path'))}"
@@ -353,6 +383,145 @@ def extract_payload(url, request_id, context={}):  # noqa: C901
     return report_metas
 
 
+def write_payload_member(member_file, path):
+    """Write a payload tarball member to path as it is read from the download stream."""
+    with open(path, "wb") as destination:
+        shutil.copyfileobj(member_file, destination)
+
+
+def read_streamed_manifest(request_id, manifest_file, context={}):
+    """
+    Read the manifest of a streamed payload, create its manifest entries and write it to the report directory.
+
+    Args:
+        request_id (String): Identifier associated with the payload
+        manifest_file (File): manifest.json member of the payload tarball
+        context (Dict): Context for logging (account, etc)
+
+    Returns:
+        (dict): report meta of the payload, None if the cluster has no provider
+
+    """
+    contents = manifest_file.read()
+    try:
+        report_meta = utils.parse_manifest(json.loads(contents), None)
+    except (ValueError, KeyError) as error:
+        msg = f"Unable to read manifest. Reason: {str(error)}"
+        LOG.warning(log_json(request_id, msg, context))
+        raise KafkaMsgHandlerError("Extraction failure.")
+
+    destination_dir = prepare_report_destination(report_meta, request_id, context)
+    if not destination_dir:
+        return None
+    report_meta["manifest_path"] = f"{destination_dir}/manifest.json"
+    with open(report_meta["manifest_path"], "wb") as manifest:
+        manifest.write(contents)
+
+    report_meta["manifest_id"] = create_manifest_entries(report_meta, request_id, context)
+    record_all_manifest_files(report_meta["manifest_id"], report_meta.get("files"))
+    return report_meta
+
+
+def place_streamed_report(request_id, context, report_meta, report_file, place):
+    """
+    Place a report file of a streamed payload in the report directory unless it was already processed.
+
+    Args:
+        request_id (String): Identifier associated with the payload
+        context (Dict): Context for logging (account, etc)
+        report_meta (dict): report meta of the payload
+        report_file (String): name of the report file
+        place (Callable): writes the report file to the path it is called with
+
+    Returns:
+        (dict): report meta of the report file, None if it was already processed
+
+    """
+    if record_report_status(report_meta["manifest_id"], report_file, request_id, context):
+        # Report already processed, its contents are skipped without being written
+        return None
+
+    payload_destination_path = f"{os.path.dirname(report_meta['manifest_path'])}/{report_file}"
+    place(payload_destination_path)
+    msg = f"Successfully extracted OCP for {report_meta.get('cluster_id')}/{report_file}"
+    LOG.info(log_json(request_id, msg, context))
+    construct_parquet_reports(request_id, context, report_meta, payload_destination_path, report_file)
+    current_meta = report_meta.copy()
+    current_meta["current_file"] = payload_destination_path
+    return current_meta
+
+
+def stream_payload(url, request_id, context={}):  # noqa: C901
+    """
+    Extract OCP usage report payload while it downloads.
+
+    The tarball is read from the upload service response as a stream. Once the
+    manifest is read, report files are written once, straight to the local report
+    directory, or skipped when already processed. Report files preceding the
+    manifest in the tarball are staged in Config.PVC_DIR until it is read.
+
+    Args:
+        url (String): URL path to payload in the Insights upload service..
+        request_id (String): Identifier associated with the payload
+        context (Dict): Context for logging (account, etc)
+
+    Returns:
+        [dict]: report meta of each report file to process, as returned by extract_payload
+
+    """
+    try:
+        download_response = requests.get(url, stream=True)
+        download_response.raise_for_status()
+    except requests.exceptions.HTTPError as err:
+        msg = f"Unable to download file. Error: {str(err)}"
+        LOG.warning(log_json(request_id, msg))
+        raise KafkaMsgHandlerError(msg)
+    download_response.raw.decode_content = True
+
+    report_meta = None
+    report_metas = {}
+    staged = {}
+    os.makedirs(Config.PVC_DIR, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(dir=Config.PVC_DIR)
+    try:
+        with TarFile.open(fileobj=download_response.raw, mode="r|gz") as payload:
+            for member in payload:
+                if not member.isfile():
+                    continue
+                name = os.path.basename(member.name)
+                member_file = payload.extractfile(member)
+                if name == "manifest.json":
+                    report_meta = read_streamed_manifest(request_id, member_file, context)
+                    if not report_meta:
+                        return None
+                    for report_file, staged_path in staged.items():
+                        if report_file in report_meta.get("files"):
+                            place = partial(shutil.move, staged_path)
+                            report_metas[report_file] = place_streamed_report(
+                                request_id, context, report_meta, report_file, place
+                            )
+                elif report_meta is None:
+                    staged[name] = f"{staging_dir}/{name}"
+                    write_payload_member(member_file, staged[name])
+                elif name in report_meta.get("files"):
+                    place = partial(write_payload_member, member_file)
+                    report_metas[name] = place_streamed_report(request_id, context, report_meta, name, place)
+    except (ReadError, StreamError, EOFError, OSError) as error:
+        msg = f"Unable to untar payload from {url}. Reason: {str(error)}"
+        LOG.warning(log_json(request_id, msg, context))
+        raise KafkaMsgHandlerError("Extraction failure.")
+    finally:
+        download_response.close()
+        shutil.rmtree(staging_dir)
+
+    if not report_meta:
+        msg = "No manifest found in payload."
+        LOG.warning(log_json(request_id, msg, context))
+        raise KafkaMsgHandlerError("No manifest found in payload.")
+
+    return [report_metas[name] for name in report_meta.get("files") if report_metas.get(name)]
+
+
 @KAFKA_CONNECTION_ERRORS_COUNTER.count_exceptions()
 def send_confirmation(request_id, status):  # pragma: no cover
     """
@@ -654,20 +823,33 @@ def get_producer():  # pragma: no cover
     return producer
 
 
+def poll_message(consumer):
+    """Return the next valid message from the consumer, or None."""
+    msg = consumer.poll(timeout=1.0)
+    if msg is None:
+        return None
+
+    if msg.error():
+        KAFKA_CONNECTION_ERRORS_COUNTER.inc()
+        LOG.error(f"[listen_for_messages_loop] consumer.poll message: {msg}. Error: {msg.error()}")
+        return None
+
+    return msg
+
+
 def listen_for_messages_loop():
     """Wrap listen_for_messages in while true."""
     consumer = get_consumer()
     LOG.info("Consumer is listening for messages...")
+    if Config.KAFKA_CONSUMER_WORKERS > 1:
+        ConcurrentMessageListener(consumer, Config.KAFKA_CONSUMER_WORKERS).listen()
+        return
+
     for _ in itertools.count():  # equivalent to while True, but mockable
-        msg = consumer.poll(timeout=1.0)
+        msg = poll_message(consumer)
         if msg is None:
             continue
 
-        if msg.error():
-            KAFKA_CONNECTION_ERRORS_COUNTER.inc()
-            LOG.error(f"[listen_for_messages_loop] consumer.poll message: {msg}. Error: {msg.error()}")
-            continue
-
         listen_for_messages(msg, consumer)
 
 
@@ -729,6 +911,187 @@ def listen_for_messages(msg, consumer):
         LOG.error(f"[listen_for_messages] UNKNOWN error encountered: {type(error).__name__}: {error}", exc_info=True)
 
 
+def process_message_until_done(msg):
+    """
+    Process a message in a worker thread, retrying until it may be committed.
+
+    The errors handled are those of listen_for_messages: database and internal
+    errors are retried after Config.RETRY_SECONDS, report processing and unknown
+    errors give up on the message.
+
+    Args:
+        msg (ConsumerRecord) - Message from kafka hccm topic.
+
+    Returns:
+        None
+
+    """
+    offset = msg.offset()
+    partition = msg.partition()
+    LOG.info(f"Processing message offset: {offset} partition: {partition}")
+    while True:
+        try:
+            process_messages(msg)
+            return
+        except (InterfaceError, OperationalError, ReportProcessorDBError) as error:
+            close_and_set_db_connection()
+            LOG.error(f"[process_message_until_done] Database error. {type(error).__name__}: {error}. Retrying...")
+        except (KafkaMsgHandlerError, RabbitOperationalError) as error:
+            LOG.error(f"[process_message_until_done] Internal error. {type(error).__name__}: {error}. Retrying...")
+        except ReportProcessorError as error:
+            LOG.error(f"[process_message_until_done] Report processing error: {str(error)}")
+            return
+        except Exception as error:
+            LOG.error(
+                f"[process_message_until_done] UNKNOWN error encountered: {type(error).__name__}: {error}",
+                exc_info=True,
+            )
+            return
+        LOG.info(f"Retrying offset: {offset}, partition: {partition}")
+        time.sleep(Config.RETRY_SECONDS)
+
+
+class PartitionOffsets:
+    """Offsets of a partition's in flight messages, released for commit in order."""
+
+    def __init__(self):
+        """Initialize the offsets."""
+        self._pending = deque()
+        self._done = set()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, offset):
+        """Track a polled offset, offsets are polled in increasing order."""
+        self._pending.append(offset)
+
+    def done(self, offset):
+        """
+        Mark an offset processed.
+
+        Args:
+            offset (int): Offset of the processed message
+
+        Returns:
+            (int) Offset to commit, the one after the last processed message
+                  preceded only by processed messages, or None if there is none
+
+        """
+        self._done.add(offset)
+        commit_offset = None
+        while self._pending and self._pending[0] in self._done:
+            head = self._pending.popleft()
+            self._done.discard(head)
+            commit_offset = head + 1
+        return commit_offset
+
+
+class ConcurrentMessageListener:
+    """
+    Process hccm messages with a pool of worker threads.
+
+    At most `workers` messages are polled but not yet processed. Messages of an
+    account are processed one at a time, in order, since the cluster a payload
+    belongs to is only known once it is downloaded. Offsets are committed per
+    partition once every earlier message of the partition is processed, so a
+    message is never committed before it is processed.
+    """
+
+    def __init__(self, consumer, workers):
+        """
+        Args:
+            consumer (Consumer): kafka consumer for HCCM ingress topic
+            workers (int): Number of messages to process concurrently
+        """
+        self.consumer = consumer
+        self.workers = workers
+        self._executor = None
+        self._offsets = {}
+        self._waiting = {}
+        self._running = {}
+        self._busy_accounts = set()
+
+    @property
+    def in_flight(self):
+        """Number of polled messages not yet processed."""
+        return sum(len(offsets) for offsets in self._offsets.values())
+
+    def listen(self):
+        """Poll and process messages, then wait for the ones in flight."""
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hccm-msg") as executor:
+            self._executor = executor
+            for _ in itertools.count():  # equivalent to while True, but mockable
+                if self.in_flight < self.workers:
+                    msg = poll_message(self.consumer)
+                    if msg is not None:
+                        self.add(msg)
+                    self._reap(timeout=0)
+                else:
+                    self._reap(timeout=1.0)
+            while self._running:
+                self._reap(timeout=None)
+
+    def add(self, msg):
+        """Queue a message behind the messages of its account, skipping messages that can not be read."""
+        partition = msg.partition()
+        offsets = self._offsets.setdefault(partition, PartitionOffsets())
+        offsets.add(msg.offset())
+        try:
+            value = json.loads(msg.value().decode("utf-8"))
+            account = value.get("account", "no_account")
+        except (ValueError, AttributeError) as error:
+            # A message that can not be read never will be, it is committed once the ones before it are
+            LOG.error(
+                f"Unable to read message offset: {msg.offset()} partition: {partition}. "
+                f"Error: {type(error).__name__}: {error}"
+            )
+            commit_offset = offsets.done(msg.offset())
+            if commit_offset is not None:
+                self._commit(partition, commit_offset)
+            return
+        self._waiting.setdefault(account, deque()).append(msg)
+        if account not in self._busy_accounts:
+            self._submit(account)
+
+    def _submit(self, account):
+        """Start processing the next message of an account."""
+        queue = self._waiting.get(account)
+        if not queue:
+            self._waiting.pop(account, None)
+            self._busy_accounts.discard(account)
+            return
+        msg = queue.popleft()
+        future = self._executor.submit(process_message_until_done, msg)
+        self._running[future] = (account, msg)
+        self._busy_accounts.add(account)
+
+    def _reap(self, timeout):
+        """Commit the offsets of the messages processed within timeout."""
+        if not self._running:
+            return
+        done, _ = wait(self._running, timeout=timeout, return_when=FIRST_COMPLETED)
+        commit_offsets = {}
+        for future in done:
+            account, msg = self._running.pop(future)
+            self._submit(account)
+            partition = msg.partition()
+            commit_offset = self._offsets[partition].done(msg.offset())
+            if commit_offset is not None:
+                commit_offsets[partition] = commit_offset
+        for partition, offset in commit_offsets.items():
+            self._commit(partition, offset)
+
+    def _commit(self, partition, offset):
+        """Commit a partition's offset."""
+        LOG.debug(f"COMMITTING: offset: {offset} partition: {partition}")
+        try:
+            self.consumer.commit(offsets=[TopicPartition(HCCM_TOPIC, partition, offset)], asynchronous=False)
+        except KafkaException as error:
+            # The partition was likely reassigned, its messages are delivered again
+            LOG.warning(f"Unable to commit offset: {offset} partition: {partition}. Error: {error}")
+
+
 def koku_listener_thread():  # pragma: no cover
     """
     Configure Listener listener thread.
@@ -42,6 +42,7 @@ def _get_report_files(
     report_month,
     cache_key,
     report_context,
+    downloader=None,
 ):
     """
     Task to download a Report.
@@ -56,6 +57,7 @@ def _get_report_files(
         provider_uuid     (String): Provider uuid.
         report_month      (DateTime): Month for report to download.
         cache_key         (String): The provider specific task cache value.
+        downloader        (ReportDownloader): Downloader to reuse, created when None.
 
     Returns:
         files (List) List of filenames with full local path.
@@ -84,16 +86,17 @@ def _get_report_files(
 
     report = None
     try:
-        downloader = ReportDownloader(
-            customer_name=customer_name,
-            credentials=authentication,
-            data_source=billing_source,
-            provider_type=provider_type,
-            provider_uuid=provider_uuid,
-            report_name=None,
-            account=customer_name[4:],
-            request_id=task.request.id,
-        )
+        if downloader is None:
+            downloader = ReportDownloader(
+                customer_name=customer_name,
+                credentials=authentication,
+                data_source=billing_source,
+                provider_type=provider_type,
+                provider_uuid=provider_uuid,
+                report_name=None,
+                account=customer_name[4:],
+                request_id=task.request.id,
+            )
         report = downloader.download_report(report_context)
     except (MasuProcessingError, MasuProviderError, ReportDownloaderError) as err:
         worker_stats.REPORT_FILE_DOWNLOAD_ERROR_COUNTER.labels(provider_type=provider_type).inc()
@@ -30,7 +30,7 @@ from masu.processor.report_processor import ReportProcessorError
 LOG = get_task_logger(__name__)
 
 
-def _process_report_file(schema_name, provider, report_dict):
+def _process_report_file(schema_name, provider, report_dict, lookup_cache=None):
     """
     Task to process a Report.
 
@@ -38,6 +38,7 @@ def _process_report_file(schema_name, provider, report_dict):
         schema_name   (String) db schema name
         provider      (String) provider type
         report_dict   (dict) The report data dict from previous task
+        lookup_cache  (dict) Database id lookups shared by the files of a manifest processed together
 
     Returns:
         None
@@ -75,6 +76,7 @@ def _process_report_file(schema_name, provider, report_dict):
             provider_uuid=provider_uuid,
             manifest_id=manifest_id,
             context=report_dict,
+            lookup_cache=lookup_cache,
         )
 
         processor.process()
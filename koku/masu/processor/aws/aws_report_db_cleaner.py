@@ -20,6 +20,7 @@ from datetime import datetime
 
 from tenant_schemas.utils import schema_context
 
+from masu.database import AWS_CUR_TABLE_MAP
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 
 LOG = logging.getLogger(__name__)
@@ -90,13 +91,17 @@ class AWSReportDBCleaner:
     def purge_expired_report_data(self, expired_date=None, provider_uuid=None, simulate=False):
         """Remove report data with a billing start period before specified date.
 
+        When removing by expired date, the daily summary partitions of expired
+        months are dropped instead of deleting their rows.
+
         Args:
             expired_date (datetime.datetime): The cutoff date for removing data.
             provider_uuid (uuid): The DB id of the provider to purge data for.
             simulate (bool): Whether to simluate the removal.
 
         Returns:
-            ([{}]) List of dictionaries containing 'account_payer_id' and 'billing_period_start'
+            ([{}]) List of dictionaries containing 'account_payer_id', 'billing_period_start'
+                and the dropped 'partitions'
 
         """
         LOG.info("Calling purge_expired_report_data for aws")
@@ -109,8 +114,12 @@ class AWSReportDBCleaner:
                 raise AWSReportDBCleanerError(err)
             removed_items = []
 
+            expired_partitions = []
             if expired_date is not None:
                 bill_objects = accessor.get_bill_query_before_date(expired_date)
+                expired_partitions = accessor.purge_expired_partitions(
+                    AWS_CUR_TABLE_MAP["line_item_daily_summary"], expired_date, simulate=simulate
+                )
             else:
                 bill_objects = accessor.get_cost_entry_bills_query_by_provider(provider_uuid)
             with schema_context(self._schema):
@@ -118,6 +127,8 @@ class AWSReportDBCleaner:
                     bill_id = bill.id
                     removed_payer_account_id = bill.payer_account_id
                     removed_billing_period_start = bill.billing_period_start
+                    month_start = str(removed_billing_period_start.date().replace(day=1))
+                    bill_partitions = [p for p in expired_partitions if p["partition_start"] == month_start]
 
                     if not simulate:
                         del_count = accessor.get_ocp_aws_summary_query_for_billid(bill_id).delete()
@@ -132,8 +143,9 @@ class AWSReportDBCleaner:
                         del_count = accessor.get_daily_query_for_billid(bill_id).delete()
                         LOG.info("Removing %s cost entry daily items for bill id %s", del_count, bill_id)
 
-                        del_count = accessor.get_summary_query_for_billid(bill_id).delete()
-                        LOG.info("Removing %s cost entry summary items for bill id %s", del_count, bill_id)
+                        if not bill_partitions:
+                            del_count = accessor.get_summary_query_for_billid(bill_id).delete()
+                            LOG.info("Removing %s cost entry summary items for bill id %s", del_count, bill_id)
 
                         del_count = accessor.get_cost_entry_query_for_billid(bill_id).delete()
                         LOG.info("Removing %s cost entry items for bill id %s", del_count, bill_id)
@@ -147,6 +159,7 @@ class AWSReportDBCleaner:
                         {
                             "account_payer_id": removed_payer_account_id,
                             "billing_period_start": str(removed_billing_period_start),
+                            "partitions": bill_partitions,
                         }
                     )
 
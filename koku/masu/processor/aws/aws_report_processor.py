@@ -24,9 +24,11 @@ from os import remove
 import ciso8601
 from django.conf import settings
 from django.db import transaction
+from tenant_schemas.utils import schema_context
 
 from masu.config import Config
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
+from masu.processor.dimension_cache import DimensionCache
 from masu.processor.report_processor_base import ReportProcessorBase
 from masu.util.common import split_alphanumeric_string
 from reporting.provider.aws.models import AWSCostEntry
@@ -70,7 +72,7 @@ class ProcessedReport:
 class AWSReportProcessor(ReportProcessorBase):
     """Cost Usage Report processor."""
 
-    def __init__(self, schema_name, report_path, compression, provider_uuid, manifest_id=None):
+    def __init__(self, schema_name, report_path, compression, provider_uuid, manifest_id=None, lookup_cache=None):
         """Initialize the report processor.
 
         Args:
@@ -78,6 +80,8 @@ class AWSReportProcessor(ReportProcessorBase):
             report_path (str): Where the report file lives in the file system
             compression (CONST): How the report file is compressed.
                 Accepted values: UNCOMPRESSED, GZIP_COMPRESSED
+            lookup_cache (dict): Database id lookup maps shared with the processors of
+                other files of the manifest, loaded into it when empty
 
         """
         super().__init__(
@@ -98,11 +102,20 @@ class AWSReportProcessor(ReportProcessorBase):
 
         with AWSReportDBAccessor(self._schema) as report_db:
             self.report_schema = report_db.report_schema
-            self.existing_bill_map = report_db.get_cost_entry_bills()
-            self.existing_cost_entry_map = report_db.get_cost_entries()
-            self.existing_product_map = report_db.get_products()
-            self.existing_pricing_map = report_db.get_pricing()
-            self.existing_reservation_map = report_db.get_reservations()
+
+        if not lookup_cache:
+            lookup_maps = self._get_lookup_caches()
+            if lookup_cache is None:
+                lookup_cache = lookup_maps
+            else:
+                lookup_cache.update(lookup_maps)
+
+        # The caches are updated in place as rows are created, which keeps a shared cache current
+        self.existing_bill_map = lookup_cache["bill"]
+        self.existing_cost_entry_map = lookup_cache["cost_entry"]
+        self.existing_product_map = lookup_cache["product"]
+        self.existing_pricing_map = lookup_cache["pricing"]
+        self.existing_reservation_map = lookup_cache["reservation"]
 
         self.line_item_columns = None
         self.table_name = AWSCostEntryLineItem()
@@ -114,6 +127,55 @@ class AWSReportProcessor(ReportProcessorBase):
         )
         LOG.info(stmt)
 
+    def _get_lookup_caches(self):
+        """Return bounded caches of the dimension ids line items refer to, loaded on miss."""
+        max_size = Config.REPORT_PROCESSING_LOOKUP_CACHE_SIZE
+        return {
+            "bill": DimensionCache(self._load_bill_id, max_size, "bill"),
+            "cost_entry": DimensionCache(self._load_cost_entry_id, max_size, "cost_entry"),
+            "product": DimensionCache(self._load_product_id, max_size, "product"),
+            "pricing": DimensionCache(self._load_pricing_id, max_size, "pricing"),
+            "reservation": DimensionCache(self._load_reservation_id, max_size, "reservation"),
+        }
+
+    def _load_dimension_id(self, table, key, **filters):
+        """Look up the id of one dimension row, returned as a {key: id} dictionary for its cache."""
+        with schema_context(self._schema):
+            return {key: table.objects.filter(**filters).values_list("id", flat=True).first()}
+
+    def _load_bill_id(self, key):
+        """Look up a bill by type, payer account, billing period start and provider."""
+        bill_type, payer_account_id, billing_period_start, provider_id = key
+        return self._load_dimension_id(
+            AWSCostEntryBill,
+            key,
+            bill_type=bill_type,
+            payer_account_id=payer_account_id,
+            billing_period_start=billing_period_start,
+            provider_id=provider_id,
+        )
+
+    def _load_cost_entry_id(self, key):
+        """Look up a cost entry of a bill by interval start."""
+        bill_id, interval_start = key
+        return self._load_dimension_id(AWSCostEntry, key, bill_id=bill_id, interval_start=interval_start)
+
+    def _load_product_id(self, key):
+        """Look up a product by sku, product name and region."""
+        sku, product_name, region = key
+        return self._load_dimension_id(AWSCostEntryProduct, key, sku=sku, product_name=product_name, region=region)
+
+    def _load_pricing_id(self, key):
+        """Look up a pricing by term and unit."""
+        # Pricing keys are "term-unit", with "None" standing in for a missing term or unit
+        term, _, unit = key.partition("-")
+        term, unit = (None if value == "None" else value for value in (term, unit))
+        return self._load_dimension_id(AWSCostEntryPricing, key, term=term, unit=unit)
+
+    def _load_reservation_id(self, key):
+        """Look up a reservation by ARN."""
+        return self._load_dimension_id(AWSCostEntryReservation, key, reservation_arn=key)
+
     def process(self):  # noqa: C901
         """Process CUR file.
 
@@ -191,6 +253,9 @@ class AWSReportProcessor(ReportProcessorBase):
                 if self.processed_report.line_items:
                     report_db.merge_temp_table(self.table_name._meta.db_table, temp_table, self.line_item_columns)
 
+                # Later files sharing the lookup cache reuse the rows created for this one
+                self._update_mappings()
+
         LOG.info("Completed report processing for file: %s and schema: %s", self._report_name, self._schema)
 
         if not settings.DEVELOPMENT:
@@ -216,6 +281,7 @@ class AWSReportProcessor(ReportProcessorBase):
 
     def _update_mappings(self):
         """Update cache of database objects for reference."""
+        self.existing_bill_map.update(self.processed_report.bills)
         self.existing_cost_entry_map.update(self.processed_report.cost_entries)
         self.existing_product_map.update(self.processed_report.products)
         self.existing_pricing_map.update(self.processed_report.pricing)
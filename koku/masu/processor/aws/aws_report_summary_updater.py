@@ -21,11 +21,13 @@ import logging
 
 from tenant_schemas.utils import schema_context
 
+from masu.config import Config
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.external.date_accessor import DateAccessor
 from masu.util.aws.common import get_bills_from_provider
 from masu.util.common import date_range_pair
+from masu.util.common import date_range_pair_by_rows
 
 LOG = logging.getLogger(__name__)
 
@@ -57,18 +59,10 @@ class AWSReportSummaryUpdater:
 
         """
         start_date, end_date = self._get_sql_inputs(start_date, end_date)
-        bills = get_bills_from_provider(
-            self._provider.uuid,
-            self._schema,
-            datetime.datetime.strptime(start_date, "%Y-%m-%d"),
-            datetime.datetime.strptime(end_date, "%Y-%m-%d"),
-        )
-        bill_ids = []
-        with schema_context(self._schema):
-            bill_ids = [str(bill.id) for bill in bills]
+        bill_ids = self._get_bill_ids(start_date, end_date)
 
         with AWSReportDBAccessor(self._schema) as accessor:
-            for start, end in date_range_pair(start_date, end_date):
+            for start, end in self._get_date_chunks(start_date, end_date, bill_ids):
                 LOG.info(
                     "Updating AWS report daily tables for \n\tSchema: %s" "\n\tProvider: %s \n\tDates: %s - %s",
                     self._schema,
@@ -92,20 +86,10 @@ class AWSReportSummaryUpdater:
 
         """
         start_date, end_date = self._get_sql_inputs(start_date, end_date)
-        bills = get_bills_from_provider(
-            self._provider.uuid,
-            self._schema,
-            datetime.datetime.strptime(start_date, "%Y-%m-%d"),
-            datetime.datetime.strptime(end_date, "%Y-%m-%d"),
-        )
-        bill_ids = []
-        with schema_context(self._schema):
-            bill_ids = [str(bill.id) for bill in bills]
+        bill_ids = self._get_bill_ids(start_date, end_date)
 
         with AWSReportDBAccessor(self._schema) as accessor:
-            # Need these bills on the session to update dates after processing
-            bills = accessor.bills_for_provider_uuid(self._provider.uuid, start_date)
-            for start, end in date_range_pair(start_date, end_date):
+            for start, end in self._get_date_chunks(start_date, end_date, bill_ids):
                 LOG.info(
                     "Updating AWS report summary tables: \n\tSchema: %s" "\n\tProvider: %s \n\tDates: %s - %s",
                     self._schema,
@@ -114,6 +98,60 @@ class AWSReportSummaryUpdater:
                     end,
                 )
                 accessor.populate_line_item_daily_summary_table(start, end, bill_ids)
+        self.finalize_summary_tables(start_date, end_date)
+
+        return start_date, end_date
+
+    def get_date_chunks(self, start_date, end_date):
+        """Get the dates to summarize and their chunks, each summarized by one statement.
+
+        Args:
+            start_date (str) The date to start populating the table.
+            end_date   (str) The date to end on.
+
+        Returns
+            (str, str, list): A start date, an end date and the (start, end) pair of each chunk.
+
+        """
+        start_date, end_date = self._get_sql_inputs(start_date, end_date)
+        bill_ids = self._get_bill_ids(start_date, end_date)
+        return start_date, end_date, list(self._get_date_chunks(start_date, end_date, bill_ids))
+
+    def update_chunk_tables(self, start_date, end_date):
+        """Populate the daily and summary tables of one date chunk.
+
+        Chunks cover separate dates, so they can be populated at the same time.
+
+        Args:
+            start_date (str) The date to start populating the tables.
+            end_date   (str) The date to end on.
+
+        """
+        bill_ids = self._get_bill_ids(start_date, end_date)
+        with AWSReportDBAccessor(self._schema) as accessor:
+            LOG.info(
+                "Updating AWS report daily and summary tables for chunk: \n\tSchema: %s"
+                "\n\tProvider: %s \n\tDates: %s - %s",
+                self._schema,
+                self._provider.uuid,
+                start_date,
+                end_date,
+            )
+            accessor.populate_line_item_daily_table(start_date, end_date, bill_ids)
+            accessor.populate_line_item_daily_summary_table(start_date, end_date, bill_ids)
+
+    def finalize_summary_tables(self, start_date, end_date):
+        """Populate the tag summary and mark the bills summarized once every date is.
+
+        Args:
+            start_date (str) The date the summary started at.
+            end_date   (str) The date the summary ended on.
+
+        """
+        bill_ids = self._get_bill_ids(start_date, end_date)
+        with AWSReportDBAccessor(self._schema) as accessor:
+            # Need these bills on the session to update dates after processing
+            bills = accessor.bills_for_provider_uuid(self._provider.uuid, start_date)
             accessor.populate_tags_summary_table(bill_ids)
             for bill in bills:
                 if bill.summary_data_creation_datetime is None:
@@ -121,7 +159,24 @@ class AWSReportSummaryUpdater:
                 bill.summary_data_updated_datetime = self._date_accessor.today_with_timezone("UTC")
                 bill.save()
 
-        return start_date, end_date
+    def _get_bill_ids(self, start_date, end_date):
+        """Get the ids of the bills of the provider between the dates."""
+        bills = get_bills_from_provider(
+            self._provider.uuid,
+            self._schema,
+            datetime.datetime.strptime(str(start_date), "%Y-%m-%d"),
+            datetime.datetime.strptime(str(end_date), "%Y-%m-%d"),
+        )
+        with schema_context(self._schema):
+            return [str(bill.id) for bill in bills]
+
+    def _get_date_chunks(self, start_date, end_date, bill_ids):
+        """Split the dates in chunks of Config.SUMMARY_CHUNK_ROWS line items, or of 5 days if it is 0."""
+        if not Config.SUMMARY_CHUNK_ROWS:
+            return date_range_pair(start_date, end_date)
+        with AWSReportDBAccessor(self._schema) as accessor:
+            day_counts = accessor.get_line_item_counts_by_day(start_date, end_date, bill_ids)
+        return date_range_pair_by_rows(start_date, end_date, day_counts, Config.SUMMARY_CHUNK_ROWS)
 
     def _get_sql_inputs(self, start_date, end_date):
         """Get the required inputs for running summary SQL."""
@@ -19,6 +19,7 @@ import logging
 
 from tenant_schemas.utils import schema_context
 
+from masu.database import AZURE_REPORT_TABLE_MAP
 from masu.database.azure_report_db_accessor import AzureReportDBAccessor
 
 LOG = logging.getLogger(__name__)
@@ -43,13 +44,17 @@ class AzureReportDBCleaner:
     def purge_expired_report_data(self, expired_date=None, provider_uuid=None, simulate=False):
         """Remove report data with a billing start period before specified date.
 
+        When removing by expired date, the daily summary partitions of expired
+        months are dropped instead of deleting their rows.
+
         Args:
             expired_date (datetime.datetime): The cutoff date for removing data.
             provider_uuid (uuid): The DB id of the provider to purge data for.
             simulate (bool): Whether to simulate the removal.
 
         Returns:
-            ([{}]) List of dictionaries containing 'account_payer_id' and 'billing_period_start'
+            ([{}]) List of dictionaries containing 'account_payer_id', 'billing_period_start'
+                and the dropped 'partitions'
 
         """
         LOG.info("Calling purge_expired_report_data for azure")
@@ -62,8 +67,12 @@ class AzureReportDBCleaner:
                 raise AzureReportDBCleanerError(err)
             removed_items = []
 
+            expired_partitions = []
             if expired_date is not None:
                 bill_objects = accessor.get_bill_query_before_date(expired_date)
+                expired_partitions = accessor.purge_expired_partitions(
+                    AZURE_REPORT_TABLE_MAP["line_item_daily_summary"], expired_date, simulate=simulate
+                )
             else:
                 bill_objects = accessor.get_cost_entry_bills_query_by_provider(provider_uuid)
             with schema_context(self._schema):
@@ -71,14 +80,17 @@ class AzureReportDBCleaner:
                     bill_id = bill.id
                     removed_provider_uuid = bill.provider_id
                     removed_billing_period_start = bill.billing_period_start
+                    month_start = str(removed_billing_period_start.date().replace(day=1))
+                    bill_partitions = [p for p in expired_partitions if p["partition_start"] == month_start]
 
                     if not simulate:
 
                         del_count = accessor.get_lineitem_query_for_billid(bill_id).delete()
                         LOG.info("Removing %s cost entry line items for bill id %s", del_count, bill_id)
 
-                        del_count = accessor.get_summary_query_for_billid(bill_id).delete()
-                        LOG.info("Removing %s cost entry summary items for bill id %s", del_count, bill_id)
+                        if not bill_partitions:
+                            del_count = accessor.get_summary_query_for_billid(bill_id).delete()
+                            LOG.info("Removing %s cost entry summary items for bill id %s", del_count, bill_id)
 
                     LOG.info(
                         "Report data removed for Account Payer ID: %s with billing period: %s",
@@ -89,6 +101,7 @@ class AzureReportDBCleaner:
                         {
                             "provider_uuid": removed_provider_uuid,
                             "billing_period_start": str(removed_billing_period_start),
+                            "partitions": bill_partitions,
                         }
                     )
 
@@ -0,0 +1,104 @@
+#
+# Copyright 2021 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Bounded caches of report dimension database ids."""
+from collections import OrderedDict
+from hashlib import blake2b
+
+# Cached in place of the id of a key the loader did not find
+_MISSING = object()
+
+
+def hash_key(key):
+    """Return a 64 bit integer standing in for a dimension's natural key."""
+    return int.from_bytes(blake2b(repr(key).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class DimensionCache:
+    """
+    Least recently used map of a dimension's natural keys to database ids.
+
+    Keys are stored as 64 bit hashes instead of tuples of strings, and at most
+    max_size entries are kept. A key that is not cached is looked up with the loader,
+    which returns a dictionary of keys to ids: the requested key, or a whole scope
+    such as every entry of a bill. A key the loader does not find is cached as
+    missing, so it is looked up once until its id is set. A miss is never wrong,
+    since rows are inserted with ON CONFLICT DO NOTHING and their id read back.
+    """
+
+    def __init__(self, loader, max_size, name="dimension"):
+        """
+        Args:
+            loader (Callable): Takes a missing key, returns a {key: id} dictionary to cache
+            max_size (int): Maximum number of cached entries
+            name (str): Name of the dimension for logging
+        """
+        self._loader = loader
+        self._entries = OrderedDict()
+        self.max_size = max_size
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._store(hash_key(key), value)
+
+    def _store(self, hashed_key, value):
+        self._entries[hashed_key] = value
+        self._entries.move_to_end(hashed_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Return the id for key, loading it on a miss."""
+        hashed_key = hash_key(key)
+        if hashed_key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(hashed_key)
+            value = self._entries[hashed_key]
+            return default if value is _MISSING else value
+
+        self.misses += 1
+        self.update(self._loader(key) or {})
+        if hashed_key not in self._entries:
+            self._store(hashed_key, _MISSING)
+        value = self._entries[hashed_key]
+        return default if value is _MISSING else value
+
+    def update(self, mapping):
+        """Cache every key and id of mapping, a None id caching the key as missing."""
+        for key, value in mapping.items():
+            self._store(hash_key(key), _MISSING if value is None else value)
+
+    def values(self):
+        """Return the cached ids."""
+        return [value for value in self._entries.values() if value is not _MISSING]
+
+    def clear(self):
+        """Forget every cached entry."""
+        self._entries.clear()
@@ -20,6 +20,7 @@ from datetime import datetime
 
 from tenant_schemas.utils import schema_context
 
+from masu.database import OCP_REPORT_TABLE_MAP
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
 
 LOG = logging.getLogger(__name__)
@@ -86,13 +87,17 @@ class OCPReportDBCleaner:
     def purge_expired_report_data(self, expired_date=None, provider_uuid=None, simulate=False):
         """Remove usage data with a report period before specified date.
 
+        When removing by expired date, the daily summary partitions of expired
+        months are dropped instead of deleting their rows.
+
         Args:
             expired_date (datetime.datetime): The cutoff date for removing data.
             provider_uuid (uuid): The DB id of the provider to purge data for.
             simulate (bool): Whether to simluate the removal.
 
         Returns:
-            ([{}]) List of dictionaries containing 'usage_period_id' and 'interval_start'
+            ([{}]) List of dictionaries containing 'usage_period_id', 'interval_start'
+                and the dropped 'partitions'
 
         """
         LOG.info("Calling purge_expired_report_data for ocp")
@@ -105,8 +110,12 @@ class OCPReportDBCleaner:
                 raise OCPReportDBCleanerError(err)
             removed_items = []
 
+            expired_partitions = []
             if expired_date is not None:
                 usage_period_objs = accessor.get_usage_period_on_or_before_date(expired_date)
+                expired_partitions = accessor.purge_expired_partitions(
+                    OCP_REPORT_TABLE_MAP["line_item_daily_summary"], expired_date, simulate=simulate
+                )
             else:
                 usage_period_objs = accessor.get_usage_period_query_by_provider(provider_uuid)
             with schema_context(self._schema):
@@ -114,6 +123,8 @@ class OCPReportDBCleaner:
                     report_period_id = usage_period.id
                     cluster_id = usage_period.cluster_id
                     removed_usage_start_period = usage_period.report_period_start
+                    month_start = str(removed_usage_start_period.date().replace(day=1))
+                    period_partitions = [p for p in expired_partitions if p["partition_start"] == month_start]
 
                     if not simulate:
                         qty = accessor.get_item_query_report_period_id(report_period_id).delete()
@@ -122,8 +133,9 @@ class OCPReportDBCleaner:
                         qty = accessor.get_daily_usage_query_for_clusterid(cluster_id).delete()
                         LOG.info("Removing %s usage daily items for cluster id %s", qty, cluster_id)
 
-                        qty = accessor.get_summary_usage_query_for_clusterid(cluster_id).delete()
-                        LOG.info("Removing %s usage summary items for cluster id %s", qty, cluster_id)
+                        if not period_partitions:
+                            qty = accessor.get_summary_usage_query_for_clusterid(cluster_id).delete()
+                            LOG.info("Removing %s usage summary items for cluster id %s", qty, cluster_id)
 
                         qty = accessor.get_cost_summary_for_clusterid(cluster_id).delete()
                         LOG.info("Removing %s cost summary items for cluster id %s", qty, cluster_id)
@@ -155,7 +167,11 @@ class OCPReportDBCleaner:
                         removed_usage_start_period,
                     )
                     removed_items.append(
-                        {"usage_period_id": report_period_id, "interval_start": str(removed_usage_start_period)}
+                        {
+                            "usage_period_id": report_period_id,
+                            "interval_start": str(removed_usage_start_period),
+                            "partitions": period_partitions,
+                        }
                     )
 
                 if not simulate:
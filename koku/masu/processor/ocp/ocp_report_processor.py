@@ -18,15 +18,19 @@
 import csv
 import json
 import logging
+from decimal import Decimal
 from os import path
 from os import remove
 
 import ciso8601
+import numpy as np
+import pandas as pd
 from django.conf import settings
 from django.db import transaction
 
 from masu.config import Config
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
+from masu.external import GZIP_COMPRESSED
 from masu.processor.report_processor_base import ReportProcessorBase
 from masu.util.ocp import common as utils
 from reporting.provider.ocp.models import OCPNamespaceLabelLineItem
@@ -36,6 +40,7 @@ from reporting.provider.ocp.models import OCPUsageLineItem
 from reporting.provider.ocp.models import OCPUsageLineItemDailySummary
 from reporting.provider.ocp.models import OCPUsageReport
 from reporting.provider.ocp.models import OCPUsageReportPeriod
+from reporting_common import REPORT_COLUMN_MAP
 
 
 LOG = logging.getLogger(__name__)
@@ -104,6 +109,11 @@ class OCPReportProcessor:
 class OCPReportProcessorBase(ReportProcessorBase):
     """Base class for OCP report processing."""
 
+    # Rows missing any of these columns are skipped
+    required_columns = ()
+    # Columns holding OpenShift label strings to be converted to JSON
+    label_columns = ()
+
     def __init__(self, schema_name, report_path, compression, provider_uuid):
         """Initialize base class."""
         super().__init__(
@@ -127,6 +137,7 @@ class OCPReportProcessorBase(ReportProcessorBase):
             self.existing_report_map = report_db.get_reports()
 
         self.line_item_columns = None
+        self._line_item_hashes = np.array([], dtype=np.uint64)
 
     def _create_report(self, row, report_period_id, report_db_accessor):
         """Create a report object.
@@ -220,6 +231,21 @@ class OCPReportProcessorBase(ReportProcessorBase):
 
         self.processed_report.remove_processed_rows()
 
+    def _add_requested_partition(self, report_period_start):
+        """Record the partition start for a report period start string."""
+        if report_period_start:
+            try:
+                li_usage_dt = (
+                    ciso8601.parse_datetime(report_period_start.replace(" +0000 UTC", "+0000")).date().replace(day=1)
+                )
+            except (ValueError, TypeError):
+                pass  # This is just gathering requested partition start values
+                # If it's invalid, then it's OK to omit storing that value
+                # as it only pertains to a requested partition.
+            else:
+                if li_usage_dt not in self.processed_report.requested_partitions:
+                    self.processed_report.requested_partitions.add(li_usage_dt)
+
     def process(self):
         """Process usage report file.
 
@@ -227,6 +253,19 @@ class OCPReportProcessorBase(ReportProcessorBase):
             (None)
 
         """
+        if Config.OCP_COLUMNAR_PROCESSING:
+            self._process_columnar()
+        else:
+            self._process_rows()
+
+        LOG.info("Completed report processing for file: %s and schema: %s", self._report_path, self._schema)
+
+        if not settings.DEVELOPMENT:
+            LOG.info("Removing processed file: %s", self._report_path)
+            remove(self._report_path)
+
+    def _process_rows(self):
+        """Process the usage report file one row at a time."""
         row_count = 0
         opener, mode = self._get_file_opener(self._compression)
         with opener(self._report_path, mode) as f:
@@ -235,21 +274,7 @@ class OCPReportProcessorBase(ReportProcessorBase):
                 LOG.info(f"File '{self._report_path}' opened for processing")
                 reader = csv.DictReader(f)
                 for row in reader:
-                    li_usage_dt = row.get("report_period_start")
-                    if li_usage_dt:
-                        try:
-                            li_usage_dt = (
-                                ciso8601.parse_datetime(li_usage_dt.replace(" +0000 UTC", "+0000"))
-                                .date()
-                                .replace(day=1)
-                            )
-                        except (ValueError, TypeError):
-                            pass  # This is just gathering requested partition start values
-                            # If it's invalid, then it's OK to omit storing that value
-                            # as it only pertains to a requested partition.
-                        else:
-                            if li_usage_dt not in self.processed_report.requested_partitions:
-                                self.processed_report.requested_partitions.add(li_usage_dt)
+                    self._add_requested_partition(row.get("report_period_start"))
 
                     report_period_id = self._create_report_period(
                         row, self._cluster_id, report_db, self._cluster_alias
@@ -290,11 +315,135 @@ class OCPReportProcessorBase(ReportProcessorBase):
                     )
                     row_count += len(self.processed_report.line_items)
 
-        LOG.info("Completed report processing for file: %s and schema: %s", self._report_path, self._schema)
+    def _process_columnar(self):
+        """Process the usage report file in chunks of DataFrame rows."""
+        row_count = 0
+        compression = "gzip" if self._compression == GZIP_COMPRESSED else None
+        table_name = self.table_name._meta.db_table
+        reader = pd.read_csv(
+            self._report_path, chunksize=self._batch_size, dtype=str, keep_default_na=False, compression=compression
+        )
+        with OCPReportDBAccessor(self._schema) as report_db:
+            temp_table = report_db.create_temp_table(table_name, drop_column="id")
+            LOG.info(f"File '{self._report_path}' opened for columnar processing")
+            for chunk in reader:
+                line_items = self._process_dataframe(chunk, report_db)
+                if line_items.empty:
+                    continue
+                LOG.info(
+                    "Saving report rows %d to %d for %s", row_count, row_count + len(line_items), self._report_name
+                )
+                self._save_dataframe_to_db(line_items, temp_table, report_db)
+                report_db.merge_temp_table(
+                    table_name, temp_table, self.line_item_columns, self.line_item_conflict_columns
+                )
+                row_count += len(line_items)
+                self._update_mappings()
+
+    def _process_dataframe(self, chunk, report_db):
+        """Convert a chunk of report rows into line items for the database.
 
-        if not settings.DEVELOPMENT:
-            LOG.info("Removing processed file: %s", self._report_path)
-            remove(self._report_path)
+        Args:
+            chunk (DataFrame): Report rows with every value read as a string
+            report_db (OCPReportDBAccessor): The database accessor
+
+        Returns:
+            (DataFrame): The line items keyed on the DB table's column names
+
+        """
+        table_name = self.table_name._meta.db_table
+        column_map = {key.lower(): value for key, value in REPORT_COLUMN_MAP[table_name].items()}
+        line_items = chunk[[column for column in chunk.columns if column.lower() in column_map]]
+        line_items = line_items.rename(columns=lambda column: column_map[column.lower()])
+
+        # Skip invalid rows
+        for column in self.required_columns:
+            if column not in line_items:
+                return line_items.iloc[0:0]
+            line_items = line_items[line_items[column] != ""]
+        if line_items.empty:
+            return line_items
+
+        line_items = self._clean_dataframe(line_items, report_db.report_schema.column_types[table_name])
+        for label_column in self.label_columns:
+            if label_column in chunk:
+                label_series = chunk.loc[line_items.index, label_column]
+                line_items[label_column] = self._process_openshift_label_series(label_series)
+            else:
+                line_items[label_column] = self._process_openshift_labels("")
+
+        report_ids = self._get_report_ids(chunk.loc[line_items.index], report_db)
+        line_items["report_period_id"] = report_ids["report_period_id"].to_numpy()
+        line_items["report_id"] = report_ids["report_id"].to_numpy()
+
+        # Deduplicate potential repeated rows in data
+        line_items = line_items.drop_duplicates(subset=self.line_item_conflict_columns)
+        line_item_hashes = pd.util.hash_pandas_object(line_items[self.line_item_conflict_columns], index=False)
+        line_item_hashes = line_item_hashes.to_numpy()
+        line_items = line_items[~np.isin(line_item_hashes, self._line_item_hashes)]
+        self._line_item_hashes = np.concatenate([self._line_item_hashes, line_item_hashes])
+
+        if self.line_item_columns is None:
+            self.line_item_columns = list(line_items.columns)
+
+        return line_items[self.line_item_columns]
+
+    @staticmethod
+    def _clean_dataframe(line_items, column_types):
+        """Convert DataFrame columns to the types required by the database.
+
+        Empty or invalid values become nulls, matching ReportDBAccessorBase.clean_data.
+        """
+        line_items = line_items.copy()
+        for column in line_items.columns:
+            column_type = column_types.get(column)
+            if column_type in (int, "BigIntegerField"):
+                values = pd.to_numeric(line_items[column], errors="coerce")
+                line_items[column] = values.where(values % 1 == 0).astype("Int64")
+            elif column_type == float:
+                line_items[column] = pd.to_numeric(line_items[column], errors="coerce")
+            elif column_type == Decimal:
+                # Keep the exact text, Postgres rounds it to the column precision
+                invalid = pd.to_numeric(line_items[column], errors="coerce").isna()
+                line_items[column] = line_items[column].astype(object).mask(invalid, None)
+            else:
+                line_items[column] = line_items[column].astype(object).mask(line_items[column] == "", None)
+        return line_items
+
+    def _process_openshift_label_series(self, labels):
+        """Convert a column of label strings to JSON, parsing each distinct value once."""
+        label_map = {label: self._process_openshift_labels(label) for label in labels.unique()}
+        return labels.map(label_map)
+
+    def _get_report_ids(self, chunk, report_db):
+        """Map each report row to its report period and report ids.
+
+        Report periods and reports are looked up or created once for each
+        distinct interval in the chunk and then joined back onto the rows.
+
+        Returns:
+            (DataFrame): report_period_id and report_id aligned with the chunk rows
+
+        """
+        key_columns = ["report_period_start", "report_period_end", "interval_start", "interval_end"]
+        report_keys = chunk[key_columns]
+        ids = {}
+        for row in report_keys.drop_duplicates().to_dict("records"):
+            self._add_requested_partition(row.get("report_period_start"))
+            report_period_id = self._create_report_period(row, self._cluster_id, report_db, self._cluster_alias)
+            report_id = self._create_report(row, report_period_id, report_db)
+            ids[tuple(row[column] for column in key_columns)] = (report_period_id, report_id)
+
+        id_frame = pd.DataFrame(list(ids.values()), columns=["report_period_id", "report_id"])
+        id_frame.index = pd.MultiIndex.from_tuples(list(ids.keys()), names=key_columns)
+        return id_frame.reindex(pd.MultiIndex.from_frame(report_keys))
+
+    def _save_dataframe_to_db(self, line_items, temp_table, report_db):
+        """Copy a DataFrame of line items into the temp table."""
+        existing_partitions = report_db.get_existing_partitions(OCPUsageLineItemDailySummary)
+        report_db.add_partitions(existing_partitions, self.processed_report.requested_partitions)
+        csv_file = self._write_dataframe_to_csv(line_items)
+        report_db.bulk_insert_rows(csv_file, temp_table, line_items.columns)
 
     def _save_to_db(self, temp_table, report_db):
         # Create any needed partitions
@@ -308,6 +457,8 @@ class OCPCpuMemReportProcessor(OCPReportProcessorBase):
     """OCP Usage Report processor."""
 
     report_type = "OCPCpuMemReport"
+    required_columns = ("namespace", "pod", "node")
+    label_columns = ("pod_labels",)
 
     def __init__(self, schema_name, report_path, compression, provider_uuid):
         """Initialize the report processor.
@@ -380,6 +531,8 @@ class OCPStorageProcessor(OCPReportProcessorBase):
     """OCP Storage Report processor."""
 
     report_type = "OCPStorageReport"
+    required_columns = ("namespace", "persistentvolume")
+    label_columns = ("persistentvolume_labels", "persistentvolumeclaim_labels")
 
     def __init__(self, schema_name, report_path, compression, provider_uuid):
         """Initialize the report processor.
@@ -458,6 +611,7 @@ class OCPNodeLabelProcessor(OCPReportProcessorBase):
     """OCP Node Label Report processor."""
 
     report_type = "OCPNodeLabelReport"
+    label_columns = ("node_labels",)
 
     def __init__(self, schema_name, report_path, compression, provider_uuid):
         """Initialize the report processor.
@@ -527,6 +681,7 @@ class OCPNamespaceLabelProcessor(OCPReportProcessorBase):
     """OCP Node Label Report processor."""
 
     report_type = "OCPNamespaceLabelReport"
+    label_columns = ("namespace_labels",)
 
     def __init__(self, schema_name, report_path, compression, provider_uuid):
         """Initialize the report processor.
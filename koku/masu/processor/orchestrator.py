@@ -28,6 +28,7 @@ from masu.external.date_accessor import DateAccessor
 from masu.external.report_downloader import ReportDownloader
 from masu.external.report_downloader import ReportDownloaderError
 from masu.processor.tasks import get_report_files
+from masu.processor.tasks import get_report_files_batch
 from masu.processor.tasks import record_all_manifest_files
 from masu.processor.tasks import record_report_status
 from masu.processor.tasks import remove_expired_data
@@ -154,7 +155,7 @@ class Orchestrator:
 
         LOG.info(f"Found Manifests: {str(manifest)}")
         report_files = manifest.get("files", [])
-        report_tasks = []
+        report_contexts = []
         for report_file_dict in report_files:
             local_file = report_file_dict.get("local_file")
             report_file = report_file_dict.get("key")
@@ -173,22 +174,45 @@ class Orchestrator:
             report_context["current_file"] = report_file
             report_context["local_file"] = local_file
             report_context["key"] = report_file
+            report_contexts.append(report_context)
 
-            report_tasks.append(
-                get_report_files.s(
-                    customer_name,
-                    credentials,
-                    data_source,
-                    provider_type,
-                    schema_name,
-                    provider_uuid,
-                    report_month,
-                    report_context,
+        files_per_task = Config.REPORT_PROCESSING_FILES_PER_TASK
+        report_tasks = []
+        if files_per_task > 1:
+            for i in range(0, len(report_contexts), files_per_task):
+                report_tasks.append(
+                    get_report_files_batch.s(
+                        customer_name,
+                        credentials,
+                        data_source,
+                        provider_type,
+                        schema_name,
+                        provider_uuid,
+                        report_month,
+                        report_contexts[i : i + files_per_task],  # noqa: E203
+                    )
+                )
+        else:
+            for report_context in report_contexts:
+                report_tasks.append(
+                    get_report_files.s(
+                        customer_name,
+                        credentials,
+                        data_source,
+                        provider_type,
+                        schema_name,
+                        provider_uuid,
+                        report_month,
+                        report_context,
+                    )
                 )
-            )
-            LOG.info("Download queued - schema_name: %s.", schema_name)
-
         if report_tasks:
+            LOG.info(
+                "Download queued - schema_name: %s, %s files in %s tasks.",
+                schema_name,
+                len(report_contexts),
+                len(report_tasks),
+            )
             async_id = chord(report_tasks, summarize_reports.s())()
             LOG.info(f"Manifest Processing Async ID: {async_id}")
         return manifest
@@ -16,12 +16,17 @@
 #
 """Processor to convert Cost Usage Reports to parquet."""
 import logging
+import multiprocessing
 import os
 import shutil
-from io import BytesIO
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from botocore.exceptions import ClientError
 from botocore.exceptions import EndpointConnectionError
 from dateutil import parser
@@ -35,7 +40,8 @@ from masu.processor.aws.aws_report_parquet_processor import AWSReportParquetProc
 from masu.processor.azure.azure_report_parquet_processor import AzureReportParquetProcessor
 from masu.processor.ocp.ocp_report_parquet_processor import OCPReportParquetProcessor
 from masu.util.aws.common import aws_post_processor
-from masu.util.aws.common import copy_data_to_s3_bucket
+from masu.util.aws.common import copy_local_file_to_s3_bucket
+from masu.util.aws.common import get_s3_object_manifests
 from masu.util.aws.common import get_s3_resource
 from masu.util.aws.common import remove_files_not_in_set_from_s3_bucket
 from masu.util.azure.common import azure_post_processor
@@ -146,7 +152,7 @@ class ParquetReportProcessor:
         elif provider_type in [Provider.PROVIDER_AZURE, Provider.PROVIDER_AZURE_LOCAL]:
             post_processor = azure_post_processor
 
-        failed_conversion = []
+        conversions = []
         for csv_filename in files:
             kwargs = {}
             parquet_path = s3_parquet_path
@@ -166,20 +172,29 @@ class ParquetReportProcessor:
                         parquet_report_type = report_type
                         break
             converters = get_column_converters(provider_type, **kwargs)
-            result = self.convert_csv_to_parquet(
-                request_id,
-                s3_csv_path,
-                parquet_path,
-                local_path,
-                manifest_id,
-                csv_filename,
-                converters,
-                post_processor,
-                context,
-                parquet_report_type,
+            conversions.append((csv_filename, parquet_path, converters, parquet_report_type))
+
+        if Config.PARQUET_PROCESSING_WORKERS > 1 and len(conversions) > 1:
+            failed_conversion = self.convert_csv_files_to_parquet_in_parallel(
+                request_id, s3_csv_path, local_path, manifest_id, conversions, post_processor, context
             )
-            if not result:
-                failed_conversion.append(csv_filename)
+        else:
+            failed_conversion = []
+            for csv_filename, parquet_path, converters, parquet_report_type in conversions:
+                result = self.convert_csv_to_parquet(
+                    request_id,
+                    s3_csv_path,
+                    parquet_path,
+                    local_path,
+                    manifest_id,
+                    csv_filename,
+                    converters,
+                    post_processor,
+                    context,
+                    parquet_report_type,
+                )
+                if not result:
+                    failed_conversion.append(csv_filename)
 
         if failed_conversion:
             msg = f"Failed to convert the following files to parquet:{','.join(failed_conversion)}."
@@ -197,13 +212,8 @@ class ParquetReportProcessor:
         if s3_path:
             try:
                 s3_resource = get_s3_resource()
-                existing_objects = s3_resource.Bucket(settings.S3_BUCKET_NAME).objects.filter(Prefix=s3_path)
-                for obj_summary in existing_objects:
-                    existing_object = obj_summary.Object()
-                    metadata = existing_object.metadata
-                    manifest = metadata.get("manifestid")
-                    manifest_id_str = str(manifest_id)
-                    key = existing_object.key
+                manifest_id_str = str(manifest_id)
+                for key, manifest in get_s3_object_manifests(s3_resource, s3_path).items():
                     if manifest == manifest_id_str:
                         keys.append(key)
             except (EndpointConnectionError, ClientError) as err:
@@ -236,7 +246,138 @@ class ParquetReportProcessor:
             processor.get_or_create_postgres_partition(bill_date=bill_date)
             self.presto_table_exists[report_type] = True
 
-    def convert_csv_to_parquet(  # noqa: C901
+    @staticmethod
+    def _convert_csv_chunks_to_parquet(csv_file, output_file, converters, post_processor=None, **kwargs):
+        """
+        Write a CSV file to parquet one chunk of rows at a time.
+
+        Each chunk of PARQUET_PROCESSING_BATCH_SIZE rows becomes a row group
+        in the output file, so memory use is bounded by the chunk size
+        rather than by the size of the report. Columns without a converter
+        are read as strings.
+
+        Args:
+            csv_file (str): The local CSV file path
+            output_file (str): The local parquet file path
+            converters (dict): Column name to converter function
+            post_processor (function): Applied to each chunk's DataFrame
+            kwargs (dict): Extra arguments passed to pandas.read_csv
+
+        Returns:
+            (int): The number of rows written
+
+        """
+        col_names = pd.read_csv(csv_file, nrows=0, **kwargs).columns
+        converters = {col: converters.get(col, str) for col in col_names}
+        writer = None
+        row_count = 0
+        chunks = pd.read_csv(csv_file, converters=converters, chunksize=Config.PARQUET_PROCESSING_BATCH_SIZE, **kwargs)
+        try:
+            for data_frame in chunks:
+                if post_processor:
+                    data_frame = post_processor(data_frame)
+                if writer is None:
+                    table = pa.Table.from_pandas(data_frame, preserve_index=False)
+                    writer = pq.ParquetWriter(
+                        output_file, table.schema, coerce_timestamps="ms", allow_truncated_timestamps=True
+                    )
+                else:
+                    table = pa.Table.from_pandas(data_frame, schema=writer.schema, preserve_index=False)
+                writer.write_table(table)
+                row_count += len(data_frame)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            # A header only CSV yields no chunks, still write the empty frame for its schema
+            data_frame = pd.read_csv(csv_file, converters=converters, **kwargs)
+            if post_processor:
+                data_frame = post_processor(data_frame)
+            data_frame.to_parquet(output_file, allow_truncated_timestamps=True, coerce_timestamps="ms")
+        return row_count
+
+    def convert_csv_files_to_parquet_in_parallel(
+        self, request_id, s3_csv_path, local_path, manifest_id, conversions, post_processor=None, context={}
+    ):
+        """
+        Convert several CSV files to parquet on S3 at the same time.
+
+        Downloads and uploads run on a thread pool while the CSV to parquet
+        conversion itself runs on a process pool, so one file can be
+        transferred while another is being converted. Presto tables are
+        created from this process as files finish, once per report type.
+
+        Args:
+            request_id (str): The associated request id (ingress or celery task id)
+            s3_csv_path (str): The S3 path of the CSV files
+            local_path (str): The local directory for intermediate files
+            manifest_id (str): The identifier for the report manifest
+            conversions (list): (csv_filename, s3_parquet_path, converters, report_type) tuples
+            post_processor (function): Applied to each chunk's DataFrame
+            context (dict): A context object for logging
+
+        Returns:
+            (list): The CSV file names that failed to convert
+
+        """
+        workers = min(Config.PARQUET_PROCESSING_WORKERS, len(conversions))
+        if multiprocessing.current_process().daemon:
+            # Daemonic processes, like celery prefork workers, are not allowed to have children
+            msg = "Running in a daemonic process, converting files to parquet on threads."
+            LOG.info(log_json(request_id, msg, context))
+            convert_executor = ThreadPoolExecutor
+        else:
+            convert_executor = ProcessPoolExecutor
+
+        failed_conversion = []
+        transfer_pool = ThreadPoolExecutor(max_workers=workers)
+        convert_pool = convert_executor(max_workers=workers)
+        with transfer_pool, convert_pool:
+            futures = {}
+            for index, (csv_filename, s3_parquet_path, converters, report_type) in enumerate(conversions):
+                future = transfer_pool.submit(
+                    self._convert_csv_file_to_parquet,
+                    request_id,
+                    s3_csv_path,
+                    s3_parquet_path,
+                    f"{local_path}/{index}",
+                    manifest_id,
+                    csv_filename,
+                    converters,
+                    post_processor,
+                    context,
+                    convert_pool,
+                )
+                futures[future] = (csv_filename, report_type)
+
+            for future in as_completed(futures):
+                csv_filename, report_type = futures[future]
+                output_file = future.result()
+                if not output_file:
+                    failed_conversion.append(csv_filename)
+                    continue
+                self._create_parquet_table_once(manifest_id, output_file, context, report_type)
+                shutil.rmtree(os.path.dirname(output_file), ignore_errors=True)
+
+        return failed_conversion
+
+    def _create_parquet_table_once(self, manifest_id, output_file, context, report_type):
+        """Create the Presto table for a report type unless it was already created this run."""
+        if not self.presto_table_exists.get(report_type):
+            s3_hive_table_path = get_hive_table_path(
+                context.get("account"), self._provider_type, report_type=report_type
+            )
+            self.create_parquet_table(
+                context.get("account"),
+                context.get("provider_uuid"),
+                manifest_id,
+                s3_hive_table_path,
+                output_file,
+                report_type,
+            )
+
+    def convert_csv_to_parquet(
         self,
         request_id,
         s3_csv_path,
@@ -251,6 +392,47 @@ class ParquetReportProcessor:
     ):
         """
         Convert CSV files to parquet on S3.
+        """
+        output_file = self._convert_csv_file_to_parquet(
+            request_id,
+            s3_csv_path,
+            s3_parquet_path,
+            local_path,
+            manifest_id,
+            csv_filename,
+            converters,
+            post_processor,
+            context,
+        )
+        if not output_file:
+            return False
+
+        self._create_parquet_table_once(manifest_id, output_file, context, report_type)
+
+        shutil.rmtree(local_path, ignore_errors=True)
+        return True
+
+    def _convert_csv_file_to_parquet(  # noqa: C901
+        self,
+        request_id,
+        s3_csv_path,
+        s3_parquet_path,
+        local_path,
+        manifest_id,
+        csv_filename,
+        converters={},
+        post_processor=None,
+        context={},
+        convert_pool=None,
+    ):
+        """
+        Download a CSV file, convert it to parquet and upload the parquet file to S3.
+
+        The conversion runs on convert_pool when one is given.
+
+        Returns:
+            (str): The local parquet file, None when the conversion failed
+
         """
         if s3_csv_path is None or s3_parquet_path is None or local_path is None:
             msg = (
@@ -258,7 +440,7 @@ class ParquetReportProcessor:
                 f"CSV path={s3_csv_path}, Parquet path={s3_parquet_path}, and local_path={local_path}."
             )
             LOG.error(log_json(request_id, msg, context))
-            return False
+            return None
 
         msg = f"Running convert_csv_to_parquet on file {csv_filename} in S3 path {s3_csv_path}."
         LOG.info(log_json(request_id, msg, context))
@@ -276,7 +458,7 @@ class ParquetReportProcessor:
         else:
             msg = f"File {csv_filename} is not valid CSV. Conversion to parquet skipped."
             LOG.warn(log_json(request_id, msg, context))
-            return False
+            return None
 
         Path(local_path).mkdir(parents=True, exist_ok=True)
         tmpfile = f"{local_path}/{csv_filename}"
@@ -288,49 +470,34 @@ class ParquetReportProcessor:
             shutil.rmtree(local_path, ignore_errors=True)
             msg = f"File {csv_filename} could not obtained for parquet conversion. Reason: {str(err)}"
             LOG.warn(log_json(request_id, msg, context))
-            return False
+            return None
 
         output_file = f"{local_path}/{parquet_file}"
         try:
-            col_names = pd.read_csv(tmpfile, nrows=0, **kwargs).columns
-            converters.update({col: str for col in col_names if col not in converters})
-            data_frame = pd.read_csv(tmpfile, converters=converters, **kwargs)
-            if post_processor:
-                data_frame = post_processor(data_frame)
-            data_frame.to_parquet(output_file, allow_truncated_timestamps=True, coerce_timestamps="ms")
+            if convert_pool:
+                convert_pool.submit(
+                    self._convert_csv_chunks_to_parquet, tmpfile, output_file, converters, post_processor, **kwargs
+                ).result()
+            else:
+                self._convert_csv_chunks_to_parquet(tmpfile, output_file, converters, post_processor, **kwargs)
         except Exception as err:
             shutil.rmtree(local_path, ignore_errors=True)
             msg = f"File {csv_filename} could not be written as parquet to temp file {output_file}. Reason: {str(err)}"
             LOG.warn(log_json(request_id, msg, context))
-            return False
+            return None
 
         try:
-            with open(output_file, "rb") as fin:
-                data = BytesIO(fin.read())
-                copy_data_to_s3_bucket(
-                    request_id, s3_parquet_path, parquet_file, data, manifest_id=manifest_id, context=context
-                )
+            copy_local_file_to_s3_bucket(
+                request_id, s3_parquet_path, parquet_file, output_file, manifest_id=manifest_id, context=context
+            )
         except Exception as err:
             shutil.rmtree(local_path, ignore_errors=True)
             s3_key = f"{s3_parquet_path}/{parquet_file}"
             msg = f"File {csv_filename} could not be written as parquet to S3 {s3_key}. Reason: {str(err)}"
             LOG.warn(log_json(request_id, msg, context))
-            return False
-
-        s3_hive_table_path = get_hive_table_path(context.get("account"), self._provider_type, report_type=report_type)
+            return None
 
-        if not self.presto_table_exists.get(report_type):
-            self.create_parquet_table(
-                context.get("account"),
-                context.get("provider_uuid"),
-                manifest_id,
-                s3_hive_table_path,
-                output_file,
-                report_type,
-            )
-
-        shutil.rmtree(local_path, ignore_errors=True)
-        return True
+        return output_file
 
     def process(self, context=None):
         """Convert to parquet."""
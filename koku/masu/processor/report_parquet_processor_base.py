@@ -17,12 +17,12 @@
 """Processor for Parquet files."""
 import logging
 
-import prestodb
 import pyarrow.parquet as pq
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from tenant_schemas.utils import schema_context
 
+import koku.presto_database as kpdb
 from api.models import Provider
 from reporting.models import PartitionedTable
 
@@ -61,13 +61,11 @@ class ReportParquetProcessorBase:
         raise PostgresSummaryTableError("This must be a property on the sub class.")
 
     def _execute_sql(self, sql, schema_name):  # pragma: no cover
-        """Execute presto SQL."""
-        with prestodb.dbapi.connect(
+        """Execute presto SQL on a pooled connection."""
+        with kpdb.connection(
             host=settings.PRESTO_HOST, port=settings.PRESTO_PORT, user="admin", catalog="hive", schema=schema_name
         ) as conn:
-            cur = conn.cursor()
-            cur.execute(sql)
-            rows = cur.fetchall()
+            rows = kpdb.execute(conn, sql)
             LOG.debug(f"_execute_sql rows: {str(rows)}. Type: {type(rows)}")
         return rows
 
@@ -43,7 +43,17 @@ class ReportProcessorDBError(Exception):
 class ReportProcessor:
     """Interface for masu to use to processor CUR."""
 
-    def __init__(self, schema_name, report_path, compression, provider, provider_uuid, manifest_id, context=None):
+    def __init__(
+        self,
+        schema_name,
+        report_path,
+        compression,
+        provider,
+        provider_uuid,
+        manifest_id,
+        context=None,
+        lookup_cache=None,
+    ):
         """Set the processor based on the data provider."""
         self.schema_name = schema_name
         self.report_path = report_path
@@ -52,6 +62,7 @@ class ReportProcessor:
         self.provider_uuid = provider_uuid
         self.manifest_id = manifest_id
         self.context = context
+        self.lookup_cache = lookup_cache
         try:
             self._processor = self._set_processor()
         except NotImplementedError as err:
@@ -92,6 +103,7 @@ class ReportProcessor:
                 compression=self.compression,
                 provider_uuid=self.provider_uuid,
                 manifest_id=self.manifest_id,
+                lookup_cache=self.lookup_cache,
             )
 
         if self.provider_type in (Provider.PROVIDER_AZURE, Provider.PROVIDER_AZURE_LOCAL):
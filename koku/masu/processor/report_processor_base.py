@@ -122,6 +122,15 @@ class ReportProcessorBase:
 
         return file_obj
 
+    @staticmethod
+    def _write_dataframe_to_csv(data_frame):
+        """Output DataFrame rows as CSV content to a file stream object."""
+        file_obj = io.StringIO()
+        data_frame.to_csv(file_obj, header=False, index=False)
+        file_obj.seek(0)
+
+        return file_obj
+
     def _save_to_db(self, temp_table, report_db_accessor):
         """Save current batch of records to the database."""
         columns = tuple(self.processed_report.line_items[0].keys())
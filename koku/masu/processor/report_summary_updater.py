@@ -192,3 +192,57 @@ class ReportSummaryUpdater:
         self._ocp_cloud_updater.update_cost_summary_table(start_date, end_date)
 
         invalidate_view_cache_for_tenant_and_source_type(self._schema, self._provider.type)
+
+    @property
+    def can_fan_out(self):
+        """Whether the date chunks of a summary update can be summarized as parallel tasks."""
+        return isinstance(self._updater, AWSReportSummaryUpdater)
+
+    def get_date_chunks(self, start_date, end_date):
+        """
+        Get the dates to summarize and the chunks a fanned out summary update is split in.
+
+        Args:
+            start_date (str, datetime): When to start.
+            end_date (str, datetime): When to end.
+
+        Returns:
+            (str, str, list): The start and end date strings and the (start, end) pair of each chunk.
+
+        """
+        start_date, end_date = self._format_dates(start_date, end_date)
+        return self._updater.get_date_chunks(start_date, end_date)
+
+    def update_chunk_tables(self, start_date, end_date):
+        """
+        Update the report daily and summary tables of one date chunk.
+
+        Args:
+            start_date (str, datetime): When the chunk starts.
+            end_date (str, datetime): When the chunk ends.
+
+        Returns:
+            None
+
+        """
+        start_date, end_date = self._format_dates(start_date, end_date)
+        self._updater.update_chunk_tables(start_date, end_date)
+
+    def finalize_summary_tables(self, start_date, end_date):
+        """
+        Finish a summary update once the tables of all of its date chunks are updated.
+
+        Args:
+            start_date (str, datetime): When the summary update started.
+            end_date (str, datetime): When the summary update ended.
+
+        Returns:
+            None
+
+        """
+        start_date, end_date = self._format_dates(start_date, end_date)
+        self._updater.finalize_summary_tables(start_date, end_date)
+
+        self._ocp_cloud_updater.update_summary_tables(start_date, end_date)
+
+        invalidate_view_cache_for_tenant_and_source_type(self._schema, self._provider.type)
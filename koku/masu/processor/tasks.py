@@ -24,6 +24,8 @@ from decimal import InvalidOperation
 
 import ciso8601
 from celery import chain
+from celery import chord
+from celery import group
 from celery.utils.log import get_task_logger
 from dateutil import parser
 from django.conf import settings
@@ -39,13 +41,17 @@ from api.utils import DateHelper
 from koku.cache import invalidate_view_cache_for_tenant_and_source_type
 from koku.celery import app
 from koku.middleware import KokuTenantMiddleware
+from masu.config import Config
 from masu.database.cost_model_db_accessor import CostModelDBAccessor
+from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
 from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.database.report_stats_db_accessor import ReportStatsDBAccessor
 from masu.external.accounts_accessor import AccountsAccessor
 from masu.external.accounts_accessor import AccountsAccessorError
 from masu.external.date_accessor import DateAccessor
+from masu.external.report_downloader import ReportDownloader
+from masu.external.report_downloader import ReportDownloaderError
 from masu.processor._tasks.download import _get_report_files
 from masu.processor._tasks.process import _process_report_file
 from masu.processor._tasks.remove_expired import _remove_expired_data
@@ -57,10 +63,11 @@ from masu.processor.worker_cache import WorkerCache
 from reporting.models import AWS_MATERIALIZED_VIEWS
 from reporting.models import AZURE_MATERIALIZED_VIEWS
 from reporting.models import GCP_MATERIALIZED_VIEWS
-from reporting.models import OCP_MATERIALIZED_VIEWS
 from reporting.models import OCP_ON_AWS_MATERIALIZED_VIEWS
 from reporting.models import OCP_ON_AZURE_MATERIALIZED_VIEWS
 from reporting.models import OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
+from reporting.models import OCP_ON_INFRASTRUCTURE_SUMMARY_TABLES
+from reporting.models import OCP_SUMMARY_TABLES
 
 LOG = get_task_logger(__name__)
 
@@ -142,6 +149,123 @@ def get_report_files(
     Returns:
         None
 
+    """
+    return _download_and_process_report_file(
+        self,
+        customer_name,
+        authentication,
+        billing_source,
+        provider_type,
+        schema_name,
+        provider_uuid,
+        report_month,
+        report_context,
+    )
+
+
+# pylint: disable=too-many-locals
+@app.task(name="masu.processor.tasks.get_report_files_batch", queue_name="download", bind=True)
+def get_report_files_batch(
+    self,
+    customer_name,
+    authentication,
+    billing_source,
+    provider_type,
+    schema_name,
+    provider_uuid,
+    report_month,
+    report_contexts,
+):
+    """
+    Task to download and process several report files of one manifest.
+
+    The files share one report downloader and the bounded dimension id caches of the
+    report processor, so the per file setup is paid once per batch.
+
+    Args:
+        customer_name     (String): Name of the customer owning the cost usage report.
+        authentication    (String): Credential needed to access cost usage report
+                                    in the backend provider.
+        billing_source    (String): Location of the cost usage report in the backend provider.
+        provider_type     (String): Koku defined provider type string.  Example: Amazon = 'AWS'
+        schema_name       (String): Name of the DB schema
+        provider_uuid     (String): Provider uuid.
+        report_month      (DateTime): Month for report to download.
+        report_contexts   (List): The report context of each file to download and process.
+
+    Returns:
+        (List) The report metadata of each processed file, for summarize_reports
+
+    """
+    try:
+        downloader = ReportDownloader(
+            customer_name=customer_name,
+            credentials=authentication,
+            data_source=billing_source,
+            provider_type=provider_type,
+            provider_uuid=provider_uuid,
+            report_name=None,
+            account=customer_name[4:],
+            request_id=self.request.id,
+        )
+    except ReportDownloaderError as err:
+        LOG.warning(f"Unable to create a shared report downloader, creating one per file: {str(err)}")
+        downloader = None
+
+    lookup_cache = {}
+    reports = []
+    for report_context in report_contexts:
+        reports.append(
+            _download_and_process_report_file(
+                self,
+                customer_name,
+                authentication,
+                billing_source,
+                provider_type,
+                schema_name,
+                provider_uuid,
+                report_month,
+                report_context,
+                downloader=downloader,
+                lookup_cache=lookup_cache,
+            )
+        )
+    return reports
+
+
+def _download_and_process_report_file(
+    task,
+    customer_name,
+    authentication,
+    billing_source,
+    provider_type,
+    schema_name,
+    provider_uuid,
+    report_month,
+    report_context,
+    downloader=None,
+    lookup_cache=None,
+):
+    """
+    Download a Report and process the report.
+
+    Args:
+        task              (Object): Bound celery task.
+        customer_name     (String): Name of the customer owning the cost usage report.
+        authentication    (String): Credential needed to access cost usage report
+                                    in the backend provider.
+        billing_source    (String): Location of the cost usage report in the backend provider.
+        provider_type     (String): Koku defined provider type string.  Example: Amazon = 'AWS'
+        schema_name       (String): Name of the DB schema
+        provider_uuid     (String): Provider uuid.
+        report_month      (DateTime): Month for report to download.
+        report_context    (Dict): The report file to download and its manifest.
+        downloader        (ReportDownloader): Downloader to reuse, created when None.
+        lookup_cache      (Dict): Database id lookups shared with other files of the manifest.
+
+    Returns:
+        (Dict) The report metadata for summarize_reports, None if nothing was processed
+
     """
     try:
         worker_stats.GET_REPORT_ATTEMPTS_COUNTER.labels(provider_type=provider_type).inc()
@@ -154,7 +278,7 @@ def get_report_files(
         WorkerCache().add_task_to_cache(cache_key)
 
         report_dict = _get_report_files(
-            self,
+            task,
             customer_name,
             authentication,
             billing_source,
@@ -163,6 +287,7 @@ def get_report_files(
             month,
             cache_key,
             report_context,
+            downloader=downloader,
         )
 
         stmt = (
@@ -196,10 +321,10 @@ def get_report_files(
             LOG.info(stmt)
             worker_stats.PROCESS_REPORT_ATTEMPTS_COUNTER.labels(provider_type=provider_type).inc()
 
-            report_dict["request_id"] = self.request.id
+            report_dict["request_id"] = task.request.id
             report_dict["provider_type"] = provider_type
 
-            _process_report_file(schema_name, provider_type, report_dict)
+            _process_report_file(schema_name, provider_type, report_dict, lookup_cache=lookup_cache)
 
         except (ReportProcessorError, ReportProcessorDBError) as processing_error:
             worker_stats.PROCESS_REPORT_ERROR_COUNTER.labels(provider_type=provider_type).inc()
@@ -259,7 +384,13 @@ def summarize_reports(reports_to_summarize):
         None
 
     """
-    reports_to_summarize = [report for report in reports_to_summarize if report]
+    # Batched processing tasks return the metadata of each of their files
+    reports_to_summarize = [
+        report
+        for reports in reports_to_summarize
+        for report in (reports if isinstance(reports, list) else [reports])
+        if report
+    ]
     reports_deduplicated = [dict(t) for t in {tuple(d.items()) for d in reports_to_summarize}]
 
     for report in reports_deduplicated:
@@ -320,11 +451,125 @@ def update_summary_tables(schema_name, provider, provider_uuid, start_date, end_
     LOG.info(stmt)
 
     updater = ReportSummaryUpdater(schema_name, provider_uuid, manifest_id)
+    if Config.SUMMARY_FAN_OUT and updater.can_fan_out:
+        fan_out_summary_tables(updater, schema_name, provider, provider_uuid, start_date, end_date, manifest_id)
+        return
+
     start_date, end_date = updater.update_daily_tables(start_date, end_date)
     updater.update_summary_tables(start_date, end_date)
+    link_post_summary_tasks(schema_name, provider, provider_uuid, start_date, end_date, manifest_id)
+
+
+def fan_out_summary_tables(updater, schema_name, provider, provider_uuid, start_date, end_date, manifest_id=None):
+    """Summarize the date chunks of an update as parallel tasks, then finalize the summary.
+
+    The chunks are dealt to at most Config.SUMMARY_FAN_OUT_CONCURRENCY chains of tasks,
+    which bounds the number of chunks of this update summarized at the same time. Other
+    updates of the same schema, such as another manifest, get chains of their own.
+
+    Args:
+        updater (ReportSummaryUpdater) The summary updater of the provider.
+        schema_name (str) The DB schema name.
+        provider    (str) The provider type.
+        provider_uuid (str) The provider uuid.
+        start_date  (str) The date to start populating the table.
+        end_date    (str) The date to end on.
+        manifest_id (int) The manifest id.
+
+    Returns
+        None
+
+    """
+    start_date, end_date, chunks = updater.get_date_chunks(start_date, end_date)
+    concurrency = min(max(Config.SUMMARY_FAN_OUT_CONCURRENCY, 1), len(chunks))
+    lanes = [chunks[lane::concurrency] for lane in range(concurrency)]
+    LOG.info(
+        f"Summarizing {len(chunks)} date chunks from {start_date} to {end_date} in {concurrency} parallel tasks"
+        f" for schema_name: {schema_name}, provider_uuid: {provider_uuid}"
+    )
+    chunk_tasks = group(
+        chain(
+            update_summary_tables_chunk.si(
+                schema_name, provider, provider_uuid, str(chunk_start), str(chunk_end), manifest_id=manifest_id
+            )
+            for chunk_start, chunk_end in lane
+        )
+        for lane in lanes
+    )
+    chord(chunk_tasks)(
+        finalize_summary_tables.si(schema_name, provider, provider_uuid, start_date, end_date, manifest_id=manifest_id)
+    )
+
+
+@app.task(name="masu.processor.tasks.update_summary_tables_chunk", queue_name="reporting")
+def update_summary_tables_chunk(schema_name, provider, provider_uuid, start_date, end_date, manifest_id=None):
+    """Populate the daily and summary tables of one date chunk of a fanned out summary update.
+
+    Args:
+        schema_name (str) The DB schema name.
+        provider    (str) The provider type.
+        provider_uuid (str) The provider uuid.
+        start_date  (str) The first date of the chunk.
+        end_date    (str) The last date of the chunk.
+        manifest_id (int) The manifest id.
+
+    Returns
+        None
+
+    """
+    stmt = (
+        f"update_summary_tables_chunk called with args:\n"
+        f" schema_name: {schema_name},\n"
+        f" provider: {provider},\n"
+        f" start_date: {start_date},\n"
+        f" end_date: {end_date},\n"
+        f" manifest_id: {manifest_id}"
+    )
+    LOG.info(stmt)
+    updater = ReportSummaryUpdater(schema_name, provider_uuid, manifest_id)
+    updater.update_chunk_tables(start_date, end_date)
+
 
+@app.task(name="masu.processor.tasks.finalize_summary_tables", queue_name="reporting")
+def finalize_summary_tables(schema_name, provider, provider_uuid, start_date, end_date, manifest_id=None):
+    """Finish a fanned out summary update once all of its date chunks are summarized.
+
+    Args:
+        schema_name (str) The DB schema name.
+        provider    (str) The provider type.
+        provider_uuid (str) The provider uuid.
+        start_date  (str) The date the summary started at.
+        end_date    (str) The date the summary ended on.
+        manifest_id (int) The manifest id.
+
+    Returns
+        None
+
+    """
+    updater = ReportSummaryUpdater(schema_name, provider_uuid, manifest_id)
+    updater.finalize_summary_tables(start_date, end_date)
+    link_post_summary_tasks(schema_name, provider, provider_uuid, start_date, end_date, manifest_id)
+
+
+def link_post_summary_tasks(schema_name, provider, provider_uuid, start_date, end_date, manifest_id=None):
+    """Queue the cost model update, materialized view refresh and line item cleanup following a summary.
+
+    Args:
+        schema_name (str) The DB schema name.
+        provider    (str) The provider type.
+        provider_uuid (str) The provider uuid.
+        start_date  (str) The date the summary started at.
+        end_date    (str) The date the summary ended on.
+        manifest_id (int) The manifest id.
+
+    Returns
+        None
+
+    """
     if not provider_uuid:
-        refresh_materialized_views.delay(schema_name, provider, manifest_id=manifest_id)
+        refresh_materialized_views.delay(
+            schema_name, provider, manifest_id=manifest_id, start_date=start_date, end_date=end_date
+        )
         return
 
     if settings.ENABLE_PARQUET_PROCESSING and provider in (
@@ -347,7 +592,14 @@ def update_summary_tables(schema_name, provider, provider_uuid, start_date, end_
     if cost_model is not None:
         linked_tasks = update_cost_model_costs.s(
             schema_name, provider_uuid, start_date, end_date
-        ) | refresh_materialized_views.si(schema_name, provider, provider_uuid=provider_uuid, manifest_id=manifest_id)
+        ) | refresh_materialized_views.si(
+            schema_name,
+            provider,
+            provider_uuid=provider_uuid,
+            manifest_id=manifest_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
     else:
         stmt = (
             f"\n update_cost_model_costs skipped.\n"
@@ -356,7 +608,12 @@ def update_summary_tables(schema_name, provider, provider_uuid, start_date, end_
         )
         LOG.info(stmt)
         linked_tasks = refresh_materialized_views.s(
-            schema_name, provider, provider_uuid=provider_uuid, manifest_id=manifest_id
+            schema_name,
+            provider,
+            provider_uuid=provider_uuid,
+            manifest_id=manifest_id,
+            start_date=start_date,
+            end_date=end_date,
         )
 
     dh = DateHelper(utc=True)
@@ -448,11 +705,22 @@ def update_cost_model_costs(
         worker_cache.release_single_task(task_name, cache_args)
 
 
-# fmt: off
 @app.task(name="masu.processor.tasks.refresh_materialized_views", queue_name="reporting")
-def refresh_materialized_views(schema_name, provider_type, manifest_id=None, provider_uuid=None, synchronous=False):  # noqa: C901, E501
-    """Refresh the database's materialized views for reporting."""
-    # fmt: on
+def refresh_materialized_views(  # noqa: C901
+    schema_name,
+    provider_type,
+    manifest_id=None,
+    provider_uuid=None,
+    synchronous=False,
+    start_date=None,
+    end_date=None,
+):
+    """Refresh the database's materialized views and summary tables for reporting.
+
+    Summary tables are only rebuilt for the given date range, all of the
+    retained dates when no range is given.
+
+    """
     task_name = "masu.processor.tasks.refresh_materialized_views"
     cache_args = [schema_name]
     if not synchronous:
@@ -462,21 +730,25 @@ def refresh_materialized_views(schema_name, provider_type, manifest_id=None, pro
 
         worker_cache.lock_single_task(task_name, cache_args)
     materialized_views = ()
+    summary_tables = ()
+    # OCP rows are rebuilt for the OCP source itself, cloud sources change rows of every cluster on them
+    summary_source_uuid = None
     if provider_type in (Provider.PROVIDER_AWS, Provider.PROVIDER_AWS_LOCAL):
         materialized_views = (
             AWS_MATERIALIZED_VIEWS + OCP_ON_AWS_MATERIALIZED_VIEWS + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
         )
+        summary_tables = OCP_ON_INFRASTRUCTURE_SUMMARY_TABLES
     elif provider_type in (Provider.PROVIDER_OCP):
         materialized_views = (
-            OCP_MATERIALIZED_VIEWS
-            + OCP_ON_AWS_MATERIALIZED_VIEWS
-            + OCP_ON_AZURE_MATERIALIZED_VIEWS
-            + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
+            OCP_ON_AWS_MATERIALIZED_VIEWS + OCP_ON_AZURE_MATERIALIZED_VIEWS + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
         )
+        summary_tables = OCP_SUMMARY_TABLES
+        summary_source_uuid = provider_uuid
     elif provider_type in (Provider.PROVIDER_AZURE, Provider.PROVIDER_AZURE_LOCAL):
         materialized_views = (
             AZURE_MATERIALIZED_VIEWS + OCP_ON_AZURE_MATERIALIZED_VIEWS + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
         )
+        summary_tables = OCP_ON_INFRASTRUCTURE_SUMMARY_TABLES
     elif provider_type in (Provider.PROVIDER_GCP, Provider.PROVIDER_GCP_LOCAL):
         materialized_views = GCP_MATERIALIZED_VIEWS
 
@@ -487,6 +759,12 @@ def refresh_materialized_views(schema_name, provider_type, manifest_id=None, pro
                 cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {table_name}")
                 LOG.info(f"Refreshed {table_name}.")
 
+    if summary_tables:
+        with OCPReportDBAccessor(schema_name) as accessor:
+            accessor.populate_ui_summary_tables(
+                [table._meta.db_table for table in summary_tables], start_date, end_date, summary_source_uuid
+            )
+
     invalidate_view_cache_for_tenant_and_source_type(schema_name, provider_type)
 
     if provider_uuid:
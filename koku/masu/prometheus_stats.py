@@ -17,6 +17,7 @@
 """Prometheus Stats."""
 from prometheus_client import CollectorRegistry
 from prometheus_client import Counter
+from prometheus_client import Histogram
 from prometheus_client import multiprocess
 
 
@@ -32,6 +33,19 @@ REPORT_FILE_DOWNLOAD_ERROR_COUNTER = Counter(
     ["provider_type"],
     registry=WORKER_REGISTRY,
 )
+REPORT_FILE_DOWNLOAD_BYTES_COUNTER = Counter(
+    "report_file_download_bytes",
+    "Number of report file bytes downloaded",
+    ["provider_type"],
+    registry=WORKER_REGISTRY,
+)
+REPORT_FILE_DOWNLOAD_THROUGHPUT = Histogram(
+    "report_file_download_bytes_per_second",
+    "Report file download throughput in bytes per second",
+    ["provider_type"],
+    buckets=tuple(mebibytes * 2 ** 20 for mebibytes in (1, 5, 10, 25, 50, 100, 250)) + (float("inf"),),
+    registry=WORKER_REGISTRY,
+)
 PROCESS_REPORT_ATTEMPTS_COUNTER = Counter(
     "process_report_attempts_count",
     "Number of report files attempted processing",
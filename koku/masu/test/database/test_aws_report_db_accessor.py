@@ -45,6 +45,7 @@ from masu.external.date_accessor import DateAccessor
 from masu.test import MasuTestCase
 from masu.test.database.helpers import map_django_field_type_to_python_type
 from masu.test.database.helpers import ReportObjectCreator
+from reporting.models import PartitionedTable
 from reporting.provider.aws.models import AWSCostEntryLineItemDailySummary
 from reporting.provider.aws.models import AWSCostEntryProduct
 from reporting.provider.aws.models import AWSCostEntryReservation
@@ -593,6 +594,31 @@ class AWSReportDBAccessorTest(MasuTestCase):
 
             self.assertNotEqual(getattr(entry, "tags"), {})
 
+    def test_populate_line_item_daily_table_chunks_share_new_tag_keys(self):
+        """Test that date chunks with the same new tag keys each enable them without a conflict."""
+        ce_table_name = AWS_CUR_TABLE_MAP["cost_entry"]
+        ce_table = getattr(self.accessor.report_schema, ce_table_name)
+
+        with schema_context(self.schema):
+            bills = self.accessor.get_cost_entry_bills_query_by_provider(self.aws_provider.uuid)
+            bill_ids = [str(bill.id) for bill in bills.all()]
+
+            ce_entry = ce_table.objects.all().aggregate(Min("interval_start"), Max("interval_start"))
+            start_date = ce_entry["interval_start__min"].replace(hour=0, minute=0, second=0, microsecond=0)
+            end_date = ce_entry["interval_start__max"].replace(hour=0, minute=0, second=0, microsecond=0)
+            middle_date = start_date + (end_date - start_date) / 2
+
+            AWSTagsSummary.objects.all().delete()
+            AWSEnabledTagKeys.objects.all().delete()
+
+        self.accessor.populate_line_item_daily_table(start_date, middle_date, bill_ids)
+        self.accessor.populate_line_item_daily_table(middle_date, end_date, bill_ids)
+
+        with schema_context(self.schema):
+            keys = list(AWSEnabledTagKeys.objects.values_list("key", flat=True))
+            self.assertIn("environment", keys)
+            self.assertEqual(len(keys), len(set(keys)))
+
     def test_populate_line_item_daily_table_no_bill_ids(self):
         """Test that the daily table is populated."""
         ce_table_name = AWS_CUR_TABLE_MAP["cost_entry"]
@@ -1015,23 +1041,23 @@ class AWSReportDBAccessorTest(MasuTestCase):
         )
         mock_presto.assert_called()
 
-    @patch("masu.database.report_db_accessor_base.kpdb.connect")
+    @patch("masu.database.report_db_accessor_base.kpdb.connection")
     def test_execute_presto_raw_sql_query(self, mock_connect):
         """Test the presto execute method."""
         mock_sql = "SELECT number FROM table"
         mock_result = [[1], [2]]
-        mock_connect.return_value.cursor.return_value.fetchall.return_value = mock_result
+        mock_connect.return_value.__enter__.return_value.cursor.return_value.fetchall.return_value = mock_result
 
         result = self.accessor._execute_presto_raw_sql_query(self.schema, mock_sql)
 
         self.assertEqual(result, mock_result)
 
-    @patch("masu.database.report_db_accessor_base.kpdb.connect")
+    @patch("masu.database.report_db_accessor_base.kpdb.connection")
     def test_execute_presto_multipart_sql_query(self, mock_connect):
         """Test the presto execute method."""
         mock_sql = "SELECT number FROM table; SELECT other_number FROM other_table;"
         mock_result = [[1], [2]]
-        mock_connect.return_value.cursor.return_value.fetchall.return_value = mock_result
+        mock_connect.return_value.__enter__.return_value.cursor.return_value.fetchall.return_value = mock_result
         expected = mock_result + mock_result
 
         result = self.accessor._execute_presto_multipart_sql_query(self.schema, mock_sql)
@@ -1081,3 +1107,40 @@ class AWSReportDBAccessorTest(MasuTestCase):
                     self.assertEqual([key_to_keep.key], tag_keys)
                 else:
                     self.assertEqual([], tag_keys)
+
+    def test_purge_expired_partitions(self):
+        """Test that expired monthly partitions are reported with their size and dropped."""
+        table_name = AWS_CUR_TABLE_MAP["line_item_daily_summary"]
+        expired_month = DateHelper().this_month_start.date().replace(year=DateHelper().this_month_start.year - 3)
+        partition_name = f"{table_name}_{expired_month.strftime('%Y_%m')}"
+        self.accessor.add_partition(
+            schema_name=self.schema,
+            table_name=partition_name,
+            partition_of_table_name=table_name,
+            partition_type=PartitionedTable.RANGE,
+            partition_col="usage_start",
+            partition_parameters={
+                "default": False,
+                "from": str(expired_month),
+                "to": str(expired_month + relativedelta.relativedelta(months=1)),
+            },
+            active=True,
+        )
+        expired_date = datetime.datetime.combine(expired_month, datetime.time.min)
+
+        expired = self.accessor.get_expired_partitions(table_name, expired_date)
+        self.assertEqual([partition.table_name for partition in expired], [partition_name])
+
+        purged = self.accessor.purge_expired_partitions(table_name, expired_date, simulate=True)
+        self.assertEqual(len(purged), 1)
+        self.assertEqual(purged[0].get("partition"), partition_name)
+        self.assertEqual(purged[0].get("partition_start"), str(expired_month))
+        self.assertGreater(purged[0].get("size"), 0)
+        with schema_context(self.schema):
+            self.assertTrue(PartitionedTable.objects.filter(table_name=partition_name).exists())
+
+        purged = self.accessor.purge_expired_partitions(table_name, expired_date)
+        self.assertEqual([partition.get("partition") for partition in purged], [partition_name])
+        with schema_context(self.schema):
+            self.assertFalse(PartitionedTable.objects.filter(table_name=partition_name).exists())
+        self.assertEqual(self.accessor.get_partition_sizes(expired), {})
@@ -33,10 +33,12 @@ from koku import presto_database as kpdb
 from masu.database import OCP_REPORT_TABLE_MAP
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
+from masu.database.report_db_accessor_base import get_sql_template
 from masu.external.date_accessor import DateAccessor
 from masu.test import MasuTestCase
 from masu.test.database.helpers import ReportObjectCreator
 from masu.util.common import month_date_range_tuple
+from reporting.models import OCPCostSummaryByProject
 from reporting.models import OCPEnabledTagKeys
 from reporting.models import OCPStorageVolumeLabelSummary
 from reporting.models import OCPUsageLineItem
@@ -461,6 +463,32 @@ class OCPReportDBAccessorTest(MasuTestCase):
 
         self.assertEqual(sorted(tag_keys), sorted(expected_tag_keys))
 
+    def test_populate_ui_summary_tables(self):
+        """Test that only the rows of the given source and dates are replaced."""
+        table_name = OCPCostSummaryByProject._meta.db_table
+        start_date = DateHelper().this_month_start.date()
+        end_date = DateHelper().today.date()
+        with schema_context(self.schema):
+            source_uuid = OCPUsageLineItemDailySummary.objects.values_list("source_uuid", flat=True).first()
+            expected_count = (
+                OCPUsageLineItemDailySummary.objects.filter(
+                    source_uuid=source_uuid, usage_start__gte=start_date, usage_start__lte=end_date
+                )
+                .values("usage_start", "cluster_id", "cluster_alias", "namespace")
+                .distinct()
+                .count()
+            )
+            OCPCostSummaryByProject.objects.filter(source_uuid=source_uuid).delete()
+            other_count = OCPCostSummaryByProject.objects.exclude(source_uuid=source_uuid).count()
+
+        for _ in range(2):
+            self.accessor.populate_ui_summary_tables([table_name], start_date, end_date, source_uuid)
+
+            with schema_context(self.schema):
+                summary = OCPCostSummaryByProject.objects
+                self.assertEqual(summary.filter(source_uuid=source_uuid).count(), expected_count)
+                self.assertEqual(summary.exclude(source_uuid=source_uuid).count(), other_count)
+
     def test_get_usage_period_on_or_before_date(self):
         """Test that gets a query for usage report periods before a date."""
         with schema_context(self.schema):
@@ -738,6 +766,48 @@ class OCPReportDBAccessorTest(MasuTestCase):
             for monthly_cost_row in monthly_cost_rows:
                 self.assertEquals(monthly_cost_row.infrastructure_monthly_cost, node_rate)
 
+    def test_populate_monthly_cost_node_updates_existing_rows(self):
+        """Test that repopulating node monthly cost updates rows instead of adding new ones."""
+        self.cluster_id = self.ocp_provider.authentication.credentials.get("cluster_id")
+
+        dh = DateHelper()
+        start_date = dh.this_month_start
+        end_date = dh.this_month_end
+
+        first_month, _ = month_date_range_tuple(start_date)
+
+        cluster_alias = "test_cluster_alias"
+        self.accessor.populate_monthly_cost(
+            "Node", "Infrastructure", 10, start_date, end_date, self.cluster_id, cluster_alias
+        )
+        monthly_cost_rows = self.accessor._get_db_obj_query(OCPUsageLineItemDailySummary).filter(
+            usage_start=first_month, monthly_cost_type="Node", infrastructure_monthly_cost__isnull=False
+        )
+        with schema_context(self.schema):
+            expected_count = monthly_cost_rows.count()
+
+        self.accessor.populate_monthly_cost(
+            "Node", "Infrastructure", 20, start_date, end_date, self.cluster_id, cluster_alias
+        )
+        with schema_context(self.schema):
+            self.assertEqual(monthly_cost_rows.count(), expected_count)
+            for monthly_cost_row in monthly_cost_rows:
+                self.assertEqual(monthly_cost_row.infrastructure_monthly_cost, 20)
+
+    def test_get_monthly_tag_rates(self):
+        """Test that tag rate dictionaries are flattened into rate rows."""
+        rate_dict = {"app": {"banking": 10, "mobile": 5}}
+        expected = [
+            {"tag_key": "app", "tag_value": "banking", "rate": "10"},
+            {"tag_key": "app", "tag_value": "mobile", "rate": "5"},
+        ]
+        self.assertEqual(self.accessor._get_monthly_tag_rates(rate_dict), expected)
+        self.assertEqual(self.accessor._get_monthly_tag_rates(None), [])
+
+        default_dict = {"app": {"default_value": 3, "defined_keys": ["banking", "mobile"]}}
+        expected = [{"tag_key": "app", "rate": "3", "defined_values": ["banking", "mobile"]}]
+        self.assertEqual(self.accessor._get_monthly_tag_default_rates(default_dict), expected)
+
     def test_populate_monthly_cost_node_supplementary_cost(self):
         """Test that the monthly supplementary cost row for nodes in the summary table is populated."""
         self.cluster_id = self.ocp_provider.authentication.credentials.get("cluster_id")
@@ -942,13 +1012,13 @@ class OCPReportDBAccessorTest(MasuTestCase):
             self.fail(f"Exception thrown: {err}")
 
     @patch("masu.database.ocp_report_db_accessor.kpdb.executescript")
-    @patch("masu.database.ocp_report_db_accessor.kpdb.connect")
+    @patch("masu.database.ocp_report_db_accessor.kpdb.connection")
     def test_populate_line_item_daily_summary_table_presto(self, mock_connect, mock_executescript):
         """
         Test that OCP presto processing calls executescript
         """
         presto_conn = FakePrestoConn()
-        mock_connect.return_value = presto_conn
+        mock_connect.return_value.__enter__.return_value = presto_conn
         mock_executescript.return_value = []
         dh = DateHelper()
         start_date = dh.this_month_start
@@ -964,13 +1034,13 @@ class OCPReportDBAccessorTest(MasuTestCase):
         mock_executescript.assert_called()
 
     @patch("masu.database.ocp_report_db_accessor.pkgutil.get_data")
-    @patch("masu.database.ocp_report_db_accessor.kpdb.connect")
+    @patch("masu.database.ocp_report_db_accessor.kpdb.connection")
     def test_populate_line_item_daily_summary_table_presto_preprocess_exception(self, mock_connect, mock_get_data):
         """
         Test that OCP presto processing converts datetime to date for start, end dates
         """
         presto_conn = FakePrestoConn()
-        mock_connect.return_value = presto_conn
+        mock_connect.return_value.__enter__.return_value = presto_conn
         mock_get_data.return_value = b"""
 select * from eek where val1 in {{report_period_id}} ;
 """
@@ -986,13 +1056,13 @@ select * from eek where val1 in {{report_period_id}} ;
             )
 
     @patch("masu.database.ocp_report_db_accessor.kpdb.executescript")
-    @patch("masu.database.ocp_report_db_accessor.kpdb.connect")
+    @patch("masu.database.ocp_report_db_accessor.kpdb.connection")
     def test_populate_pod_label_summary_table_presto(self, mock_connect, mock_executescript):
         """
         Test that OCP presto processing calls executescript
         """
         presto_conn = FakePrestoConn()
-        mock_connect.return_value = presto_conn
+        mock_connect.return_value.__enter__.return_value = presto_conn
         mock_executescript.return_value = []
         dh = DateHelper()
         start_date = dh.this_month_start
@@ -1004,13 +1074,13 @@ select * from eek where val1 in {{report_period_id}} ;
         mock_executescript.assert_called()
 
     @patch("masu.database.ocp_report_db_accessor.pkgutil.get_data")
-    @patch("masu.database.ocp_report_db_accessor.kpdb.connect")
+    @patch("masu.database.ocp_report_db_accessor.kpdb.connection")
     def test_populate_pod_label_summary_table_presto_preprocess_exception(self, mock_connect, mock_get_data):
         """
         Test that OCP presto processing converts datetime to date for start, end dates
         """
         presto_conn = FakePrestoConn()
-        mock_connect.return_value = presto_conn
+        mock_connect.return_value.__enter__.return_value = presto_conn
         mock_get_data.return_value = b"""
 select * from eek where val1 in {{report_period_ids}} ;
 """
@@ -1989,6 +2059,32 @@ select * from eek where val1 in {{report_period_ids}} ;
                                 )
                                 self.assertAlmostEqual(actual_diff, expected_diff)
 
+    @patch("masu.database.ocp_report_db_accessor.OCPReportDBAccessor._execute_raw_sql_query")
+    def test_populate_tag_usage_costs_one_update_per_rate_type(self, mock_execute):
+        """Test that all tag rates of a cost type are applied in a single update."""
+        tag_rates = {
+            "cpu_core_usage_per_hour": {"app": {f"value_{i}": i for i in range(300)}},
+            "storage_gb_usage_per_month": {"app": {"banking": 1}},
+        }
+        default_rates = {"cpu_core_usage_per_hour": {"app": {"default_value": 1, "defined_keys": ["banking"]}}}
+        dh = DateHelper()
+
+        self.accessor.populate_tag_usage_costs(
+            tag_rates, tag_rates, dh.this_month_start, dh.this_month_end, self.cluster_id
+        )
+        self.assertEqual(mock_execute.call_count, 2)
+
+        mock_execute.reset_mock()
+        self.accessor.populate_tag_usage_default_costs(
+            default_rates, {}, dh.this_month_start, dh.this_month_end, self.cluster_id
+        )
+        self.assertEqual(mock_execute.call_count, 1)
+
+    def test_get_sql_template_is_cached(self):
+        """Test that SQL templates are compiled once and reused."""
+        sql_file = "sql/reporting_ocpusagelineitem_daily_summary_tag_rates.sql"
+        self.assertIs(get_sql_template(sql_file), get_sql_template(sql_file))
+
     def test_populate_tag_based_default_usage_costs(self):  # noqa: C901
         """Test that the usage costs are updated correctly when default tag values are passed in."""
         # set up the key value pairs to test and the map for cost type and the fields it needs
@@ -32,6 +32,7 @@ from masu.test import MasuTestCase
 from masu.test.external.downloader.aws import fake_arn
 from reporting.provider.aws.models import AWSAccountAlias
 from reporting.provider.aws.models import AWSOrganizationalUnit
+from reporting.provider.aws.models import AWSOrganizationalUnitClosure
 
 FAKE = Faker()
 CUSTOMER_NAME = FAKE.word()
@@ -280,6 +281,24 @@ class AWSOrgUnitCrawlerTest(MasuTestCase):
             cur_count = AWSOrganizationalUnit.objects.count()
             self.assertEqual(cur_count, 3)
 
+    def test_save_aws_org_method_closure(self):
+        """Test that saving a node adds the org units of its path to the closure table."""
+        unit_crawler = AWSOrgUnitCrawler(self.account)
+        unit_crawler._build_accout_alias_map()
+        unit_crawler._structure_yesterday = {}
+        sub_ou = {"Id": "OU_002", "Name": "sub"}
+        sub_account = {"Id": "A_002", "Name": "Sub Account"}
+        unit_crawler._save_aws_org_method(sub_ou, "R_001&OU_001&OU_002", 2)
+        org_unit = unit_crawler._save_aws_org_method(sub_ou, "R_001&OU_001&OU_002", 2, sub_account)
+        unit_crawler._save_aws_org_method(sub_ou, "R_001&OU_001&OU_002", 2, sub_account)
+        with schema_context(self.schema):
+            ancestors = AWSOrganizationalUnitClosure.objects.filter(organizational_unit=org_unit).order_by("depth")
+            self.assertEqual(
+                list(ancestors.values_list("ancestor_org_unit_id", "ancestor_path", "depth")),
+                [("OU_002", "R_001&OU_001&OU_002", 0), ("OU_001", "R_001&OU_001", 1), ("R_001", "R_001", 2)],
+            )
+            self.assertEqual(AWSOrganizationalUnitClosure.objects.filter(ancestor_path="R_001&OU_001").count(), 2)
+
     def test_org_unit_deleted_state(self):
         """Test that an org unit that is in a deleted state is fixed when it is found again."""
         unit_crawler = AWSOrgUnitCrawler(self.account)
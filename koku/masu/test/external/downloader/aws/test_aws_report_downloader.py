@@ -16,10 +16,12 @@
 #
 """Test the AWS S3 utility functions."""
 import io
+import json
 import logging
 import os.path
 import random
 import shutil
+import threading
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -36,6 +38,7 @@ from masu.external.downloader.aws.aws_report_downloader import AWSReportDownload
 from masu.external.downloader.aws.aws_report_downloader import AWSReportDownloaderError
 from masu.external.downloader.aws.aws_report_downloader import AWSReportDownloaderNoFileError
 from masu.external.report_downloader import ReportDownloader
+from masu.prometheus_stats import REPORT_FILE_DOWNLOAD_BYTES_COUNTER
 from masu.test import MasuTestCase
 from masu.test.external.downloader.aws import fake_arn
 
@@ -145,6 +148,31 @@ class FakeSessionDownloadError:
             return Mock()
 
 
+class StandInS3Client:
+    """In memory stand-in for the S3 client honoring Range and IfMatch on get_object."""
+
+    def __init__(self, data, etag='"abc123"', fail_after=None):
+        """Serve data, raising an error after fail_after ranged GETs if set."""
+        self.data = data
+        self.etag = etag
+        self.fail_after = fail_after
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None):
+        """Return the object or the requested byte range of it."""
+        if IfMatch and IfMatch != self.etag:
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "GetObject")
+        if not Range:
+            return {"ContentLength": len(self.data), "ETag": self.etag, "LastModified": None}
+        start, end = (int(value) for value in Range[len("bytes=") :].split("-"))  # noqa: E203
+        with self.lock:
+            if self.fail_after is not None and len(self.ranges) >= self.fail_after:
+                raise ClientError({"Error": {"Code": "SlowDown"}}, "GetObject")
+            self.ranges.append((start, end))
+        return {"Body": io.BytesIO(self.data[start : end + 1])}  # noqa: E203
+
+
 class AWSReportDownloaderTest(MasuTestCase):
     """Test Cases for the AWS S3 functions."""
 
@@ -332,6 +360,79 @@ class AWSReportDownloaderTest(MasuTestCase):
         with self.assertRaises(AWSReportDownloaderError):
             downloader.download_file(fakekey)
 
+    @patch("masu.external.downloader.aws.aws_report_downloader.utils.remove_files_not_in_set_from_s3_bucket")
+    @patch("masu.external.downloader.aws.aws_report_downloader.utils.copy_local_report_file_to_s3_bucket")
+    @patch("masu.util.aws.common.get_assume_role_session", return_value=FakeSession)
+    def test_download_file_ranged(self, fake_session, mock_copy, mock_remove):
+        """Test that a large file is downloaded as ranged parts and resumed after a failure."""
+        data = os.urandom(10 * 1024 + 7)
+        downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
+        downloader.s3_client = StandInS3Client(data, fail_after=4)
+        key = "/koku/20180701-20180801/koku-1.csv"
+        bytes_counter = REPORT_FILE_DOWNLOAD_BYTES_COUNTER.labels(provider_type=Provider.PROVIDER_AWS)
+        bytes_before = bytes_counter._value.get()
+
+        with patch.multiple(
+            "masu.external.downloader.aws.aws_report_downloader.Config",
+            AWS_RANGED_DOWNLOAD=True,
+            AWS_DOWNLOAD_PART_SIZE=1024,
+            AWS_DOWNLOAD_WORKERS=1,
+        ):
+            with self.assertRaises(AWSReportDownloaderError):
+                downloader.download_file(key)
+            first_ranges = list(downloader.s3_client.ranges)
+            self.assertEqual(len(first_ranges), 4)
+
+            downloader.s3_client.fail_after = None
+            full_file_path, etag, _ = downloader.download_file(key)
+
+        resumed_ranges = downloader.s3_client.ranges[len(first_ranges) :]  # noqa: E203
+        self.assertEqual(len(resumed_ranges), 7)
+        self.assertFalse(set(first_ranges) & set(resumed_ranges))
+        self.assertEqual(etag, downloader.s3_client.etag)
+        with open(full_file_path, "rb") as downloaded_file:
+            self.assertEqual(downloaded_file.read(), data)
+        self.assertFalse(os.path.exists(f"{full_file_path}.part"))
+        self.assertFalse(os.path.exists(f"{full_file_path}.part.json"))
+        # Only the bytes fetched by the resumed attempt are counted
+        self.assertEqual(bytes_counter._value.get(), bytes_before + len(data) - 4 * 1024)
+
+    @patch("masu.util.aws.common.get_assume_role_session", return_value=FakeSession)
+    def test_download_file_ranged_changed_object(self, fake_session):
+        """Test that parts of an object with another ETag are not reused."""
+        data = os.urandom(4 * 1024)
+        downloader = AWSReportDownloader(self.fake_customer_name, self.credentials, self.data_source)
+        downloader.s3_client = StandInS3Client(data)
+        full_file_path = f"{DATA_DIR}/ranged-test.csv"
+        state_path = f"{full_file_path}.part.json"
+
+        def remove_test_files():
+            for path in (full_file_path, f"{full_file_path}.part", state_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self.addCleanup(remove_test_files)
+        with open(f"{full_file_path}.part", "wb") as partial_file:
+            partial_file.write(b"x" * len(data))
+        with open(state_path, "w") as state_file:
+            json.dump({"etag": '"old"', "size": len(data), "part_size": 1024, "done": [0, 1024]}, state_file)
+
+        with patch.multiple(
+            "masu.external.downloader.aws.aws_report_downloader.Config",
+            AWS_DOWNLOAD_PART_SIZE=1024,
+            AWS_DOWNLOAD_WORKERS=2,
+        ):
+            downloaded = downloader._download_ranged("key", full_file_path, downloader.s3_client.etag, len(data))
+
+            self.assertEqual(downloaded, len(data))
+            with open(full_file_path, "rb") as downloaded_file:
+                self.assertEqual(downloaded_file.read(), data)
+
+            downloader.s3_client.etag = '"new"'
+            with self.assertRaises(AWSReportDownloaderError):
+                downloader._download_ranged("key", full_file_path, '"abc123"', len(data))
+            self.assertFalse(os.path.exists(state_path))
+
     @patch("masu.util.aws.common.get_assume_role_session", return_value=FakeSession)
     def test_download_file_raise_downloader_err(self, fake_session):
         """Test _check_size fails when there is a downloader error."""
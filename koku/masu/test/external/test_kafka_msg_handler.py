@@ -20,6 +20,7 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
 import uuid
 from datetime import datetime
 from unittest.mock import patch
@@ -106,6 +107,17 @@ class MockKafkaConsumer:
         self.preloaded_messages.pop()
 
 
+class CommitRecordingKafkaConsumer(MockKafkaConsumer):
+    """Mock consumer recording the committed offsets."""
+
+    def __init__(self, preloaded_messages=None):
+        super().__init__(preloaded_messages)
+        self.committed = []
+
+    def commit(self, offsets=None, asynchronous=True):
+        self.committed.extend((tp.partition, tp.offset) for tp in offsets)
+
+
 class KafkaMsgHandlerTest(MasuTestCase):
     """Test Cases for the Kafka msg handler."""
 
@@ -753,3 +765,182 @@ class KafkaMsgHandlerTest(MasuTestCase):
 
         reports = msg_handler.construct_parquet_reports(1, "context", report_meta, "/payload/path", "report_file")
         self.assertEqual(reports, [])
+
+    @patch("masu.external.kafka_msg_handler.process_messages")
+    def test_listen_concurrently_commits_in_order(self, mock_process):
+        """Test that a partition's offset is only committed once earlier messages are processed."""
+        first_waits = threading.Event()
+        processed = []
+
+        def process(msg):
+            if msg.offset() == 1:
+                first_waits.wait(timeout=5)
+            processed.append(msg.offset())
+            if msg.offset() == 2:
+                first_waits.set()
+
+        mock_process.side_effect = process
+        msg_list = [
+            MockMessage(offset=1, value_dict={"account": "10001"}),
+            MockMessage(offset=2, value_dict={"account": "10002"}),
+            MockMessage(offset=7, partition=1, value_dict={"account": "10003"}),
+        ]
+        consumer = CommitRecordingKafkaConsumer(msg_list)
+        consumer.processed_at_commit = []
+        record_commit = consumer.commit
+
+        def commit(offsets=None, asynchronous=True):
+            consumer.processed_at_commit.append(set(processed))
+            record_commit(offsets, asynchronous)
+
+        consumer.commit = commit
+        with patch("itertools.count", side_effect=[[0, 1, 2]]):
+            msg_handler.ConcurrentMessageListener(consumer, 3).listen()
+        self.assertEqual(processed[:2], [2, 1])
+        self.assertIn((1, 8), consumer.committed)
+        for (partition, offset), done in zip(consumer.committed, consumer.processed_at_commit):
+            if partition == 0:
+                self.assertTrue({1, 2}.intersection(range(offset)) <= done)
+        self.assertEqual(max(offset for partition, offset in consumer.committed if partition == 0), 3)
+
+    @patch("masu.external.kafka_msg_handler.process_messages")
+    def test_listen_concurrently_serializes_account(self, mock_process):
+        """Test that accounts are processed concurrently and an account's messages in order."""
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def process(msg):
+            account = json.loads(msg.value().decode("utf-8"))["account"]
+            with lock:
+                overlaps.append(account in running)
+                running.append(account)
+            if msg.offset() in (1, 2):
+                # Raises if the two accounts are not processed at the same time
+                barrier.wait()
+            with lock:
+                running.remove(account)
+
+        mock_process.side_effect = process
+        msg_list = [
+            MockMessage(offset=1, value_dict={"account": "10001"}),
+            MockMessage(offset=2, value_dict={"account": "10002"}),
+            MockMessage(offset=3, value_dict={"account": "10001"}),
+        ]
+        consumer = CommitRecordingKafkaConsumer(msg_list)
+        with patch("itertools.count", side_effect=[[0, 1, 2]]):
+            msg_handler.ConcurrentMessageListener(consumer, 3).listen()
+        self.assertEqual(mock_process.call_count, 3)
+        self.assertFalse(any(overlaps))
+        self.assertEqual(consumer.committed[-1], (0, 4))
+
+    @patch("masu.external.kafka_msg_handler.process_messages")
+    def test_listen_concurrently_skips_malformed_message(self, mock_process):
+        """Test that a message that can not be read is committed without being processed."""
+        malformed = MockMessage(offset=2, value_dict={"account": "10001"})
+        malformed._value = b"{not json"
+        msg_list = [MockMessage(offset=1, value_dict={"account": "10001"}), malformed]
+        consumer = CommitRecordingKafkaConsumer(msg_list)
+        with patch("itertools.count", side_effect=[[0, 1]]):
+            msg_handler.ConcurrentMessageListener(consumer, 3).listen()
+        mock_process.assert_called_once_with(msg_list[0])
+        self.assertEqual(consumer.committed[-1], (0, 3))
+
+    @patch("masu.external.kafka_msg_handler.time.sleep")
+    @patch("masu.external.kafka_msg_handler.close_and_set_db_connection")
+    @patch("masu.external.kafka_msg_handler.process_messages")
+    def test_process_message_until_done(self, mock_process, mock_close, mock_sleep):
+        """Test that retryable errors are retried and others give up on the message."""
+        msg = MockMessage(offset=1, value_dict={"account": "10001"})
+        mock_process.side_effect = [OperationalError, KafkaMsgHandlerError, None]
+        msg_handler.process_message_until_done(msg)
+        self.assertEqual(mock_process.call_count, 3)
+        mock_close.assert_called_once()
+        self.assertEqual(mock_sleep.call_count, 2)
+
+        mock_process.reset_mock()
+        mock_process.side_effect = ReportProcessorError
+        msg_handler.process_message_until_done(msg)
+        mock_process.assert_called_once()
+
+    @patch("masu.external.kafka_msg_handler.ConcurrentMessageListener")
+    @patch("masu.external.kafka_msg_handler.get_consumer")
+    def test_listen_for_msg_loop_workers(self, mock_consumer, mock_listener):
+        """Test that the message loop uses concurrent listener when configured with several workers."""
+        with patch.object(Config, "KAFKA_CONSUMER_WORKERS", 4):
+            msg_handler.listen_for_messages_loop()
+        mock_listener.assert_called_with(mock_consumer.return_value, 4)
+        mock_listener.return_value.listen.assert_called_once()
+
+    def test_partition_offsets(self):
+        """Test that offsets are released for commit in order."""
+        offsets = msg_handler.PartitionOffsets()
+        for offset in (4, 5, 6):
+            offsets.add(offset)
+        self.assertIsNone(offsets.done(5))
+        self.assertEqual(offsets.done(4), 6)
+        self.assertEqual(len(offsets), 1)
+        self.assertEqual(offsets.done(6), 7)
+
+    @patch("masu.external.kafka_msg_handler.construct_parquet_reports")
+    @patch("masu.external.kafka_msg_handler.record_all_manifest_files")
+    @patch("masu.external.kafka_msg_handler.create_manifest_entries", return_value=1)
+    def test_stream_payload(self, mock_manifest, mock_record_all, mock_parquet):
+        """Test that a streamed payload writes only the report files that were not processed."""
+        fake_account = {"provider_uuid": uuid.uuid4(), "provider_type": "OCP", "schema_name": "acct10001"}
+        payload_url = "http://insights-upload.com/quarnantine/file_to_validate"
+        storage_file = "e6b3701e-1e91-433b-b238-a31e49937558_storage.csv"
+        pod_file = "e6b3701e-1e91-433b-b238-a31e49937558_February-2019-my-ocp-cluster-1.csv"
+        fake_dir = tempfile.mkdtemp()
+        fake_pvc_dir = tempfile.mkdtemp()
+        with requests_mock.mock() as m:
+            m.get(payload_url, content=self.tarball_file)
+            with patch.object(Config, "INSIGHTS_LOCAL_REPORT_DIR", fake_dir):
+                with patch.object(Config, "PVC_DIR", fake_pvc_dir):
+                    with patch.object(Config, "KAFKA_STREAM_PAYLOADS", True):
+                        with patch(
+                            "masu.external.kafka_msg_handler.get_account_from_cluster_id", return_value=fake_account
+                        ):
+                            with patch(
+                                "masu.external.kafka_msg_handler.record_report_status",
+                                side_effect=lambda manifest_id, report_file, *args: report_file == storage_file,
+                            ):
+                                report_metas = msg_handler.extract_payload(payload_url, "test_request_id")
+
+        expected_path = f"{fake_dir}/{self.cluster_id}/{self.date_range}"
+        self.assertEqual([meta["current_file"] for meta in report_metas], [f"{expected_path}/{pod_file}"])
+        self.assertEqual(report_metas[0]["manifest_id"], 1)
+        self.assertEqual(report_metas[0]["account"], "10001")
+        self.assertEqual(sorted(os.listdir(expected_path)), [pod_file, "manifest.json"])
+        self.assertEqual(os.listdir(fake_pvc_dir), [])
+        mock_parquet.assert_called_once()
+        shutil.rmtree(fake_dir)
+        shutil.rmtree(fake_pvc_dir)
+
+    def test_stream_payload_errors(self):
+        """Test that streamed payloads without a manifest, a provider or a tarball are handled."""
+        payload_url = "http://insights-upload.com/quarnantine/file_to_validate"
+        fake_dir = tempfile.mkdtemp()
+        fake_pvc_dir = tempfile.mkdtemp()
+        with requests_mock.mock() as m:
+            with patch.object(Config, "INSIGHTS_LOCAL_REPORT_DIR", fake_dir):
+                with patch.object(Config, "PVC_DIR", fake_pvc_dir):
+                    with patch("masu.external.kafka_msg_handler.get_account_from_cluster_id", return_value=None):
+                        m.get(payload_url, content=self.tarball_file)
+                        self.assertIsNone(msg_handler.stream_payload(payload_url, "test_request_id"))
+
+                        m.get(payload_url, content=self.no_manifest_file)
+                        with self.assertRaises(msg_handler.KafkaMsgHandlerError):
+                            msg_handler.stream_payload(payload_url, "test_request_id")
+
+                        m.get(payload_url, content=b"not,a,tarball")
+                        with self.assertRaises(msg_handler.KafkaMsgHandlerError):
+                            msg_handler.stream_payload(payload_url, "test_request_id")
+
+                        m.get(payload_url, exc=HTTPError)
+                        with self.assertRaises(msg_handler.KafkaMsgHandlerError):
+                            msg_handler.stream_payload(payload_url, "test_request_id")
+        self.assertEqual(os.listdir(fake_pvc_dir), [])
+        shutil.rmtree(fake_dir)
+        shutil.rmtree(fake_pvc_dir)
@@ -16,6 +16,7 @@
 #
 """Test the AWSReportDBCleaner utility object."""
 import datetime
+from unittest.mock import patch
 
 from dateutil import relativedelta
 from tenant_schemas.utils import schema_context
@@ -162,6 +163,30 @@ class AWSReportDBCleanerTest(MasuTestCase):
             self.assertIsNotNone(self.accessor._get_db_obj_query(line_item_table_name).first())
             self.assertIsNotNone(self.accessor._get_db_obj_query(cost_entry_table_name).first())
 
+    def test_purge_expired_report_data_drops_partitions(self):
+        """Test that summary rows of months with a dropped partition are not deleted row by row."""
+        bill_table_name = AWS_CUR_TABLE_MAP["bill"]
+        cleaner = AWSReportDBCleaner(self.schema)
+        with schema_context(self.schema):
+            first_bill = self.accessor._get_db_obj_query(bill_table_name).first()
+            cutoff_date = first_bill.billing_period_start
+        partition = {
+            "partition": "reporting_awscostentrylineitem_daily_summary_2020_01",
+            "partition_start": str(cutoff_date.date().replace(day=1)),
+            "size": 8192,
+        }
+
+        with patch.object(
+            AWSReportDBAccessor, "purge_expired_partitions", return_value=[partition]
+        ) as mock_purge, patch.object(AWSReportDBAccessor, "get_summary_query_for_billid") as mock_summary:
+            removed_data = cleaner.purge_expired_report_data(cutoff_date)
+
+        mock_purge.assert_called_once_with(
+            AWS_CUR_TABLE_MAP["line_item_daily_summary"], cutoff_date, simulate=False
+        )
+        mock_summary.assert_not_called()
+        self.assertEqual(removed_data[0].get("partitions"), [partition])
+
     def test_purge_expired_report_data_for_provider(self):
         """Test that the provider_uuid deletes all data for the provider."""
         bill_table_name = AWS_CUR_TABLE_MAP["bill"]
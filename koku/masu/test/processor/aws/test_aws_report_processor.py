@@ -153,6 +153,69 @@ class AWSReportProcessorTest(MasuTestCase):
         self.assertEqual(self.processor._datetime_format, Config.AWS_DATETIME_STR_FORMAT)
         self.assertEqual(self.processor._batch_size, Config.REPORT_PROCESSING_BATCH_SIZE)
 
+    def test_initializer_shared_lookup_cache(self):
+        """Test that processors sharing a lookup cache load the lookups once."""
+        lookup_cache = {}
+        first = AWSReportProcessor(
+            schema_name=self.schema,
+            report_path=self.test_report,
+            compression=UNCOMPRESSED,
+            provider_uuid=self.aws_provider_uuid,
+            lookup_cache=lookup_cache,
+        )
+        self.assertIs(lookup_cache["product"], first.existing_product_map)
+
+        first.existing_product_map[("sku", "name", "region")] = 1
+        with patch.object(AWSReportProcessor, "_load_product_id") as mock_products:
+            second = AWSReportProcessor(
+                schema_name=self.schema,
+                report_path=self.test_report_gzip,
+                compression=GZIP_COMPRESSED,
+                provider_uuid=self.aws_provider_uuid,
+                lookup_cache=lookup_cache,
+            )
+            mock_products.assert_not_called()
+        self.assertEqual(second.existing_product_map[("sku", "name", "region")], 1)
+
+    def test_process_shared_lookup_cache(self):
+        """Test that a file does not look up the rows created by an earlier file sharing its lookup cache."""
+        lookup_cache = {}
+        first = AWSReportProcessor(
+            schema_name=self.schema,
+            report_path=self.test_report,
+            compression=UNCOMPRESSED,
+            provider_uuid=self.aws_provider_uuid,
+            lookup_cache=lookup_cache,
+        )
+        first.process()
+        self.assertTrue(len(lookup_cache["bill"]))
+
+        shutil.copy2(self.test_report_test_path, self.test_report)
+        second = AWSReportProcessor(
+            schema_name=self.schema,
+            report_path=self.test_report,
+            compression=UNCOMPRESSED,
+            provider_uuid=self.aws_provider_uuid,
+            lookup_cache=lookup_cache,
+        )
+        with patch.object(AWSReportProcessor, "_load_dimension_id") as mock_load:
+            second.process()
+        mock_load.assert_not_called()
+
+    def test_lookup_cache_loads_on_miss(self):
+        """Test that dimension ids missing from the caches are read from the database."""
+        product_id = self.processor._create_cost_entry_product(self.row, self.accessor)
+        key = (self.row.get("product/sku"), self.row.get("product/ProductName"), self.row.get("product/region"))
+        processor = AWSReportProcessor(
+            schema_name=self.schema,
+            report_path=self.test_report,
+            compression=UNCOMPRESSED,
+            provider_uuid=self.aws_provider_uuid,
+        )
+        self.assertEqual(len(processor.existing_product_map), 0)
+        self.assertEqual(processor.existing_product_map[key], product_id)
+        self.assertNotIn(("not", "a", "product"), processor.existing_product_map)
+
     def test_initializer_unsupported_compression(self):
         """Assert that an error is raised for an invalid compression."""
         with self.assertRaises(MasuProcessingError):
@@ -552,6 +615,7 @@ class AWSReportProcessorTest(MasuTestCase):
         test_entry = {"key": "value"}
         counts = {}
         ce_maps = {
+            "bill": self.processor.existing_bill_map,
             "cost_entry": self.processor.existing_cost_entry_map,
             "product": self.processor.existing_product_map,
             "pricing": self.processor.existing_pricing_map,
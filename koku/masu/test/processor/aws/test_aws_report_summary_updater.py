@@ -340,3 +340,37 @@ class AWSReportSummaryUpdaterTest(MasuTestCase):
             bill = accessor.get_cost_entry_bills_by_date(bill_date)[0]
             self.assertIsNotNone(bill.summary_data_creation_datetime)
             self.assertGreater(bill.summary_data_updated_datetime, self.today)
+
+    @patch("masu.processor.aws.aws_report_summary_updater.AWSReportDBAccessor.get_line_item_counts_by_day")
+    def test_get_date_chunks_by_rows(self, mock_counts):
+        """Test that the date chunks are sized by the line items of each day when a row budget is set."""
+        start_date = datetime.date(year=self.today.year, month=self.today.month, day=1)
+        end_date = start_date + datetime.timedelta(days=2)
+        mock_counts.return_value = {start_date: 100, start_date + datetime.timedelta(days=1): 100}
+
+        with patch("masu.processor.aws.aws_report_summary_updater.Config.SUMMARY_CHUNK_ROWS", 150):
+            result_start, result_end, chunks = self.updater.get_date_chunks(str(start_date), str(end_date))
+
+        self.assertEqual(result_start, str(start_date))
+        self.assertEqual(result_end, str(end_date))
+        self.assertEqual(chunks, [(start_date, start_date), (start_date + datetime.timedelta(days=1), end_date)])
+
+    @patch("masu.processor.aws.aws_report_summary_updater.AWSReportDBAccessor.populate_tags_summary_table")
+    @patch("masu.processor.aws.aws_report_summary_updater.AWSReportDBAccessor.populate_line_item_daily_summary_table")
+    @patch("masu.processor.aws.aws_report_summary_updater.AWSReportDBAccessor.populate_line_item_daily_table")
+    def test_update_chunk_tables(self, mock_daily, mock_summary, mock_tags):
+        """Test that a date chunk populates the daily and summary tables and leaves the tags to the finalize."""
+        start_date = datetime.date(year=self.today.year, month=self.today.month, day=1)
+        end_date = start_date + datetime.timedelta(days=1)
+        bill_date = start_date.replace(day=1)
+
+        with AWSReportDBAccessor(self.schema) as accessor:
+            bill = accessor.get_cost_entry_bills_by_date(bill_date)[0]
+
+        self.updater.update_chunk_tables(start_date, end_date)
+        mock_daily.assert_called_with(start_date, end_date, [str(bill.id)])
+        mock_summary.assert_called_with(start_date, end_date, [str(bill.id)])
+        mock_tags.assert_not_called()
+
+        self.updater.finalize_summary_tables(str(start_date), str(end_date))
+        mock_tags.assert_called_with([str(bill.id)])
@@ -22,8 +22,10 @@ import json
 import os
 import shutil
 import tempfile
+from decimal import Decimal
 from unittest.mock import patch
 
+import pandas as pd
 from tenant_schemas.utils import schema_context
 
 from masu.config import Config
@@ -35,6 +37,7 @@ from masu.external import GZIP_COMPRESSED
 from masu.external import UNCOMPRESSED
 from masu.external.date_accessor import DateAccessor
 from masu.processor.ocp.ocp_report_processor import OCPReportProcessor
+from masu.processor.ocp.ocp_report_processor import OCPReportProcessorBase
 from masu.processor.ocp.ocp_report_processor import OCPReportProcessorError
 from masu.processor.ocp.ocp_report_processor import ProcessedOCPReport
 from masu.test import MasuTestCase
@@ -812,3 +815,109 @@ class OCPReportProcessorTest(MasuTestCase):
         with schema_context(self.schema):
             after_count = table.objects.count()
         self.assertEqual(after_count, before_count)
+
+    def test_process_columnar_matches_row_processing(self):
+        """Test that columnar processing writes the same line items as row processing."""
+        report_db = self.accessor
+        report_schema = report_db.report_schema
+        table = getattr(report_schema, OCP_REPORT_TABLE_MAP["line_item"])
+        columns = ["namespace", "pod", "node", "pod_usage_cpu_core_seconds", "pod_limit_memory_byte_seconds"]
+        with schema_context(self.schema):
+            table.objects.all().delete()
+
+        processor = OCPReportProcessor(
+            schema_name="acct10001",
+            report_path=self.test_report,
+            compression=UNCOMPRESSED,
+            provider_uuid=self.ocp_provider_uuid,
+        )
+        processor.process()
+        with schema_context(self.schema):
+            expected = list(table.objects.order_by(*columns[:3]).values(*columns, "pod_labels"))
+            table.objects.all().delete()
+
+        shutil.copy2(self.test_report_path, self.test_report)
+        with patch.object(Config, "OCP_COLUMNAR_PROCESSING", True), patch.object(
+            Config, "REPORT_PROCESSING_BATCH_SIZE", 5
+        ):
+            processor = OCPReportProcessor(
+                schema_name="acct10001",
+                report_path=self.test_report,
+                compression=UNCOMPRESSED,
+                provider_uuid=self.ocp_provider_uuid,
+            )
+            processor.process()
+        with schema_context(self.schema):
+            result = list(table.objects.order_by(*columns[:3]).values(*columns, "pod_labels"))
+
+        self.assertEqual(result, expected)
+        self.assertFalse(os.path.exists(self.test_report))
+
+    def test_process_columnar_duplicate_rows_same_file(self):
+        """Test that columnar processing drops rows repeated across chunks."""
+        table = getattr(self.accessor.report_schema, OCP_REPORT_TABLE_MAP["line_item"])
+        with schema_context(self.schema):
+            initial_count = table.objects.count()
+
+        with open(self.test_report, "r") as f:
+            data = list(csv.DictReader(f))
+        expected_new_count = len(data)
+        data.extend(data)
+        tmp_file = f"{self.temp_dir}/test_process_columnar_duplicate_rows_same_file.csv"
+        with open(tmp_file, "w") as f:
+            writer = csv.DictWriter(f, fieldnames=data[0].keys())
+            writer.writeheader()
+            writer.writerows(data)
+
+        with patch.object(Config, "OCP_COLUMNAR_PROCESSING", True), patch.object(
+            Config, "REPORT_PROCESSING_BATCH_SIZE", 7
+        ):
+            processor = OCPReportProcessor(
+                schema_name="acct10001",
+                report_path=tmp_file,
+                compression=UNCOMPRESSED,
+                provider_uuid=self.ocp_provider_uuid,
+            )
+            processor.process()
+
+        with schema_context(self.schema):
+            count = table.objects.count()
+        self.assertEqual(count, initial_count + expected_new_count)
+
+    def test_process_columnar_storage_and_node_labels(self):
+        """Test columnar processing of storage and node label reports."""
+        for report_path, table_key in (
+            (self.storage_report, "storage_line_item"),
+            (self.node_report, "node_label_line_item"),
+        ):
+            with self.subTest(report=report_path):
+                table = getattr(self.accessor.report_schema, OCP_REPORT_TABLE_MAP[table_key])
+                with schema_context(self.schema):
+                    before_count = table.objects.count()
+                with patch.object(Config, "OCP_COLUMNAR_PROCESSING", True):
+                    processor = OCPReportProcessor(
+                        schema_name="acct10001",
+                        report_path=report_path,
+                        compression=UNCOMPRESSED,
+                        provider_uuid=self.ocp_provider_uuid,
+                    )
+                    processor.process()
+                with schema_context(self.schema):
+                    after_count = table.objects.count()
+                self.assertGreater(after_count, before_count)
+
+    def test_clean_dataframe(self):
+        """Test that DataFrame columns are coerced to database types."""
+        line_items = pd.DataFrame(
+            {"count": ["1", "", "x"], "ratio": ["1.5", "", "y"], "cost": ["1.25", "", "z"], "name": ["a", "b", ""]}
+        )
+        column_types = {"count": int, "ratio": float, "cost": Decimal, "name": str}
+
+        result = OCPReportProcessorBase._clean_dataframe(line_items, column_types)
+
+        self.assertEqual(result["count"].tolist()[0], 1)
+        self.assertTrue(result["count"].isna().tolist()[1:] == [True, True])
+        self.assertEqual(result["ratio"].tolist()[0], 1.5)
+        self.assertTrue(result["ratio"].isna().tolist()[1:] == [True, True])
+        self.assertEqual(result["cost"].tolist(), ["1.25", None, None])
+        self.assertEqual(result["name"].tolist(), ["a", "b", None])
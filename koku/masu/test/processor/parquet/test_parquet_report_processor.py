@@ -15,21 +15,28 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 import logging
+import os
+import shutil
+import tempfile
 import uuid
 from datetime import timedelta
+from unittest.mock import Mock
 from unittest.mock import patch
 
 import faker
+import pyarrow.parquet as pq
 from botocore.exceptions import ClientError
 
 from api.models import Provider
 from api.utils import DateHelper
+from masu.config import Config
 from masu.processor.aws.aws_report_parquet_processor import AWSReportParquetProcessor
 from masu.processor.azure.azure_report_parquet_processor import AzureReportParquetProcessor
 from masu.processor.ocp.ocp_report_parquet_processor import OCPReportParquetProcessor
 from masu.processor.parquet.parquet_report_processor import ParquetReportProcessor
 from masu.processor.report_parquet_processor_base import ReportParquetProcessorBase
 from masu.test import MasuTestCase
+from masu.util.aws.common import record_s3_object_manifest
 
 
 class TestParquetReportProcessor(MasuTestCase):
@@ -208,6 +215,17 @@ class TestParquetReportProcessor(MasuTestCase):
                 files = self.report_processor.get_file_keys_from_s3_with_manifest_id("request_id", None, "manifest_id")
                 self.assertEqual(files, [])
 
+        record_s3_object_manifest("s3_path/file.csv", "manifest_id")
+        with patch("masu.processor.parquet.parquet_report_processor.settings", ENABLE_PARQUET_PROCESSING=True):
+            with patch("masu.processor.parquet.parquet_report_processor.get_s3_resource") as mock_s3:
+                summary = Mock(key="s3_path/file.csv")
+                mock_s3.return_value.Bucket.return_value.objects.filter.return_value = [summary]
+                files = self.report_processor.get_file_keys_from_s3_with_manifest_id(
+                    "request_id", "s3_path", "manifest_id"
+                )
+                self.assertEqual(files, ["s3_path/file.csv"])
+                summary.Object.assert_not_called()
+
         with patch("masu.processor.parquet.parquet_report_processor.settings", ENABLE_PARQUET_PROCESSING=True):
             with patch("masu.processor.parquet.parquet_report_processor.get_s3_resource") as mock_s3:
                 mock_s3.side_effect = ClientError({}, "Error")
@@ -262,8 +280,10 @@ class TestParquetReportProcessor(MasuTestCase):
                 with patch("masu.processor.parquet.parquet_report_processor.shutil.rmtree"):
                     with patch("masu.processor.parquet.parquet_report_processor.Path"):
                         with patch("masu.processor.parquet.parquet_report_processor.pd"):
-                            with patch("masu.processor.parquet.parquet_report_processor.open") as mock_open:
-                                mock_open.side_effect = ValueError()
+                            with patch(
+                                "masu.processor.parquet.parquet_report_processor.copy_local_file_to_s3_bucket"
+                            ) as mock_copy:
+                                mock_copy.side_effect = ValueError()
                                 result = self.report_processor.convert_csv_to_parquet(
                                     "request_id",
                                     "s3_csv_path",
@@ -279,24 +299,22 @@ class TestParquetReportProcessor(MasuTestCase):
                 with patch("masu.processor.parquet.parquet_report_processor.Path"):
                     with patch("masu.processor.parquet.parquet_report_processor.shutil.rmtree"):
                         with patch("masu.processor.parquet.parquet_report_processor.pd"):
-                            with patch("masu.processor.parquet.parquet_report_processor.open"):
-                                with patch("masu.processor.parquet.parquet_report_processor.BytesIO"):
-                                    with patch(
-                                        "masu.processor.parquet.parquet_report_processor.copy_data_to_s3_bucket"
-                                    ):
-                                        with patch(
-                                            "masu.processor.parquet.parquet_report_processor.ParquetReportProcessor."
-                                            "create_parquet_table"
-                                        ):
-                                            result = self.report_processor.convert_csv_to_parquet(
-                                                "request_id",
-                                                "s3_csv_path",
-                                                "s3_parquet_path",
-                                                "local_path",
-                                                "manifest_id",
-                                                "csv_filename.csv.gz",
-                                            )
-                                            self.assertTrue(result)
+                            with patch(
+                                "masu.processor.parquet.parquet_report_processor.copy_local_file_to_s3_bucket"
+                            ):
+                                with patch(
+                                    "masu.processor.parquet.parquet_report_processor.ParquetReportProcessor."
+                                    "create_parquet_table"
+                                ):
+                                    result = self.report_processor.convert_csv_to_parquet(
+                                        "request_id",
+                                        "s3_csv_path",
+                                        "s3_parquet_path",
+                                        "local_path",
+                                        "manifest_id",
+                                        "csv_filename.csv.gz",
+                                    )
+                                    self.assertTrue(result)
 
     def test_convert_csv_to_parquet_report_type_already_processed(self):
         """Test that we don't re-create a table when we already have created this run."""
@@ -305,27 +323,131 @@ class TestParquetReportProcessor(MasuTestCase):
                 with patch("masu.processor.parquet.parquet_report_processor.Path"):
                     with patch("masu.processor.parquet.parquet_report_processor.shutil.rmtree"):
                         with patch("masu.processor.parquet.parquet_report_processor.pd"):
-                            with patch("masu.processor.parquet.parquet_report_processor.open"):
-                                with patch("masu.processor.parquet.parquet_report_processor.BytesIO"):
-                                    with patch(
-                                        "masu.processor.parquet.parquet_report_processor.copy_data_to_s3_bucket"
-                                    ):
-                                        with patch(
-                                            "masu.processor.parquet.parquet_report_processor.ParquetReportProcessor."
-                                            "create_parquet_table"
-                                        ) as mock_create_table:
-                                            self.report_processor.presto_table_exists["report_type"] = True
-                                            result = self.report_processor.convert_csv_to_parquet(
-                                                "request_id",
-                                                "s3_csv_path",
-                                                "s3_parquet_path",
-                                                "local_path",
-                                                "manifest_id",
-                                                "csv_filename.csv.gz",
-                                                report_type="report_type",
-                                            )
-                                            self.assertTrue(result)
-                                            mock_create_table.assert_not_called()
+                            with patch(
+                                "masu.processor.parquet.parquet_report_processor.copy_local_file_to_s3_bucket"
+                            ):
+                                with patch(
+                                    "masu.processor.parquet.parquet_report_processor.ParquetReportProcessor."
+                                    "create_parquet_table"
+                                ) as mock_create_table:
+                                    self.report_processor.presto_table_exists["report_type"] = True
+                                    result = self.report_processor.convert_csv_to_parquet(
+                                        "request_id",
+                                        "s3_csv_path",
+                                        "s3_parquet_path",
+                                        "local_path",
+                                        "manifest_id",
+                                        "csv_filename.csv.gz",
+                                        report_type="report_type",
+                                    )
+                                    self.assertTrue(result)
+                                    mock_create_table.assert_not_called()
+
+    def test_convert_csv_chunks_to_parquet(self):
+        """Test that a CSV file is written to parquet one row group per chunk."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        csv_file = os.path.join(temp_dir, "report.csv")
+        output_file = os.path.join(temp_dir, "report.parquet")
+        with open(csv_file, "w") as f:
+            f.write("name,value\n")
+            for i in range(5):
+                f.write(f"name_{i},{i}\n")
+
+        def post_processor(data_frame):
+            data_frame["doubled"] = data_frame["value"].astype(int) * 2
+            return data_frame
+
+        converters = {"name": str, "value": str}
+        with patch.object(Config, "PARQUET_PROCESSING_BATCH_SIZE", 2):
+            row_count = ParquetReportProcessor._convert_csv_chunks_to_parquet(
+                csv_file, output_file, converters, post_processor
+            )
+
+        self.assertEqual(row_count, 5)
+        parquet_file = pq.ParquetFile(output_file)
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(table.column("doubled").to_pylist(), [0, 2, 4, 6, 8])
+
+    def test_convert_csv_chunks_to_parquet_header_only(self):
+        """Test that a CSV file with only a header still produces a parquet file."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        csv_file = os.path.join(temp_dir, "report.csv")
+        output_file = os.path.join(temp_dir, "report.parquet")
+        with open(csv_file, "w") as f:
+            f.write("name,value\n")
+
+        row_count = ParquetReportProcessor._convert_csv_chunks_to_parquet(
+            csv_file, output_file, {"name": str, "value": str}
+        )
+
+        self.assertEqual(row_count, 0)
+        table = pq.read_table(output_file)
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.column_names, ["name", "value"])
+
+    def test_convert_to_parquet_uses_parallel_conversion(self):
+        """Test that convert_to_parquet hands multiple files to the parallel conversion."""
+        with patch("masu.processor.parquet.parquet_report_processor.settings", ENABLE_S3_ARCHIVING=True):
+            with patch("masu.processor.parquet.parquet_report_processor.get_path_prefix"):
+                with patch.object(Config, "PARQUET_PROCESSING_WORKERS", 4):
+                    with patch.object(
+                        ParquetReportProcessor, "convert_csv_files_to_parquet_in_parallel", return_value=[]
+                    ) as mock_parallel:
+                        with patch.object(ParquetReportProcessor, "convert_csv_to_parquet") as mock_convert:
+                            self.report_processor.convert_to_parquet(
+                                "request_id",
+                                "account",
+                                "provider_uuid",
+                                Provider.PROVIDER_OCP,
+                                "2020-01-01T12:00:00",
+                                "manifest_id",
+                                ["pod_usage.csv", "storage_usage.csv"],
+                            )
+                            mock_parallel.assert_called_once()
+                            conversions = mock_parallel.call_args[0][4]
+                            self.assertEqual([c[0] for c in conversions], ["pod_usage.csv", "storage_usage.csv"])
+                            self.assertEqual([c[3] for c in conversions], ["pod_usage", "storage_usage"])
+                            mock_convert.assert_not_called()
+
+    def test_convert_csv_files_to_parquet_in_parallel(self):
+        """Test that files are converted on a process pool and each table is created once."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+
+        def download_file(tmpfile):
+            with open(tmpfile, "w") as f:
+                f.write("name,value\nname_1,1\nname_2,2\n")
+
+        def create_parquet_table(account, provider_uuid, manifest_id, s3_path, output_file, report_type):
+            self.assertTrue(os.path.exists(output_file))
+            self.assertEqual(pq.read_table(output_file).num_rows, 2)
+            self.report_processor.presto_table_exists[report_type] = True
+
+        conversions = [
+            ("pod_usage_1.csv", "s3_parquet_path", {}, "pod_usage"),
+            ("pod_usage_2.csv", "s3_parquet_path", {}, "pod_usage"),
+            ("storage_usage_1.csv", "s3_parquet_path", {}, "storage_usage"),
+            ("bad_file.json", "s3_parquet_path", {}, "pod_usage"),
+        ]
+        with patch("masu.processor.parquet.parquet_report_processor.get_s3_resource") as mock_s3:
+            mock_s3.return_value.Object.return_value.download_file.side_effect = download_file
+            with patch("masu.processor.parquet.parquet_report_processor.copy_local_file_to_s3_bucket") as mock_copy:
+                with patch.object(
+                    ParquetReportProcessor, "create_parquet_table", side_effect=create_parquet_table
+                ) as mock_create_table:
+                    with patch.object(Config, "PARQUET_PROCESSING_WORKERS", 2):
+                        failed = self.report_processor.convert_csv_files_to_parquet_in_parallel(
+                            "request_id", "s3_csv_path", temp_dir, "manifest_id", conversions
+                        )
+
+        self.assertEqual(failed, ["bad_file.json"])
+        self.assertEqual(mock_copy.call_count, 3)
+        self.assertEqual(mock_create_table.call_count, 2)
+        self.assertEqual(os.listdir(temp_dir), [])
 
     @patch.object(ReportParquetProcessorBase, "get_or_create_postgres_partition")
     @patch.object(ReportParquetProcessorBase, "create_table")
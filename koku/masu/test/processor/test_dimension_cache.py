@@ -0,0 +1,82 @@
+#
+# Copyright 2021 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Test the DimensionCache object."""
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from masu.processor.dimension_cache import DimensionCache
+from masu.processor.dimension_cache import hash_key
+
+
+class DimensionCacheTest(TestCase):
+    """Test Cases for the DimensionCache object."""
+
+    def test_load_on_miss(self):
+        """Test that a missing key is loaded once and then served from the cache."""
+        loader = Mock(side_effect=lambda key: {key: 7})
+        cache = DimensionCache(loader, max_size=10)
+
+        self.assertEqual(cache[("sku", "name", "region")], 7)
+        self.assertIn(("sku", "name", "region"), cache)
+        loader.assert_called_once_with(("sku", "name", "region"))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_missing_key(self):
+        """Test that a key the loader does not find is reported missing and looked up only once."""
+        loader = Mock(side_effect=lambda key: {key: None})
+        cache = DimensionCache(loader, max_size=10)
+
+        self.assertNotIn("arn", cache)
+        self.assertIsNone(cache.get("arn"))
+        with self.assertRaises(KeyError):
+            cache["arn"]
+        loader.assert_called_once_with("arn")
+        self.assertEqual(list(cache.values()), [])
+
+        cache["arn"] = 5
+        self.assertEqual(cache["arn"], 5)
+        loader.assert_called_once_with("arn")
+
+    def test_loader_scope(self):
+        """Test that every entry returned by the loader is cached."""
+        loader = Mock(return_value={(1, "a"): 1, (1, "b"): 2})
+        cache = DimensionCache(loader, max_size=10)
+
+        self.assertEqual(cache[(1, "a")], 1)
+        self.assertEqual(cache[(1, "b")], 2)
+        loader.assert_called_once()
+
+    def test_bounded_lru(self):
+        """Test that the least recently used entries are evicted past max_size."""
+        loader = Mock(return_value={})
+        cache = DimensionCache(loader, max_size=2)
+        cache.update({"a": 1, "b": 2})
+        self.assertEqual(cache["a"], 1)
+
+        cache["c"] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(sorted(cache.values()), [1, 3])
+        self.assertNotIn("b", cache)
+        loader.assert_called_once_with("b")
+
+    def test_hash_key(self):
+        """Test that keys are stored as stable 64 bit integers."""
+        self.assertEqual(hash_key(("sku", None, "us-east-1")), hash_key(("sku", None, "us-east-1")))
+        self.assertNotEqual(hash_key(("sku", None, "us-east-1")), hash_key(("sku", "None", "us-east-1")))
+        self.assertLess(hash_key("key"), 2 ** 64)
@@ -320,6 +320,35 @@ class OrchestratorTest(MasuTestCase):
             else:
                 mock_task.assert_not_called()
 
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    @patch("masu.processor.orchestrator.get_report_files_batch")
+    @patch("masu.processor.orchestrator.get_report_files")
+    @patch("masu.processor.orchestrator.chord")
+    @patch("masu.processor.orchestrator.ReportDownloader.download_manifest")
+    def test_start_manifest_processing_batched(
+        self, mock_download_manifest, mock_chord, mock_task, mock_batch_task, mock_inspect
+    ):
+        """Test that report files are grouped into batch tasks."""
+        mock_download_manifest.return_value = {
+            "manifest_id": 1,
+            "files": [{"local_file": f"file{i}.csv", "key": f"filekey{i}"} for i in range(5)],
+        }
+        account = self.mock_accounts[0]
+        with patch("masu.processor.orchestrator.Config.REPORT_PROCESSING_FILES_PER_TASK", 2):
+            Orchestrator().start_manifest_processing(
+                account.get("customer_name"),
+                account.get("credentials"),
+                account.get("data_source"),
+                "AWS-local",
+                account.get("schema_name"),
+                account.get("provider_uuid"),
+                DateAccessor().get_billing_months(1)[0],
+            )
+        mock_task.s.assert_not_called()
+        batch_sizes = [len(call.args[-1]) for call in mock_batch_task.s.call_args_list]
+        self.assertEqual(batch_sizes, [2, 2, 1])
+        self.assertEqual(len(mock_chord.call_args.args[0]), 3)
+
     @patch("masu.processor.worker_cache.CELERY_INSPECT")
     @patch("masu.database.provider_db_accessor.ProviderDBAccessor.get_setup_complete")
     def test_get_reports(self, fake_accessor, mock_inspect):
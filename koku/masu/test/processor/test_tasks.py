@@ -55,7 +55,9 @@ from masu.processor._tasks.process import _process_report_file
 from masu.processor.expired_data_remover import ExpiredDataRemover
 from masu.processor.report_processor import ReportProcessorError
 from masu.processor.tasks import autovacuum_tune_schema
+from masu.processor.tasks import finalize_summary_tables
 from masu.processor.tasks import get_report_files
+from masu.processor.tasks import get_report_files_batch
 from masu.processor.tasks import normalize_table_options
 from masu.processor.tasks import record_all_manifest_files
 from masu.processor.tasks import record_report_status
@@ -74,7 +76,7 @@ from masu.test.external.downloader.aws import fake_arn
 from reporting.models import AWS_MATERIALIZED_VIEWS
 from reporting.models import AZURE_MATERIALIZED_VIEWS
 from reporting.models import GCP_MATERIALIZED_VIEWS
-from reporting.models import OCP_MATERIALIZED_VIEWS
+from reporting.models import OCP_SUMMARY_TABLES
 from reporting_common.models import CostUsageReportStatus
 
 # from koku.api.utils import DateHelper
@@ -401,6 +403,22 @@ class ProcessReportFileTests(MasuTestCase):
         summarize_reports(reports_to_summarize)
         mock_update_summary.delay.assert_called()
 
+    @patch("masu.processor.tasks.update_summary_tables")
+    def test_summarize_reports_processing_batches(self, mock_update_summary):
+        """Test that the report lists returned by batched processing tasks are summarized."""
+        mock_update_summary.delay = Mock()
+
+        report_meta = {
+            "schema_name": self.schema,
+            "provider_type": Provider.PROVIDER_OCP,
+            "provider_uuid": self.ocp_test_provider_uuid,
+            "manifest_id": 1,
+        }
+        with patch("masu.processor.tasks.ReportManifestDBAccessor") as mock_manifest_accessor:
+            mock_manifest_accessor.return_value.__enter__.return_value.manifest_ready_for_summary.return_value = True
+            summarize_reports([[report_meta, None], [dict(report_meta)], None])
+        mock_update_summary.delay.assert_called_once()
+
     @patch("masu.processor.tasks.update_summary_tables")
     def test_summarize_reports_processing_list_only_none(self, mock_update_summary):
         """Test that the summarize_reports task is called when a processing list with None provided."""
@@ -479,6 +497,35 @@ class TestProcessorTasks(MasuTestCase):
         get_report_files(**self.get_report_args)
         mock_cache_remove.assert_called()
 
+    @patch("masu.processor.tasks.ReportDownloader")
+    @patch("masu.processor.worker_cache.CELERY_INSPECT")
+    @patch("masu.processor.tasks._get_report_files")
+    @patch("masu.processor.tasks._process_report_file")
+    def test_get_report_files_batch(self, mock_process_file, mock_get_files, mock_inspect, mock_downloader):
+        """Test that the files of a batch share the downloader and the lookup cache."""
+        mock_get_files.side_effect = [
+            {"file": "koku-1.csv.gz", "compression": "GZIP", "manifest_id": 1},
+            {},
+            {"file": "koku-3.csv.gz", "compression": "GZIP", "manifest_id": 1},
+        ]
+        args = dict(self.get_report_args)
+        args["report_contexts"] = [
+            {"current_file": f"/my/{self.test_assembly_id}/koku-{i}.csv.gz"} for i in range(1, 4)
+        ]
+        del args["report_context"]
+
+        reports = get_report_files_batch(**args)
+
+        self.assertEqual(len(reports), 3)
+        self.assertIsNone(reports[1])
+        self.assertEqual(reports[0]["manifest_id"], 1)
+        mock_downloader.assert_called_once()
+        for call in mock_get_files.call_args_list:
+            self.assertIs(call.kwargs["downloader"], mock_downloader.return_value)
+        self.assertEqual(mock_process_file.call_count, 2)
+        lookup_caches = [call.kwargs["lookup_cache"] for call in mock_process_file.call_args_list]
+        self.assertIs(lookup_caches[0], lookup_caches[1])
+
 
 class TestRemoveExpiredDataTasks(MasuTestCase):
     """Test cases for Processor Celery tasks."""
@@ -758,11 +805,69 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
         mock_chain.assert_called_once_with(
             update_cost_model_costs.s(self.schema, provider_aws_uuid, expected_start_date, expected_end_date)
             | refresh_materialized_views.si(
-                self.schema, provider, provider_uuid=provider_aws_uuid, manifest_id=manifest_id
+                self.schema,
+                provider,
+                provider_uuid=provider_aws_uuid,
+                manifest_id=manifest_id,
+                start_date=expected_start_date,
+                end_date=expected_end_date,
             )
             | remove_expired_data.si(self.schema, provider, False, provider_aws_uuid, True)
         )
 
+    @patch("masu.processor.tasks.chord")
+    @patch("masu.processor.tasks.ReportSummaryUpdater")
+    def test_update_summary_tables_fan_out(self, mock_updater, mock_chord):
+        """Test that the date chunks are dealt to a bounded number of task chains followed by a finalize."""
+        provider = Provider.PROVIDER_AWS
+        provider_aws_uuid = self.aws_provider_uuid
+        start_date = "2021-01-01"
+        end_date = "2021-01-20"
+        manifest_id = 1
+        chunks = [
+            (date(2021, 1, 1), date(2021, 1, 5)),
+            (date(2021, 1, 6), date(2021, 1, 10)),
+            (date(2021, 1, 11), date(2021, 1, 15)),
+            (date(2021, 1, 16), date(2021, 1, 20)),
+        ]
+        mock_updater.return_value.can_fan_out = True
+        mock_updater.return_value.get_date_chunks.return_value = (start_date, end_date, chunks)
+
+        with patch("masu.processor.tasks.Config.SUMMARY_FAN_OUT", True):
+            with patch("masu.processor.tasks.Config.SUMMARY_FAN_OUT_CONCURRENCY", 2):
+                update_summary_tables(self.schema, provider, provider_aws_uuid, start_date, end_date, manifest_id)
+
+        mock_updater.return_value.update_daily_tables.assert_not_called()
+        mock_updater.return_value.update_summary_tables.assert_not_called()
+        lanes = mock_chord.call_args[0][0].tasks
+        self.assertEqual(len(lanes), 2)
+        lane_dates = [[(task.args[3], task.args[4]) for task in lane.tasks] for lane in lanes]
+        self.assertEqual(
+            lane_dates,
+            [
+                [("2021-01-01", "2021-01-05"), ("2021-01-11", "2021-01-15")],
+                [("2021-01-06", "2021-01-10"), ("2021-01-16", "2021-01-20")],
+            ],
+        )
+        mock_chord.return_value.assert_called_once_with(
+            finalize_summary_tables.si(
+                self.schema, provider, provider_aws_uuid, start_date, end_date, manifest_id=manifest_id
+            )
+        )
+
+    @patch("masu.processor.tasks.link_post_summary_tasks")
+    @patch("masu.processor.tasks.ReportSummaryUpdater")
+    def test_finalize_summary_tables(self, mock_updater, mock_link):
+        """Test that the finalize task completes the summary and queues the follow up tasks."""
+        provider = Provider.PROVIDER_AWS
+        start_date = "2021-01-01"
+        end_date = "2021-01-15"
+
+        finalize_summary_tables(self.schema, provider, self.aws_provider_uuid, start_date, end_date, manifest_id=1)
+
+        mock_updater.return_value.finalize_summary_tables.assert_called_with(start_date, end_date)
+        mock_link.assert_called_with(self.schema, provider, self.aws_provider_uuid, start_date, end_date, 1)
+
     @patch("masu.processor.tasks.update_summary_tables")
     def test_get_report_data_for_all_providers(self, mock_update):
         """Test GET report_data endpoint with provider_uuid=*."""
@@ -851,7 +956,7 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
             self.schema, Provider.PROVIDER_OCP, provider_uuid=self.ocp_provider_uuid, manifest_id=manifest.id
         )
 
-        views_to_check = [view for view in OCP_MATERIALIZED_VIEWS if "Cost" in view._meta.db_table]
+        views_to_check = [view for view in OCP_SUMMARY_TABLES if "Cost" in view._meta.db_table]
 
         with schema_context(self.schema):
             for view in views_to_check:
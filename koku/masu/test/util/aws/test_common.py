@@ -31,6 +31,7 @@ from api.provider.models import Provider
 from masu.config import Config
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
+from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.external import AWS_REGIONS
 from masu.external.date_accessor import DateAccessor
 from masu.test import MasuTestCase
@@ -354,6 +355,31 @@ class TestAWSUtils(MasuTestCase):
                 removed = utils.remove_files_not_in_set_from_s3_bucket("request_id", s3_csv_path, "manifest_id")
                 self.assertEqual(removed, [])
 
+    def test_s3_object_manifest_index(self):
+        """Test that uploaded objects are matched to their manifest without requesting their metadata."""
+        s3_path = "account/aws/csv/index"
+        with patch("masu.util.aws.common.settings", ENABLE_S3_ARCHIVING=True):
+            with patch("masu.util.aws.common.get_s3_resource") as mock_s3:
+                utils.copy_data_to_s3_bucket("request_id", s3_path, "old.csv", "data", 1)
+                utils.copy_data_to_s3_bucket("request_id", s3_path, "new.csv", "data", 2)
+                old_summary = Mock(key=f"{s3_path}/old.csv")
+                new_summary = Mock(key=f"{s3_path}/new.csv")
+                legacy_summary = Mock()
+                legacy_summary.Object.return_value = Mock(metadata={"manifestid": "2"}, key=f"{s3_path}/legacy.csv")
+                mock_s3.return_value.Bucket.return_value.objects.filter.return_value = [
+                    old_summary,
+                    new_summary,
+                    legacy_summary,
+                ]
+                removed = utils.remove_files_not_in_set_from_s3_bucket("request_id", s3_path, 2)
+
+        self.assertEqual(removed, [f"{s3_path}/old.csv"])
+        old_summary.Object.assert_not_called()
+        new_summary.Object.assert_not_called()
+        legacy_summary.Object.assert_called_once()
+        with ReportManifestDBAccessor() as manifest_accessor:
+            self.assertEqual(manifest_accessor.get_report_object_manifests(s3_path), {f"{s3_path}/new.csv": "2"})
+
     def test_copy_data_to_s3_bucket(self):
         """Test copy_data_to_s3_bucket."""
         upload = utils.copy_data_to_s3_bucket("request_id", "path", "filename", "data", "manifest_id")
@@ -370,6 +396,29 @@ class TestAWSUtils(MasuTestCase):
                 upload = utils.copy_data_to_s3_bucket("request_id", "path", "filename", "data", "manifest_id")
                 self.assertEqual(upload, None)
 
+    def test_copy_local_file_to_s3_bucket(self):
+        """Test copy_local_file_to_s3_bucket."""
+        upload = utils.copy_local_file_to_s3_bucket("request_id", "path", "filename", "/tmp/file", "manifest_id")
+        self.assertEqual(upload, None)
+
+        with patch("masu.util.aws.common.settings", ENABLE_S3_ARCHIVING=True):
+            with patch("masu.util.aws.common.get_s3_resource") as mock_s3:
+                upload = utils.copy_local_file_to_s3_bucket(
+                    "request_id", "path", "filename", "/tmp/file", "manifest_id"
+                )
+                self.assertIsNotNone(upload)
+                upload.upload_file.assert_called_with(
+                    "/tmp/file", ExtraArgs={"Metadata": {"ManifestId": "manifest_id"}}
+                )
+
+        with patch("masu.util.aws.common.settings", ENABLE_S3_ARCHIVING=True):
+            with patch("masu.util.aws.common.get_s3_resource") as mock_s3:
+                mock_s3.side_effect = ClientError({}, "Error")
+                upload = utils.copy_local_file_to_s3_bucket(
+                    "request_id", "path", "filename", "/tmp/file", "manifest_id"
+                )
+                self.assertEqual(upload, None)
+
 
 class AwsArnTest(TestCase):
     """AwnArn class test case."""
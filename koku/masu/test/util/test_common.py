@@ -201,6 +201,21 @@ class CommonUtilTests(MasuTestCase):
         with self.assertRaises(StopIteration):
             next(date_generator)
 
+    def test_date_range_pair_by_rows(self):
+        """Test that the intervals are sized by the rows of each day."""
+        start_date = date(2020, 1, 1)
+        end_date = date(2020, 1, 6)
+        day_counts = {date(2020, 1, 1): 10, date(2020, 1, 2): 10, date(2020, 1, 3): 50, date(2020, 1, 5): 5}
+
+        intervals = list(common_utils.date_range_pair_by_rows(start_date, end_date, day_counts, 25))
+
+        expected = [
+            (date(2020, 1, 1), date(2020, 1, 2)),
+            (date(2020, 1, 3), date(2020, 1, 3)),
+            (date(2020, 1, 4), date(2020, 1, 6)),
+        ]
+        self.assertEqual(intervals, expected)
+
     def test_safe_float(self):
         """Test the safe_float method handles good and bad inputs."""
         out = common_utils.safe_float("foo")
@@ -22,6 +22,7 @@ import re
 from io import BytesIO
 
 import boto3
+from boto3.exceptions import S3UploadFailedError
 from botocore.exceptions import ClientError
 from botocore.exceptions import EndpointConnectionError
 from dateutil.relativedelta import relativedelta
@@ -32,6 +33,7 @@ from api.common import log_json
 from api.models import Provider
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
+from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.util import common as utils
 
 LOG = logging.getLogger(__name__)
@@ -285,6 +287,34 @@ def get_s3_resource():  # pragma: no cover
     return s3_resource
 
 
+def record_s3_object_manifest(key, manifest_id):
+    """
+    Records the manifest of an uploaded object in the report object index
+    """
+    with ReportManifestDBAccessor() as manifest_accessor:
+        manifest_accessor.set_report_object_manifest(key, manifest_id or None)
+
+
+def get_s3_object_manifests(s3_resource, s3_path):
+    """
+    Returns the manifest id of every object in a given prefix.
+
+    The manifest ids recorded on upload are read with one query, only objects
+    missing from the report object index have their metadata requested.
+    """
+    with ReportManifestDBAccessor() as manifest_accessor:
+        indexed_manifests = manifest_accessor.get_report_object_manifests(s3_path)
+
+    manifests = {}
+    for obj_summary in s3_resource.Bucket(settings.S3_BUCKET_NAME).objects.filter(Prefix=s3_path):
+        if obj_summary.key in indexed_manifests:
+            manifests[obj_summary.key] = indexed_manifests[obj_summary.key]
+        else:
+            existing_object = obj_summary.Object()
+            manifests[existing_object.key] = existing_object.metadata.get("manifestid")
+    return manifests
+
+
 def copy_data_to_s3_bucket(request_id, path, filename, data, manifest_id=None, context={}):
     """
     Copies data to s3 bucket file
@@ -302,12 +332,37 @@ def copy_data_to_s3_bucket(request_id, path, filename, data, manifest_id=None, c
         if manifest_id:
             put_value["Metadata"] = {"ManifestId": str(manifest_id)}
         upload.put(**put_value)
+        record_s3_object_manifest(upload_key, manifest_id)
     except (EndpointConnectionError, ClientError) as err:
         msg = f"Unable to copy data to {upload_key} in bucket {settings.S3_BUCKET_NAME}.  Reason: {str(err)}"
         LOG.info(log_json(request_id, msg, context))
     return upload
 
 
+def copy_local_file_to_s3_bucket(request_id, path, filename, local_file, manifest_id=None, context={}):
+    """
+    Copies a local file to s3 bucket file using a managed multipart upload
+    """
+    if not (settings.ENABLE_S3_ARCHIVING or settings.ENABLE_PARQUET_PROCESSING):
+        return None
+
+    upload = None
+    upload_key = f"{path}/{filename}"
+    try:
+        s3_resource = get_s3_resource()
+        s3_obj = {"bucket_name": settings.S3_BUCKET_NAME, "key": upload_key}
+        upload = s3_resource.Object(**s3_obj)
+        extra_args = {}
+        if manifest_id:
+            extra_args["Metadata"] = {"ManifestId": str(manifest_id)}
+        upload.upload_file(local_file, ExtraArgs=extra_args)
+        record_s3_object_manifest(upload_key, manifest_id)
+    except (EndpointConnectionError, ClientError, S3UploadFailedError) as err:
+        msg = f"Unable to copy {local_file} to {upload_key} in bucket {settings.S3_BUCKET_NAME}.  Reason: {str(err)}"
+        LOG.info(log_json(request_id, msg, context))
+    return upload
+
+
 def copy_local_report_file_to_s3_bucket(
     request_id, s3_path, full_file_path, local_filename, manifest_id, start_date, context={}
 ):
@@ -332,17 +387,14 @@ def remove_files_not_in_set_from_s3_bucket(request_id, s3_path, manifest_id, con
     if s3_path:
         try:
             s3_resource = get_s3_resource()
-            existing_objects = s3_resource.Bucket(settings.S3_BUCKET_NAME).objects.filter(Prefix=s3_path)
-            for obj_summary in existing_objects:
-                existing_object = obj_summary.Object()
-                metadata = existing_object.metadata
-                manifest = metadata.get("manifestid")
-                manifest_id_str = str(manifest_id)
-                key = existing_object.key
+            manifest_id_str = str(manifest_id)
+            for key, manifest in get_s3_object_manifests(s3_resource, s3_path).items():
                 if manifest != manifest_id_str:
                     s3_resource.Object(settings.S3_BUCKET_NAME, key).delete()
                     removed.append(key)
             if removed:
+                with ReportManifestDBAccessor() as manifest_accessor:
+                    manifest_accessor.delete_report_objects(removed)
                 msg = f"Removed files from s3 bucket {settings.S3_BUCKET_NAME}: {','.join(removed)}."
                 LOG.info(log_json(request_id, msg, context))
         except (EndpointConnectionError, ClientError) as err:
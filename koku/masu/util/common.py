@@ -318,6 +318,43 @@ def date_range_pair(start_date, end_date, step=5):
         yield start_date.date(), end_date.date()
 
 
+def date_range_pair_by_rows(start_date, end_date, day_counts, max_rows):
+    """Create a range generator for dates sized by the rows of each day.
+
+    Consecutive days are put in the same interval until the interval holds max_rows
+    rows, so days with many rows are summarized in short intervals and days with few
+    rows in long ones. An interval holds at least one day.
+
+    Args:
+        start_date (str, datetime.date) The first date.
+        end_date (str, datetime.date) The last date.
+        day_counts (dict) The number of rows of each datetime.date, missing days have none.
+        max_rows (int) The number of rows to put in an interval.
+
+    """
+    if isinstance(start_date, str):
+        start_date = parser.parse(start_date)
+    if isinstance(start_date, datetime.datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, str):
+        end_date = parser.parse(end_date)
+    if isinstance(end_date, datetime.datetime):
+        end_date = end_date.date()
+
+    interval_start = start_date
+    interval_rows = 0
+    day = start_date
+    while day <= end_date:
+        day_rows = day_counts.get(day, 0)
+        if interval_rows and interval_rows + day_rows > max_rows:
+            yield interval_start, day - timedelta(days=1)
+            interval_start = day
+            interval_rows = 0
+        interval_rows += day_rows
+        day += timedelta(days=1)
+    yield interval_start, end_date
+
+
 def get_path_prefix(account, provider_type, provider_uuid, start_date, data_type, report_type=None):
     """Get the S3 bucket prefix"""
     path = None
@@ -137,19 +137,34 @@ def get_report_details(report_directory):
     payload_dict = {}
     try:
         with open(manifest_path) as file:
-            payload_dict = json.load(file)
-            payload_dict["date"] = parser.parse(payload_dict["date"])
-            payload_dict["manifest_path"] = manifest_path
-            # parse start and end dates if in manifest
-            for field in ["start", "end"]:
-                if payload_dict.get(field):
-                    payload_dict[field] = parser.parse(payload_dict[field])
+            payload_dict = parse_manifest(json.load(file), manifest_path)
     except (OSError, IOError, KeyError) as exc:
         LOG.error("Unable to extract manifest data: %s", exc)
 
     return payload_dict
 
 
+def parse_manifest(payload_dict, manifest_path):
+    """
+    Parse the dates of an OCP usage report manifest.
+
+    Args:
+        payload_dict (Dict): manifest.json contents
+        manifest_path (String): path of the manifest file
+
+    Returns:
+        (Dict): the manifest with its date, start and end parsed and its manifest_path
+
+    """
+    payload_dict["date"] = parser.parse(payload_dict["date"])
+    payload_dict["manifest_path"] = manifest_path
+    # parse start and end dates if in manifest
+    for field in ["start", "end"]:
+        if payload_dict.get(field):
+            payload_dict[field] = parser.parse(payload_dict[field])
+    return payload_dict
+
+
 def month_date_range(for_date_time):
     """
     Get a formatted date range string for the given date.
@@ -0,0 +1,112 @@
+# Generated by Django 3.1.5 on 2021-02-01 14:21
+from django.db import connection
+from django.db import migrations
+
+COST_COLUMNS = (
+    ("supplementary_usage_cost", "jsonb"),
+    ("infrastructure_usage_cost", "jsonb"),
+    ("infrastructure_raw_cost", "numeric"),
+    ("infrastructure_markup_cost", "numeric"),
+)
+
+POD_COLUMNS = COST_COLUMNS + (
+    ("data_source", "varchar(64)"),
+    ("resource_ids", "text[]"),
+    ("resource_count", "integer"),
+    ("pod_usage_cpu_core_hours", "numeric"),
+    ("pod_request_cpu_core_hours", "numeric"),
+    ("pod_limit_cpu_core_hours", "numeric"),
+    ("cluster_capacity_cpu_core_hours", "numeric"),
+    ("pod_usage_memory_gigabyte_hours", "numeric"),
+    ("pod_request_memory_gigabyte_hours", "numeric"),
+    ("pod_limit_memory_gigabyte_hours", "numeric"),
+    ("cluster_capacity_memory_gigabyte_hours", "numeric"),
+)
+
+VOLUME_COLUMNS = COST_COLUMNS + (
+    ("data_source", "varchar(64)"),
+    ("resource_ids", "text[]"),
+    ("resource_count", "integer"),
+    ("persistentvolumeclaim_usage_gigabyte_months", "numeric"),
+    ("volume_request_storage_gigabyte_months", "numeric"),
+    ("persistentvolumeclaim_capacity_gigabyte_months", "numeric"),
+)
+
+MONTHLY_COST_COLUMNS = (("supplementary_monthly_cost", "numeric"), ("infrastructure_monthly_cost", "numeric"))
+
+# table name: (unique index name, group by columns, value columns)
+SUMMARY_TABLES = {
+    "reporting_ocp_cost_summary": ("ocp_cost_summary", (), COST_COLUMNS + MONTHLY_COST_COLUMNS),
+    "reporting_ocp_cost_summary_by_node": (
+        "ocp_cost_summary_by_node",
+        (("node", "varchar(253)"),),
+        COST_COLUMNS
+        + MONTHLY_COST_COLUMNS
+        + (("infrastructure_project_markup_cost", "numeric"), ("infrastructure_project_raw_cost", "numeric")),
+    ),
+    "reporting_ocp_cost_summary_by_project": (
+        "ocp_cost_summary_by_project",
+        (("namespace", "varchar(253)"),),
+        (
+            ("supplementary_usage_cost", "jsonb"),
+            ("infrastructure_usage_cost", "jsonb"),
+            ("infrastructure_project_raw_cost", "numeric"),
+            ("infrastructure_project_markup_cost", "numeric"),
+        )
+        + MONTHLY_COST_COLUMNS,
+    ),
+    "reporting_ocp_pod_summary": ("ocp_pod_summary", (), POD_COLUMNS),
+    "reporting_ocp_pod_summary_by_project": (
+        "ocp_pod_summary_by_project",
+        (("namespace", "varchar(253)"),),
+        POD_COLUMNS,
+    ),
+    "reporting_ocp_volume_summary": ("ocp_volume_summary", (), VOLUME_COLUMNS),
+    "reporting_ocp_volume_summary_by_project": (
+        "ocp_volume_summary_by_project",
+        (("namespace", "varchar(253)"),),
+        VOLUME_COLUMNS,
+    ),
+}
+
+
+def convert_views_to_tables(apps, schema_editor):
+    """Replace the OCP summary materialized views with tables holding the same rows."""
+    for table, (index, group_columns, value_columns) in SUMMARY_TABLES.items():
+        columns = (
+            (("usage_start", "date"), ("usage_end", "date"), ("cluster_id", "text"), ("cluster_alias", "text"))
+            + group_columns
+            + value_columns
+            + (("source_uuid", "uuid"),)
+        )
+        column_names = ", ".join(name for name, _ in columns)
+        index_columns = ", ".join(
+            ["usage_start", "cluster_id", "cluster_alias"] + [name for name, _ in group_columns] + ["source_uuid"]
+        )
+        sql = f"""
+            ALTER MATERIALIZED VIEW IF EXISTS {table} RENAME TO {table}_view;
+            DROP INDEX IF EXISTS {index};
+
+            CREATE TABLE {table} (
+                id serial PRIMARY KEY,
+                {", ".join(f"{name} {data_type}" for name, data_type in columns)}
+            );
+
+            INSERT INTO {table} ({column_names})
+            SELECT {", ".join(f"{name}::{data_type}" for name, data_type in columns)}
+            FROM {table}_view;
+
+            DROP MATERIALIZED VIEW IF EXISTS {table}_view;
+
+            CREATE UNIQUE INDEX {index} ON {table} ({index_columns});
+            CREATE INDEX {index}_source ON {table} (source_uuid, usage_start);
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("reporting", "0165_repartition_default_data")]
+
+    operations = [migrations.RunPython(code=convert_views_to_tables)]
@@ -0,0 +1,51 @@
+# Generated by Django 3.1.5 on 2021-02-08 15:02
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("reporting", "0166_ocp_summary_tables")]
+
+    operations = [
+        migrations.CreateModel(
+            name="AWSOrganizationalUnitClosure",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("ancestor_org_unit_id", models.CharField(max_length=50)),
+                ("ancestor_path", models.TextField()),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "organizational_unit",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestors",
+                        to="reporting.awsorganizationalunit",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "reporting_awsorganizationalunitclosure",
+                "unique_together": {("organizational_unit", "ancestor_path")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="awsorganizationalunitclosure",
+            index=models.Index(fields=["ancestor_path"], name="aws_ou_closure_path_idx"),
+        ),
+        migrations.RunSQL(
+            """
+INSERT INTO reporting_awsorganizationalunitclosure (organizational_unit_id, ancestor_org_unit_id, ancestor_path, depth)
+SELECT ou.id,
+       nodes.path[i],
+       array_to_string(nodes.path[1:i], '&'),
+       array_length(nodes.path, 1) - i
+  FROM reporting_awsorganizationalunit AS ou
+ CROSS JOIN LATERAL (SELECT string_to_array(ou.org_unit_path, '&') AS path) AS nodes
+ CROSS JOIN LATERAL generate_subscripts(nodes.path, 1) AS i
+    ON CONFLICT DO NOTHING
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -48,6 +48,7 @@ from reporting.provider.aws.models import AWSDatabaseSummary
 from reporting.provider.aws.models import AWSEnabledTagKeys
 from reporting.provider.aws.models import AWSNetworkSummary
 from reporting.provider.aws.models import AWSOrganizationalUnit
+from reporting.provider.aws.models import AWSOrganizationalUnitClosure
 from reporting.provider.aws.models import AWSStorageSummary
 from reporting.provider.aws.models import AWSStorageSummaryByAccount
 from reporting.provider.aws.models import AWSStorageSummaryByRegion
@@ -154,7 +155,8 @@ AZURE_MATERIALIZED_VIEWS = (
     AzureDatabaseSummary,
 )
 
-OCP_MATERIALIZED_VIEWS = (
+# Summary tables maintained per source and date range instead of refreshed as views
+OCP_SUMMARY_TABLES = (
     OCPPodSummary,
     OCPPodSummaryByProject,
     OCPVolumeSummary,
@@ -164,6 +166,8 @@ OCP_MATERIALIZED_VIEWS = (
     OCPCostSummaryByNode,
 )
 
+OCP_ON_INFRASTRUCTURE_SUMMARY_TABLES = (OCPCostSummary, OCPCostSummaryByProject, OCPCostSummaryByNode)
+
 OCP_ON_AWS_MATERIALIZED_VIEWS = (
     OCPAWSCostSummary,
     OCPAWSCostSummaryByAccount,
@@ -197,9 +201,6 @@ OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS = (
     OCPAllNetworkSummary,
     OCPAllStorageSummary,
     OCPAllCostLineItemProjectDailySummary,
-    OCPCostSummary,
-    OCPCostSummaryByProject,
-    OCPCostSummaryByNode,
 )
 
 GCP_MATERIALIZED_VIEWS = (
@@ -916,6 +916,15 @@ class AWSOrganizationalUnit(models.Model):
 
     provider = models.ForeignKey("api.Provider", on_delete=models.CASCADE, null=True)
 
+    def save(self, *args, **kwargs):
+        """Save the node and, when it is new, the ancestors of its path to the closure table."""
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            AWSOrganizationalUnitClosure.objects.bulk_create(
+                AWSOrganizationalUnitClosure.from_org_unit(self), ignore_conflicts=True
+            )
+
     def __str__(self):
         """Convert to string."""
         return (
@@ -940,6 +949,45 @@ class AWSOrganizationalUnit(models.Model):
         )
 
 
+class AWSOrganizationalUnitClosure(models.Model):
+    """The ancestors of each AWS Organizational Unit tree node, the node itself included.
+
+    Summary rows reference the tree node of their account, so joining them to this
+    table attributes each row to every org unit above it in a single query.
+    """
+
+    class Meta:
+        """Meta for AWSOrganizationalUnitClosure."""
+
+        db_table = "reporting_awsorganizationalunitclosure"
+        unique_together = ("organizational_unit", "ancestor_path")
+        indexes = [models.Index(fields=["ancestor_path"], name="aws_ou_closure_path_idx")]
+
+    organizational_unit = models.ForeignKey(
+        "AWSOrganizationalUnit", on_delete=models.CASCADE, related_name="ancestors"
+    )
+
+    ancestor_org_unit_id = models.CharField(max_length=50, null=False)
+
+    ancestor_path = models.TextField(null=False)
+
+    depth = models.PositiveSmallIntegerField(null=False)
+
+    @classmethod
+    def from_org_unit(cls, org_unit):
+        """Return the unsaved closure rows of a tree node, one per org unit of its path."""
+        path = org_unit.org_unit_path.split("&")
+        return [
+            cls(
+                organizational_unit=org_unit,
+                ancestor_org_unit_id=ancestor_id,
+                ancestor_path="&".join(path[: index + 1]),
+                depth=len(path) - index - 1,
+            )
+            for index, ancestor_id in enumerate(path)
+        ]
+
+
 class AWSEnabledTagKeys(models.Model):
     """A collection of the current enabled tag keys."""
 
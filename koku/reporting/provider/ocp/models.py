@@ -555,7 +555,7 @@ class OCPEnabledTagKeys(models.Model):
 
 
 class OCPCostSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -593,7 +593,7 @@ class OCPCostSummary(models.Model):
 
 
 class OCPCostSummaryByProject(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -634,7 +634,7 @@ class OCPCostSummaryByProject(models.Model):
 
 
 class OCPCostSummaryByNode(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -674,7 +674,7 @@ class OCPCostSummaryByNode(models.Model):
 
 
 class OCPPodSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -730,7 +730,7 @@ class OCPPodSummary(models.Model):
 
 
 class OCPPodSummaryByProject(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -788,7 +788,7 @@ class OCPPodSummaryByProject(models.Model):
 
 
 class OCPVolumeSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -834,7 +834,7 @@ class OCPVolumeSummary(models.Model):
 
 
 class OCPVolumeSummaryByProject(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -0,0 +1,23 @@
+# Generated by Django 3.1.5 on 2021-02-09 10:17
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("reporting_common", "0026_costusagereportmanifest_manifest_modified_datetime")]
+
+    operations = [
+        migrations.CreateModel(
+            name="CostUsageReportObject",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("key", models.TextField(unique=True)),
+                ("manifest_id", models.CharField(max_length=64)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="costusagereportobject",
+            index=models.Index(fields=["key"], name="report_object_key_like_idx", opclasses=["text_pattern_ops"]),
+        ),
+    ]
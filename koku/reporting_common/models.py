@@ -54,6 +54,22 @@ class CostUsageReportStatus(models.Model):
     etag = models.CharField(max_length=64, null=True)
 
 
+class CostUsageReportObject(models.Model):
+    """The manifest of a report object uploaded to S3.
+
+    Listing a prefix does not return object metadata, so the manifest of each object
+    is recorded on upload instead of being read back with a request per object.
+    """
+
+    class Meta:
+        """Meta for CostUsageReportObject."""
+
+        indexes = [models.Index(fields=["key"], name="report_object_key_like_idx", opclasses=["text_pattern_ops"])]
+
+    key = models.TextField(unique=True)
+    manifest_id = models.CharField(max_length=64)
+
+
 class RegionMapping(models.Model):
     """Mapping table of AWS region names.
 
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark AWS processor product lookups, full dictionary versus bounded dimension cache.
+
+AWSReportProcessor used to load every product of the schema into a dictionary
+keyed by (sku, product name, region) before processing a file. It now uses a
+DimensionCache that stores 64 bit key hashes, keeps at most a bounded number of
+entries and loads ids on miss. This builds a synthetic product catalog, then for
+each implementation, in a fresh process, prepares the lookups and resolves the
+products referenced by one report file. It prints the startup time, the lookup
+time and the peak RSS of each.
+
+No database is needed; misses are resolved from the synthetic catalog, so the
+lookup time of the cache excludes the per miss query it makes in production:
+
+    ./scripts/benchmark_aws_dimension_cache.py [catalog_size] [products_per_file] [cache_size]
+"""
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "koku"))
+
+from masu.processor.dimension_cache import DimensionCache  # noqa: E402
+
+REGIONS = ("us-east-1", "us-east-2", "us-west-1", "us-west-2", "eu-west-1", "eu-central-1", "ap-southeast-1")
+PRODUCT_NAMES = (
+    "Amazon Elastic Compute Cloud",
+    "Amazon Simple Storage Service",
+    "Amazon Relational Database Service",
+    "AWS Data Transfer",
+    "Amazon CloudFront",
+)
+
+
+def product_key(index):
+    """Return the natural key of synthetic product number index."""
+    return (f"{index:016X}SKU", PRODUCT_NAMES[index % len(PRODUCT_NAMES)], REGIONS[index % len(REGIONS)])
+
+
+def catalog_rows(catalog_size):
+    """Yield product rows the way get_products reads them from the database."""
+    for index in range(catalog_size):
+        sku, product_name, region = product_key(index)
+        yield {"id": index + 1, "sku": sku, "product_name": product_name, "region": region}
+
+
+def full_dictionary(catalog_size, cache_size):
+    """Load every product of the catalog, as get_products did."""
+    return {
+        (row["sku"], row["product_name"], row["region"]): row["id"] for row in catalog_rows(catalog_size)
+    }
+
+
+def dimension_cache(catalog_size, cache_size):
+    """Create an empty bounded cache resolving misses from the catalog."""
+
+    def load(key):
+        # The synthetic sku encodes the product's position in the catalog
+        return {key: int(key[0][:16], 16) + 1}
+
+    return DimensionCache(load, cache_size, "product")
+
+
+def run(name, catalog_size, file_keys, cache_size, results):
+    """Prepare the lookups and resolve a file's products, reporting time and peak RSS."""
+    start = time.perf_counter()
+    lookups = IMPLEMENTATIONS[name](catalog_size, cache_size)
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in file_keys:
+        if key in lookups:
+            lookups[key]
+    lookup = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    results.put((name, startup, lookup, peak_rss))
+
+
+IMPLEMENTATIONS = {"full dictionary": full_dictionary, "dimension cache": dimension_cache}
+
+
+def main(catalog_size, products_per_file, cache_size):
+    """Run every implementation in a fresh process and print the results."""
+    rng = random.Random(42)
+    file_keys = [product_key(rng.randrange(catalog_size)) for _ in range(products_per_file)]
+    # Line items repeat their product, so each product of the file is looked up several times
+    file_keys = file_keys * 5
+    rng.shuffle(file_keys)
+
+    print(f"{catalog_size} products in the catalog, {products_per_file} per file, cache size {cache_size}")
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    for name in IMPLEMENTATIONS:
+        process = context.Process(target=run, args=(name, catalog_size, file_keys, cache_size, results))
+        process.start()
+        process.join()
+        name, startup, lookup, peak_rss = results.get()
+        print(f"{name:>16}: startup {startup:.2f}s, lookups {lookup:.2f}s, peak RSS {peak_rss:.0f} MiB")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:4]]
+    defaults = [2000000, 20000, 250000]
+    main(*(args + defaults[len(args) :]))  # noqa: E203
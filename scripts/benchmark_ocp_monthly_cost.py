@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark OCP monthly node cost population, per node ORM loop versus set based SQL.
+
+Runs the per node `filter().first()` + `save()` loop that
+OCPReportDBAccessor used for node and node tag rate monthly costs, then the
+set based statements it uses now, and prints the database round trips and
+wall time of each. Both runs write the same rows, so each one starts by
+removing the monthly node rows for the month.
+
+Must be run from the koku directory with the Django environment configured
+(DATABASE_*, DJANGO_SETTINGS_MODULE=koku.settings) against a tenant schema
+holding summarized OCP data for the cluster:
+
+    ./scripts/benchmark_ocp_monthly_cost.py <schema> <cluster_id> <cluster_alias> [YYYY-MM-DD]
+
+Tag rates are built from up to 20 key:value pairs found on the cluster's pod labels.
+"""
+import sys
+import time
+import uuid
+
+import django
+from dateutil.parser import parse
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.db.models import DecimalField  # noqa: E402
+from django.db.models import Value  # noqa: E402
+from django.db.models.functions import Coalesce  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from tenant_schemas.utils import schema_context  # noqa: E402
+
+from api.utils import DateHelper  # noqa: E402
+from masu.database.ocp_report_db_accessor import OCPReportDBAccessor  # noqa: E402
+from masu.util.common import month_date_range_tuple  # noqa: E402
+from reporting.provider.ocp.models import OCPUsageLineItemDailySummary  # noqa: E402
+
+NODE_RATE = 1000
+INFRASTRUCTURE = "Infrastructure"
+
+
+def get_tag_rates(accessor, start_date, end_date, cluster_id):
+    """Return a {tag_key: {tag_value: rate}} dictionary from the cluster's pod labels."""
+    rates = {}
+    with schema_context(accessor.schema):
+        labels = (
+            OCPUsageLineItemDailySummary.objects.filter(
+                cluster_id=cluster_id, usage_start__gte=start_date, usage_start__lt=end_date, pod_labels__isnull=False
+            )
+            .values_list("pod_labels", flat=True)
+            .distinct()[:1000]
+        )
+        for label in labels:
+            for key, value in label.items():
+                if sum(len(values) for values in rates.values()) < 20:
+                    rates.setdefault(key, {})[value] = 10
+    return rates
+
+
+def legacy_node_cost(accessor, start_date, end_date, cluster_id, cluster_alias, rate_dict):
+    """Populate node flat and tag rate monthly costs the way it was done before set based SQL."""
+    unique_nodes = accessor.get_distinct_nodes(start_date, end_date, cluster_id)
+    report_period = accessor.get_usage_period_by_dates_and_cluster(start_date, end_date, cluster_id)
+    monthly_filter = {
+        "usage_start": start_date,
+        "usage_end": start_date,
+        "report_period": report_period,
+        "cluster_id": cluster_id,
+        "cluster_alias": cluster_alias,
+        "monthly_cost_type": "Node",
+    }
+    with schema_context(accessor.schema):
+        for node in unique_nodes:
+            line_item = OCPUsageLineItemDailySummary.objects.filter(node=node, **monthly_filter).first()
+            if not line_item:
+                line_item = OCPUsageLineItemDailySummary(uuid=uuid.uuid4(), node=node, **monthly_filter)
+            line_item.infrastructure_monthly_cost = NODE_RATE
+            line_item.save()
+        for node in unique_nodes:
+            for tag_key, tag_values in rate_dict.items():
+                for value_name, rate_value in tag_values.items():
+                    item_check = OCPUsageLineItemDailySummary.objects.filter(
+                        usage_start__gte=start_date,
+                        usage_end__lte=end_date,
+                        report_period=report_period,
+                        cluster_id=cluster_id,
+                        cluster_alias=cluster_alias,
+                        node=node,
+                        pod_labels__contains={tag_key: value_name},
+                    ).first()
+                    if item_check:
+                        line_item = OCPUsageLineItemDailySummary.objects.filter(node=node, **monthly_filter).first()
+                        if not line_item:
+                            line_item = OCPUsageLineItemDailySummary(uuid=uuid.uuid4(), node=node, **monthly_filter)
+                        line_item.infrastructure_monthly_cost = (
+                            Coalesce(line_item.infrastructure_monthly_cost, Value(0.0), output_field=DecimalField())
+                            + rate_value
+                        )
+                        line_item.save()
+
+
+def set_based_node_cost(accessor, start_date, end_date, cluster_id, cluster_alias, rate_dict):
+    """Populate node flat and tag rate monthly costs with the current accessor."""
+    accessor.upsert_monthly_node_cost_line_item(
+        start_date, end_date, cluster_id, cluster_alias, INFRASTRUCTURE, NODE_RATE
+    )
+    accessor.tag_upsert_monthly_node_cost_line_item(
+        start_date, end_date, cluster_id, cluster_alias, INFRASTRUCTURE, rate_dict
+    )
+
+
+def run(schema, cluster_id, cluster_alias, for_date):
+    """Time both implementations for the month containing for_date."""
+    start_date, end_date = month_date_range_tuple(for_date)
+    with OCPReportDBAccessor(schema) as accessor:
+        rate_dict = get_tag_rates(accessor, start_date, end_date, cluster_id)
+        nodes = len(accessor.get_distinct_nodes(start_date, end_date, cluster_id))
+        rates = sum(len(values) for values in rate_dict.values())
+        print(f"{nodes} nodes, {rates} tag rates")
+        for name, populate in (("per node loop", legacy_node_cost), ("set based", set_based_node_cost)):
+            accessor.remove_monthly_cost(start_date, end_date, cluster_id, "Node")
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                populate(accessor, start_date, end_date, cluster_id, cluster_alias, rate_dict)
+                elapsed = time.perf_counter() - start
+            print(f"{name:>14}: {len(queries)} round trips in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    month = DateHelper().this_month_start
+    if len(sys.argv) > 4:
+        month = DateHelper().month_start(parse(sys.argv[4]))
+    run(sys.argv[1], sys.argv[2], sys.argv[3], month)
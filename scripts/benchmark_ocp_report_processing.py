@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark OCP pod usage report processing, row by row versus columnar.
+
+Generates a synthetic pod usage CSV and processes it once with the
+csv.DictReader row loop and once with the pandas columnar path
+(OCP_COLUMNAR_PROCESSING). Each run happens in a fresh subprocess so the
+reported peak RSS belongs to that mode alone.
+
+Must be run from the koku directory with the Django environment configured
+(DATABASE_*, DJANGO_SETTINGS_MODULE=koku.settings) and an existing tenant
+schema and OCP provider:
+
+    ./scripts/benchmark_ocp_report_processing.py <schema> <provider_uuid> [rows]
+"""
+import csv
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+NAMESPACES = 50
+PODS_PER_NAMESPACE = 40
+NODES = 25
+HEADER = [
+    "report_period_start",
+    "report_period_end",
+    "pod",
+    "namespace",
+    "node",
+    "resource_id",
+    "interval_start",
+    "interval_end",
+    "pod_usage_cpu_core_seconds",
+    "pod_request_cpu_core_seconds",
+    "pod_limit_cpu_core_seconds",
+    "pod_usage_memory_byte_seconds",
+    "pod_request_memory_byte_seconds",
+    "pod_limit_memory_byte_seconds",
+    "node_capacity_cpu_cores",
+    "node_capacity_cpu_core_seconds",
+    "node_capacity_memory_bytes",
+    "node_capacity_memory_byte_seconds",
+    "pod_labels",
+]
+
+
+def generate_report(file_path, rows):
+    """Write a pod usage report with `rows` hourly line items."""
+    pods = NAMESPACES * PODS_PER_NAMESPACE
+    with open(file_path, "w") as report:
+        writer = csv.writer(report)
+        writer.writerow(HEADER)
+        for i in range(rows):
+            pod = i % pods
+            hour = (i // pods) % (30 * 24)
+            day, hour = divmod(hour, 24)
+            interval_start = f"2020-06-{day + 1:02d} {hour:02d}:00:00 +0000 UTC"
+            interval_end = f"2020-06-{day + 1:02d} {hour:02d}:59:59 +0000 UTC"
+            writer.writerow(
+                [
+                    "2020-06-01 00:00:00 +0000 UTC",
+                    "2020-07-01 00:00:00 +0000 UTC",
+                    f"pod_{pod}",
+                    f"namespace_{pod % NAMESPACES}",
+                    f"node_{pod % NODES}",
+                    f"i-{pod % NODES:08d}",
+                    interval_start,
+                    interval_end,
+                    "1.5",
+                    "2",
+                    "4",
+                    "1073741824",
+                    "2147483648",
+                    "4294967296",
+                    "16",
+                    "57600",
+                    "68719476736",
+                    "247390116249600",
+                    f"label_app:app_{pod % 10}|label_env:env_{pod % 3}",
+                ]
+            )
+
+
+def process(schema, provider_uuid, file_path, columnar):
+    """Process one report in this process and print rows/sec and peak RSS."""
+    import django
+
+    django.setup()
+
+    from masu.config import Config
+    from masu.external import UNCOMPRESSED
+    from masu.processor.ocp.ocp_report_processor import OCPReportProcessor
+
+    Config.OCP_COLUMNAR_PROCESSING = columnar
+    with open(file_path) as report:
+        rows = sum(1 for _ in report) - 1
+
+    processor = OCPReportProcessor(
+        schema_name=schema, report_path=file_path, compression=UNCOMPRESSED, provider_uuid=provider_uuid
+    )
+    start = time.perf_counter()
+    processor.process()
+    elapsed = time.perf_counter() - start
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    mode = "columnar" if columnar else "row"
+    print(f"{mode:>8}: {rows} rows in {elapsed:.1f}s, {rows / elapsed:,.0f} rows/sec, peak RSS {peak_rss_mb:,.0f} MB")
+
+
+def run(schema, provider_uuid, rows):
+    """Generate the report and process a copy of it in each mode."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(temp_dir, "source.csv")
+        generate_report(source, rows)
+        for mode in ("row", "columnar"):
+            report_path = os.path.join(temp_dir, f"{mode}.csv")
+            shutil.copy2(source, report_path)
+            subprocess.run(
+                [sys.executable, __file__, "--process", mode, schema, provider_uuid, report_path], check=True
+            )
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    if sys.argv[1] == "--process":
+        process(sys.argv[3], sys.argv[4], sys.argv[5], sys.argv[2] == "columnar")
+    else:
+        run(sys.argv[1], sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else 5000000)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark view cache invalidation for one tenant in a crowded Redis.
+
+Loads a Redis database with unrelated keys plus one tenant's cached views,
+then times the `KEYS *` scan that invalidation used to run against the
+per-tenant view index lookup used by koku.cache.KokuRedisCache.
+
+Usage:
+    REDIS_HOST=localhost REDIS_PORT=6379 ./benchmark_view_cache_invalidation.py [unrelated_keys] [tenant_keys]
+
+The selected database (REDIS_DB, default 15) is flushed before and after the run.
+"""
+import os
+import sys
+import time
+
+from redis import Redis
+
+REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", "6379"))
+REDIS_DB = int(os.environ.get("REDIS_DB", "15"))
+
+SCHEMA_NAME = "acct10001"
+CACHE_KEY_PREFIX = "aws-view"
+INDEX_KEY = f"{SCHEMA_NAME}:view-cache-index:{CACHE_KEY_PREFIX}"
+BATCH_SIZE = 10000
+
+
+def tenant_key(index):
+    """Return a cache_page style key for the benchmark tenant."""
+    return f"{SCHEMA_NAME}:1:views.decorators.cache.cache_page.{CACHE_KEY_PREFIX}.GET.{index:032x}.en-us.UTC"
+
+
+def populate(client, unrelated_keys, tenant_keys):
+    """Write the unrelated keys, the tenant keys, and the tenant view index."""
+    pipeline = client.pipeline(transaction=False)
+    for i in range(unrelated_keys):
+        pipeline.set(f"acct{i % 5000}:1:views.decorators.cache.cache_page.ocp-view.GET.{i:032x}", "value")
+        if i % BATCH_SIZE == 0:
+            pipeline.execute()
+    for i in range(tenant_keys):
+        key = tenant_key(i)
+        pipeline.set(key, "value")
+        pipeline.sadd(INDEX_KEY, key)
+    pipeline.execute()
+
+
+def invalidate_with_keys_scan(client):
+    """Invalidate the tenant the way koku did before the view index existed."""
+    all_keys = [key.decode("utf-8") for key in client.keys("*")]
+    keys_to_invalidate = [key for key in all_keys if SCHEMA_NAME in key and CACHE_KEY_PREFIX in key]
+    for key in keys_to_invalidate:
+        client.delete(key)
+    return len(keys_to_invalidate)
+
+
+def invalidate_with_index(client):
+    """Invalidate the tenant using the per-tenant view index."""
+    keys_to_invalidate = client.smembers(INDEX_KEY)
+    client.delete(INDEX_KEY, *keys_to_invalidate)
+    return len(keys_to_invalidate)
+
+
+def run(unrelated_keys, tenant_keys):
+    """Run both invalidation strategies against the same data set."""
+    client = Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB)
+    client.flushdb()
+    try:
+        for name, invalidate in (("KEYS * scan", invalidate_with_keys_scan), ("tenant index", invalidate_with_index)):
+            populate(client, unrelated_keys, tenant_keys)
+            start = time.perf_counter()
+            deleted = invalidate(client)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>14}: deleted {deleted} keys among {client.dbsize()} remaining in {elapsed:.4f}s")
+            client.flushdb()
+    finally:
+        client.flushdb()
+
+
+if __name__ == "__main__":
+    unrelated = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    tenant = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    run(unrelated, tenant)